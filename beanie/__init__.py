@@ -14,6 +14,12 @@ from beanie.odm.actions import (
     before_event,
 )
 from beanie.odm.bulk import BulkWriter
+from beanie.odm.cache import (
+    CacheBackend,
+    LRUCache,
+    RedisCache,
+    SharedMemoryCache,
+)
 from beanie.odm.custom_types import DecimalAnnotation
 from beanie.odm.custom_types.bson.binary import BsonBinary
 from beanie.odm.documents import (
@@ -21,16 +27,23 @@ from beanie.odm.documents import (
     DocumentWithSoftDelete,
     MergeStrategy,
 )
-from beanie.odm.enums import SortDirection
+from beanie.odm.enums import (
+    FetchLinksStrategy,
+    SortDirection,
+    StateManagementMode,
+    UpsertStatus,
+)
 from beanie.odm.fields import (
     BackLink,
     BeanieObjectId,
     DeleteRules,
     Indexed,
     Link,
+    Param,
     PydanticObjectId,
     WriteRules,
 )
+from beanie.odm.loader import LinkLoader
 from beanie.odm.queries.update import UpdateResponse
 from beanie.odm.settings.timeseries import Granularity, TimeSeriesConfig
 from beanie.odm.union_doc import UnionDoc
@@ -55,6 +68,10 @@ __all__ = [
     "TimeSeriesConfig",
     "Granularity",
     "SortDirection",
+    "FetchLinksStrategy",
+    "Param",
+    "StateManagementMode",
+    "UpsertStatus",
     "MergeStrategy",
     "ActionConflictResolution",
     "MergeConflictError",
@@ -72,6 +89,11 @@ __all__ = [
     "Update",
     # Bulk Write
     "BulkWriter",
+    # Cache
+    "CacheBackend",
+    "LRUCache",
+    "RedisCache",
+    "SharedMemoryCache",
     # Migrations
     "iterative_migration",
     "free_fall_migration",
@@ -80,6 +102,7 @@ __all__ = [
     "BackLink",
     "WriteRules",
     "DeleteRules",
+    "LinkLoader",
     # Custom Types
     "DecimalAnnotation",
     "BsonBinary",
@@ -1,6 +1,6 @@
 import asyncio
 import inspect
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from enum import Enum
 from functools import wraps
 from typing import (
@@ -136,6 +136,34 @@ class ActionRegistry:
                 action(instance)
         await asyncio.gather(*coros)
 
+    @classmethod
+    async def run_actions_all(
+        cls,
+        instances: Sequence["Document"],
+        event_type: EventTypes,
+        action_direction: ActionDirections,
+        exclude: list[ActionDirections | str],
+    ):
+        """
+        Run actions for many documents
+        :param instances: Sequence[Document] - objects of the Document subclasses
+        :param event_type: EventTypes - event types
+        :param action_direction: ActionDirections - before or after
+        """
+        if action_direction in exclude:
+            return
+        await asyncio.gather(
+            *(
+                cls.run_actions(
+                    instance,
+                    event_type=event_type,
+                    action_direction=action_direction,
+                    exclude=exclude,
+                )
+                for instance in instances
+            )
+        )
+
 
 # `Any` because there is arbitrary attribute assignment on this type
 F = TypeVar("F", bound=Any)
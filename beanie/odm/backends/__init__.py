@@ -0,0 +1,17 @@
+from beanie.odm.backends.base import BackendRegistry
+from beanie.odm.backends.memory import (
+    MemoryClient,
+    MemoryCollection,
+    MemoryDatabase,
+)
+
+BackendRegistry.register(
+    "memory", lambda: MemoryClient().get_default_database()
+)
+
+__all__ = [
+    "BackendRegistry",
+    "MemoryClient",
+    "MemoryCollection",
+    "MemoryDatabase",
+]
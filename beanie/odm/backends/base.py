@@ -0,0 +1,38 @@
+from collections.abc import Callable
+from typing import Any
+
+
+class BackendRegistry:
+    """
+    Named storage backends, which can be selected with
+    `init_beanie(backend=...)` instead of a pymongo database
+    """
+
+    _registry: dict[str, Callable[[], Any]] = {}
+
+    @classmethod
+    def register(cls, name: str, factory: Callable[[], Any]):
+        """
+        Register the backend
+
+        :param name: str - backend name
+        :param factory: Callable[[], Any] - callable, which returns
+            a new database object with the pymongo async database interface
+        :return: None
+        """
+        cls._registry[name] = factory
+
+    @classmethod
+    def get_database(cls, name: str) -> Any:
+        """
+        Create the database of the backend
+
+        :param name: str - backend name
+        :return: Any - database object
+        """
+        if name not in cls._registry:
+            raise ValueError(
+                f"Unknown backend {name}. "
+                f"Registered backends: {', '.join(sorted(cls._registry))}"
+            )
+        return cls._registry[name]()
@@ -0,0 +1,12 @@
+from beanie.odm.backends.memory.collection import (
+    MemoryCollection,
+    MemoryCursor,
+)
+from beanie.odm.backends.memory.database import MemoryClient, MemoryDatabase
+
+__all__ = [
+    "MemoryClient",
+    "MemoryCollection",
+    "MemoryCursor",
+    "MemoryDatabase",
+]
@@ -0,0 +1,752 @@
+import random
+from collections.abc import Callable, Iterable, Mapping
+from copy import deepcopy
+from decimal import Decimal
+from functools import cmp_to_key
+from typing import TYPE_CHECKING, Any
+
+from bson import DBRef, Decimal128
+
+from beanie.exceptions import NotSupported
+from beanie.odm.utils.bson_order import (
+    compare_values,
+    is_number,
+    to_decimal,
+    values_equal,
+)
+from beanie.odm.utils.matcher import compile_filter
+
+if TYPE_CHECKING:
+    from beanie.odm.backends.memory.database import MemoryDatabase
+
+Document = dict[str, Any]
+
+MISSING: Any = type("Missing", (), {"__repr__": lambda self: "MISSING"})()
+
+
+def get_field(value: Any, path: str) -> Any:
+    """
+    Value by the dotted path, like the aggregation field paths resolve it.
+    Arrays on the path are mapped, MISSING is returned for absent fields
+
+    :param value: Any - document or sub-document
+    :param path: str - dotted path
+    :return: Any
+    """
+    return _get_field(value, path.split("."))
+
+
+def _get_field(value: Any, parts: list[str]) -> Any:
+    for index, part in enumerate(parts):
+        if isinstance(value, DBRef):
+            value = value.as_doc()
+        if isinstance(value, Mapping):
+            if part not in value:
+                return MISSING
+            value = value[part]
+        elif isinstance(value, list):
+            results = []
+            for item in value:
+                if isinstance(item, (Mapping, list, DBRef)):
+                    result = _get_field(item, parts[index:])
+                    if result is not MISSING:
+                        results.append(result)
+            return results
+        else:
+            return MISSING
+    return value
+
+
+def set_field(document: Document, path: str, value: Any) -> None:
+    """
+    Set the value by the dotted path, creating the sub-documents
+
+    :param document: Dict[str, Any] - document to change
+    :param path: str - dotted path
+    :param value: Any - new value
+    :return: None
+    """
+    parts = path.split(".")
+    current = document
+    for part in parts[:-1]:
+        child = current.get(part)
+        if not isinstance(child, dict):
+            child = current[part] = {}
+        current = child
+    if value is MISSING:
+        current.pop(parts[-1], None)
+    else:
+        current[parts[-1]] = value
+
+
+def remove_field(document: Any, parts: list[str]) -> None:
+    """
+    Remove the field by the path parts. Arrays on the path are mapped
+
+    :param document: Any - document to change
+    :param parts: List[str] - path parts
+    :return: None
+    """
+    if isinstance(document, list):
+        for item in document:
+            remove_field(item, parts)
+    elif isinstance(document, dict):
+        if len(parts) == 1:
+            document.pop(parts[0], None)
+        elif parts[0] in document:
+            remove_field(document[parts[0]], parts[1:])
+
+
+def _is_true(value: Any) -> bool:
+    if value is MISSING or value is None or value is False:
+        return False
+    if is_number(value):
+        return to_decimal(value) != 0
+    return True
+
+
+def _number(value: Any, operator: str) -> Any:
+    if not is_number(value):
+        raise NotSupported(f"{operator} needs numbers, got {value!r}")
+    return value
+
+
+def _calculate(values: list[Any], operation: Callable[[Any, Any], Any]):
+    result = values[0]
+    for value in values[1:]:
+        if isinstance(result, (Decimal, Decimal128)) or isinstance(
+            value, (Decimal, Decimal128)
+        ):
+            result = Decimal128(
+                operation(to_decimal(result), to_decimal(value))
+            )
+        else:
+            result = operation(result, value)
+    return result
+
+
+def _accumulate_sum(values: Iterable[Any]) -> Any:
+    numbers = [value for value in values if is_number(value)]
+    if not numbers:
+        return 0
+    return _calculate(numbers, lambda left, right: left + right)
+
+
+def _accumulate_avg(values: Iterable[Any]) -> Any:
+    numbers = [value for value in values if is_number(value)]
+    if not numbers:
+        return None
+    total = _accumulate_sum(numbers)
+    if isinstance(total, Decimal128):
+        return Decimal128(total.to_decimal() / len(numbers))
+    return total / len(numbers)
+
+
+def _accumulate_extreme(values: Iterable[Any], sign: int) -> Any:
+    result = None
+    for value in values:
+        if value is None or value is MISSING:
+            continue
+        if result is None or compare_values(value, result) * sign > 0:
+            result = value
+    return result
+
+
+def _array(value: Any, operator: str) -> list[Any]:
+    if not isinstance(value, list):
+        raise NotSupported(f"{operator} needs an array, got {value!r}")
+    return value
+
+
+class ExpressionEvaluator:
+    """
+    Evaluates the aggregation expressions against a document
+    """
+
+    def __init__(self, root: Any, variables: Mapping[str, Any] | None = None):
+        self.root = root
+        self.variables = {"ROOT": root, "CURRENT": root, **(variables or {})}
+
+    def evaluate(self, expression: Any) -> Any:
+        if isinstance(expression, str) and expression.startswith("$"):
+            if expression.startswith("$$"):
+                name, _, path = expression[2:].partition(".")
+                if name == "REMOVE":
+                    return MISSING
+                if name not in self.variables:
+                    raise NotSupported(f"Unknown variable {name}")
+                value = self.variables[name]
+                return get_field(value, path) if path else value
+            return get_field(self.root, expression[1:])
+        if isinstance(expression, list):
+            return [self._value(self.evaluate(item)) for item in expression]
+        if isinstance(expression, Mapping):
+            if len(expression) == 1:
+                operator, argument = next(iter(expression.items()))
+                if isinstance(operator, str) and operator.startswith("$"):
+                    return self._evaluate_operator(operator, argument)
+            result = {}
+            for key, value in expression.items():
+                value = self.evaluate(value)
+                if value is not MISSING:
+                    result[key] = value
+            return result
+        return expression
+
+    @staticmethod
+    def _value(value: Any) -> Any:
+        return None if value is MISSING else value
+
+    def _arguments(self, argument: Any) -> list[Any]:
+        if not isinstance(argument, list):
+            argument = [argument]
+        return [self._value(self.evaluate(item)) for item in argument]
+
+    def _evaluate_operator(self, operator: str, argument: Any) -> Any:
+        if operator == "$literal":
+            return argument
+        if operator == "$cond":
+            if isinstance(argument, Mapping):
+                condition = argument["if"]
+                then, otherwise = argument["then"], argument["else"]
+            else:
+                condition, then, otherwise = argument
+            if _is_true(self.evaluate(condition)):
+                return self.evaluate(then)
+            return self.evaluate(otherwise)
+        if operator == "$ifNull":
+            for item in argument[:-1]:
+                value = self.evaluate(item)
+                if value is not MISSING and value is not None:
+                    return value
+            return self.evaluate(argument[-1])
+        if operator == "$and":
+            return all(_is_true(self.evaluate(item)) for item in argument)
+        if operator == "$or":
+            return any(_is_true(self.evaluate(item)) for item in argument)
+        if operator in ("$filter", "$map"):
+            return self._evaluate_iteration(operator, argument)
+        handler = _OPERATORS.get(operator)
+        if handler is None:
+            raise NotSupported(f"{operator} is not supported")
+        return handler(self._arguments(argument))
+
+    def _evaluate_iteration(self, operator: str, argument: Any) -> Any:
+        values = self._value(self.evaluate(argument["input"]))
+        if values is None:
+            return None
+        name = argument.get("as", "this")
+        results = []
+        for item in _array(values, operator):
+            evaluator = ExpressionEvaluator(
+                self.root, {**self.variables, name: item}
+            )
+            if operator == "$map":
+                results.append(self._value(evaluator.evaluate(argument["in"])))
+            elif _is_true(evaluator.evaluate(argument["cond"])):
+                results.append(item)
+        return results
+
+
+def _compare(check: Callable[[int], bool]) -> Callable[[list[Any]], bool]:
+    return lambda arguments: check(compare_values(arguments[0], arguments[1]))
+
+
+def _array_elem_at(arguments: list[Any]) -> Any:
+    array, index = arguments
+    if array is None:
+        return None
+    array = _array(array, "$arrayElemAt")
+    if -len(array) <= index < len(array):
+        return array[index]
+    return MISSING
+
+
+def _divide(arguments: list[Any]) -> Any:
+    left, right = (_number(value, "$divide") for value in arguments)
+    if isinstance(left, (Decimal, Decimal128)) or isinstance(
+        right, (Decimal, Decimal128)
+    ):
+        return Decimal128(to_decimal(left) / to_decimal(right))
+    return left / right
+
+
+def _size(arguments: list[Any]) -> int:
+    return len(_array(arguments[0], "$size"))
+
+
+def _group_operator(
+    accumulate: Callable[[Iterable[Any]], Any],
+) -> Callable[[list[Any]], Any]:
+    def evaluate(arguments: list[Any]) -> Any:
+        # a single array argument is accumulated itself
+        if len(arguments) == 1 and isinstance(arguments[0], list):
+            return accumulate(arguments[0])
+        return accumulate(arguments)
+
+    return evaluate
+
+
+_OPERATORS: dict[str, Callable[[list[Any]], Any]] = {
+    "$eq": lambda arguments: values_equal(arguments[0], arguments[1]),
+    "$ne": lambda arguments: not values_equal(arguments[0], arguments[1]),
+    "$gt": _compare(lambda result: result > 0),
+    "$gte": _compare(lambda result: result >= 0),
+    "$lt": _compare(lambda result: result < 0),
+    "$lte": _compare(lambda result: result <= 0),
+    "$cmp": lambda arguments: compare_values(arguments[0], arguments[1]),
+    "$not": lambda arguments: not _is_true(arguments[0]),
+    "$in": lambda arguments: any(
+        values_equal(arguments[0], item)
+        for item in _array(arguments[1], "$in")
+    ),
+    "$add": lambda arguments: _calculate(
+        [_number(value, "$add") for value in arguments],
+        lambda left, right: left + right,
+    ),
+    "$subtract": lambda arguments: _calculate(
+        [_number(value, "$subtract") for value in arguments],
+        lambda left, right: left - right,
+    ),
+    "$multiply": lambda arguments: _calculate(
+        [_number(value, "$multiply") for value in arguments],
+        lambda left, right: left * right,
+    ),
+    "$divide": _divide,
+    "$size": _size,
+    "$arrayElemAt": _array_elem_at,
+    "$first": lambda arguments: _array_elem_at([arguments[0], 0]),
+    "$last": lambda arguments: _array_elem_at([arguments[0], -1]),
+    "$concat": lambda arguments: None
+    if any(value is None for value in arguments)
+    else "".join(arguments),
+    "$concatArrays": lambda arguments: None
+    if any(value is None for value in arguments)
+    else [item for value in arguments for item in value],
+    "$toLower": lambda arguments: (arguments[0] or "").lower(),
+    "$toUpper": lambda arguments: (arguments[0] or "").upper(),
+    "$isArray": lambda arguments: isinstance(arguments[0], list),
+    "$sum": _group_operator(_accumulate_sum),
+    "$avg": _group_operator(_accumulate_avg),
+    "$min": _group_operator(lambda values: _accumulate_extreme(values, -1)),
+    "$max": _group_operator(lambda values: _accumulate_extreme(values, 1)),
+}
+
+
+def evaluate(
+    expression: Any,
+    document: Any,
+    variables: Mapping[str, Any] | None = None,
+) -> Any:
+    """
+    Evaluate the aggregation expression against the document
+
+    :param expression: Any - aggregation expression
+    :param document: Any - document
+    :param variables: Optional[Mapping[str, Any]] - `let` variables
+    :return: Any - the value or MISSING
+    """
+    return ExpressionEvaluator(document, variables).evaluate(expression)
+
+
+def compile_match(
+    query: Mapping[str, Any], variables: Mapping[str, Any] | None = None
+) -> Callable[[Any], bool]:
+    """
+    Compile the $match query. `$expr` is evaluated as an expression
+
+    :param query: Mapping[str, Any] - match query
+    :param variables: Optional[Mapping[str, Any]] - `let` variables
+    :return: Callable[[Any], bool]
+    """
+    query = dict(query)
+    expression = query.pop("$expr", MISSING)
+    predicate = compile_filter(query)
+    if expression is MISSING:
+        return predicate
+    return lambda document: predicate(document) and _is_true(
+        evaluate(expression, document, variables)
+    )
+
+
+def _get_sort_value(document: Any, path: str, direction: int) -> Any:
+    value = get_field(document, path)
+    if value is MISSING:
+        return None
+    if isinstance(value, list):
+        # arrays are sorted by their min or max element
+        # empty arrays and arrays of nulls are sorted as nulls
+        return _accumulate_extreme(value, -direction)
+    return value
+
+
+def sort_documents(
+    documents: list[Any], sort: Iterable[tuple[str, int]]
+) -> list[Any]:
+    """
+    Sort the documents by the sort specification
+
+    :param documents: List - documents
+    :param sort: Iterable[Tuple[str, int]] - fields and directions
+    :return: List - sorted documents
+    """
+    sort = [(path, 1 if direction == 1 else -1) for path, direction in sort]
+
+    def compare(left: Any, right: Any) -> int:
+        for path, direction in sort:
+            result = compare_values(
+                _get_sort_value(left, path, direction),
+                _get_sort_value(right, path, direction),
+            )
+            if result:
+                return result * direction
+        return 0
+
+    return sorted(documents, key=cmp_to_key(compare))
+
+
+def _include(source: Any, parts: list[str]) -> Any:
+    if isinstance(source, list):
+        return [
+            item
+            for item in (
+                _include(element, parts)
+                for element in source
+                if isinstance(element, (dict, list))
+            )
+            if item is not MISSING
+        ]
+    if not isinstance(source, dict) or parts[0] not in source:
+        return MISSING
+    if len(parts) == 1:
+        return {parts[0]: deepcopy(source[parts[0]])}
+    value = _include(source[parts[0]], parts[1:])
+    if value is MISSING:
+        return MISSING
+    return {parts[0]: value}
+
+
+def _merge(target: dict[str, Any], source: dict[str, Any]) -> None:
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        elif (
+            isinstance(value, list)
+            and isinstance(target.get(key), list)
+            and len(value) == len(target[key])
+        ):
+            for target_item, item in zip(target[key], value, strict=True):
+                if isinstance(item, dict) and isinstance(target_item, dict):
+                    _merge(target_item, item)
+        else:
+            target[key] = value
+
+
+def project(
+    document: Document,
+    projection: Mapping[str, Any],
+    variables: Mapping[str, Any] | None = None,
+) -> Document:
+    """
+    Apply the $project stage or the find projection to the document
+
+    :param document: Dict[str, Any] - document
+    :param projection: Mapping[str, Any] - projection
+    :param variables: Optional[Mapping[str, Any]] - `let` variables
+    :return: Dict[str, Any] - new document
+    """
+    exclusion = [
+        path
+        for path, value in projection.items()
+        if path != "_id"
+        and value in (0, False)
+        and not isinstance(value, dict)
+    ]
+    if exclusion:
+        excluded = deepcopy(document)
+        for path in exclusion:
+            remove_field(excluded, path.split("."))
+        if projection.get("_id", 1) in (0, False):
+            excluded.pop("_id", None)
+        return excluded
+    result: Document = {}
+    if projection.get("_id", 1) not in (0, False) and "_id" in document:
+        if projection.get("_id", 1) in (1, True):
+            result["_id"] = deepcopy(document["_id"])
+    for path, value in projection.items():
+        if path == "_id" and value in (0, 1, True, False):
+            continue
+        if value in (1, True) and not isinstance(value, dict):
+            included = _include(document, path.split("."))
+            if included is not MISSING:
+                _merge(result, included)
+        else:
+            set_field(result, path, evaluate(value, document, variables))
+    return result
+
+
+def _unwind(documents: list[Document], argument: Any) -> list[Document]:
+    if isinstance(argument, str):
+        argument = {"path": argument}
+    path = argument["path"][1:]
+    preserve = argument.get("preserveNullAndEmptyArrays", False)
+    index_field = argument.get("includeArrayIndex")
+    results = []
+    for document in documents:
+        value = get_field(document, path)
+        if isinstance(value, list) and value:
+            for index, item in enumerate(value):
+                unwound = deepcopy(document)
+                set_field(unwound, path, deepcopy(item))
+                if index_field:
+                    unwound[index_field] = index
+                results.append(unwound)
+        elif isinstance(value, list) or value is MISSING or value is None:
+            if preserve:
+                unwound = deepcopy(document)
+                if isinstance(value, list):
+                    set_field(unwound, path, MISSING)
+                if index_field:
+                    unwound[index_field] = None
+                results.append(unwound)
+        else:
+            unwound = deepcopy(document)
+            if index_field:
+                unwound[index_field] = None
+            results.append(unwound)
+    return results
+
+
+_ACCUMULATORS: dict[str, Callable[[list[Any]], Any]] = {
+    "$sum": _accumulate_sum,
+    "$avg": _accumulate_avg,
+    "$min": lambda values: _accumulate_extreme(values, -1),
+    "$max": lambda values: _accumulate_extreme(values, 1),
+    "$push": lambda values: [
+        value for value in values if value is not MISSING
+    ],
+    "$addToSet": lambda values: _unique(
+        value for value in values if value is not MISSING
+    ),
+    "$first": lambda values: None if not values else values[0],
+    "$last": lambda values: None if not values else values[-1],
+}
+
+
+def _unique(values: Iterable[Any]) -> list[Any]:
+    result: list[Any] = []
+    for value in values:
+        if not any(values_equal(value, existing) for existing in result):
+            result.append(value)
+    return result
+
+
+def _group(
+    documents: list[Document], argument: Mapping[str, Any]
+) -> list[Document]:
+    groups: list[tuple[Any, list[Document]]] = []
+    for document in documents:
+        key = evaluate(argument["_id"], document)
+        key = None if key is MISSING else key
+        for group_key, group_documents in groups:
+            if values_equal(group_key, key):
+                group_documents.append(document)
+                break
+        else:
+            groups.append((key, [document]))
+    results = []
+    for key, group_documents in groups:
+        result = {"_id": key}
+        for field, accumulator in argument.items():
+            if field == "_id":
+                continue
+            operator, expression = next(iter(accumulator.items()))
+            if operator == "$count":
+                result[field] = len(group_documents)
+                continue
+            if operator not in _ACCUMULATORS:
+                raise NotSupported(f"{operator} accumulator is not supported")
+            values = [
+                evaluate(expression, document) for document in group_documents
+            ]
+            if operator in ("$first", "$last"):
+                values = [
+                    None if value is MISSING else value for value in values
+                ]
+            result[field] = _ACCUMULATORS[operator](values)
+        results.append(result)
+    return results
+
+
+def _get_lookup_values(document: Any, path: str) -> list[Any]:
+    value = get_field(document, path)
+    if value is MISSING:
+        return [None]
+    if not isinstance(value, list):
+        return [value]
+    values = []
+    for item in value:
+        values.extend(item if isinstance(item, list) else [item])
+    return values or [None]
+
+
+class Pipeline:
+    """
+    Aggregation pipeline of the in-memory backend
+    """
+
+    def __init__(
+        self,
+        database: "MemoryDatabase",
+        pipeline: list[Mapping[str, Any]],
+        variables: Mapping[str, Any] | None = None,
+    ):
+        """
+        :param database: MemoryDatabase - database to look up the documents
+        :param pipeline: List[Mapping[str, Any]] - aggregation stages
+        :param variables: Optional[Mapping[str, Any]] - `let` variables
+        """
+        self.database = database
+        self.pipeline = pipeline
+        self.variables = variables or {}
+
+    def run(self, documents: list[Document]) -> list[Document]:
+        for stage in self.pipeline:
+            if len(stage) != 1:
+                raise NotSupported(f"Wrong stage: {stage}")
+            name, argument = next(iter(stage.items()))
+            handler = getattr(self, f"_stage_{name[1:]}", None)
+            if handler is None:
+                raise NotSupported(f"{name} stage is not supported")
+            documents = handler(documents, argument)
+        return documents
+
+    def _stage_match(
+        self, documents: list[Document], argument: Any
+    ) -> list[Document]:
+        predicate = compile_match(argument, self.variables)
+        return [document for document in documents if predicate(document)]
+
+    def _stage_project(
+        self, documents: list[Document], argument: Any
+    ) -> list[Document]:
+        return [
+            project(document, argument, self.variables)
+            for document in documents
+        ]
+
+    def _stage_addFields(
+        self, documents: list[Document], argument: Any
+    ) -> list[Document]:
+        results = []
+        for document in documents:
+            result = deepcopy(document)
+            for path, expression in argument.items():
+                set_field(
+                    result,
+                    path,
+                    deepcopy(evaluate(expression, document, self.variables)),
+                )
+            results.append(result)
+        return results
+
+    _stage_set = _stage_addFields
+
+    def _stage_unset(
+        self, documents: list[Document], argument: Any
+    ) -> list[Document]:
+        if isinstance(argument, str):
+            argument = [argument]
+        return self._stage_project(documents, {path: 0 for path in argument})
+
+    def _stage_replaceRoot(
+        self, documents: list[Document], argument: Any
+    ) -> list[Document]:
+        return self._stage_replaceWith(documents, argument["newRoot"])
+
+    def _stage_replaceWith(
+        self, documents: list[Document], argument: Any
+    ) -> list[Document]:
+        results = []
+        for document in documents:
+            root = evaluate(argument, document, self.variables)
+            if not isinstance(root, dict):
+                raise NotSupported(f"New root must be a document: {root!r}")
+            results.append(deepcopy(root))
+        return results
+
+    def _stage_sort(
+        self, documents: list[Document], argument: Any
+    ) -> list[Document]:
+        return sort_documents(documents, argument.items())
+
+    def _stage_skip(
+        self, documents: list[Document], argument: Any
+    ) -> list[Document]:
+        return documents[argument:]
+
+    def _stage_limit(
+        self, documents: list[Document], argument: Any
+    ) -> list[Document]:
+        return documents[:argument]
+
+    def _stage_sample(
+        self, documents: list[Document], argument: Any
+    ) -> list[Document]:
+        return random.sample(documents, min(argument["size"], len(documents)))
+
+    def _stage_count(
+        self, documents: list[Document], argument: Any
+    ) -> list[Document]:
+        return [{argument: len(documents)}] if documents else []
+
+    def _stage_unwind(
+        self, documents: list[Document], argument: Any
+    ) -> list[Document]:
+        return _unwind(documents, argument)
+
+    def _stage_group(
+        self, documents: list[Document], argument: Any
+    ) -> list[Document]:
+        return _group(documents, argument)
+
+    def _stage_lookup(
+        self, documents: list[Document], argument: Any
+    ) -> list[Document]:
+        foreign_documents = self.database[argument["from"]].get_documents()
+        local_field = argument.get("localField")
+        foreign_field = argument.get("foreignField")
+        foreign_values = []
+        if local_field is not None:
+            foreign_values = [
+                _get_lookup_values(foreign_document, foreign_field)
+                for foreign_document in foreign_documents
+            ]
+        results = []
+        for document in documents:
+            matched = foreign_documents
+            if local_field is not None:
+                local_values = _get_lookup_values(document, local_field)
+                matched = [
+                    foreign_document
+                    for foreign_document, values in zip(
+                        foreign_documents, foreign_values, strict=True
+                    )
+                    if any(
+                        values_equal(local_value, value)
+                        for local_value in local_values
+                        for value in values
+                    )
+                ]
+            if "pipeline" in argument:
+                variables = {
+                    name: evaluate(expression, document, self.variables)
+                    for name, expression in argument.get("let", {}).items()
+                }
+                matched = Pipeline(
+                    self.database, argument["pipeline"], variables
+                ).run(matched)
+            result = deepcopy(document)
+            set_field(result, argument["as"], deepcopy(matched))
+            results.append(result)
+        return results
@@ -0,0 +1,1104 @@
+from collections.abc import Iterable, Mapping
+from copy import deepcopy
+from decimal import Decimal
+from functools import cmp_to_key
+from itertools import product
+from typing import TYPE_CHECKING, Any, cast
+
+import bson
+from bson import ObjectId
+from bson.binary import UuidRepresentation
+from bson.codec_options import DEFAULT_CODEC_OPTIONS, CodecOptions
+from bson.raw_bson import RawBSONDocument
+from pymongo import (
+    DeleteMany,
+    DeleteOne,
+    IndexModel,
+    InsertOne,
+    ReplaceOne,
+    ReturnDocument,
+    UpdateMany,
+    UpdateOne,
+)
+from pymongo.errors import (
+    BulkWriteError,
+    DuplicateKeyError,
+    OperationFailure,
+    WriteError,
+)
+from pymongo.results import (
+    BulkWriteResult,
+    DeleteResult,
+    InsertManyResult,
+    InsertOneResult,
+    UpdateResult,
+)
+
+from beanie.exceptions import ApplyChangesException, NotSupported
+from beanie.odm.backends.memory.aggregation import (
+    MISSING,
+    Pipeline,
+    compile_match,
+    get_field,
+    project,
+    set_field,
+    sort_documents,
+)
+from beanie.odm.utils.bson_order import (
+    compare_values,
+    is_number,
+    to_decimal,
+    values_equal,
+)
+from beanie.odm.utils.matcher import Predicate, compile_filter
+from beanie.odm.utils.update_apply import apply_update_query
+
+if TYPE_CHECKING:
+    from beanie.odm.backends.memory.database import MemoryDatabase
+
+Document = dict[str, Any]
+
+# UUIDs, written by the plain pymongo code, are stored as the standard
+# binary. They are read back as Binary, like with the default client
+_WRITE_CODEC_OPTIONS: CodecOptions[Document] = CodecOptions(
+    uuid_representation=UuidRepresentation.STANDARD
+)
+
+_DUPLICATE_KEY = 11000
+_BAD_VALUE = 2
+_IMMUTABLE_FIELD = 66
+_INDEX_NOT_FOUND = 27
+_INDEX_OPTIONS_CONFLICT = 85
+
+
+def _get_key(value: Any) -> Any:
+    """
+    Hashable key of the `_id` value. Equal numbers of different types
+    share the key, like they do in the MongoDB `_id` index
+    """
+    if is_number(value):
+        return Decimal, to_decimal(value)
+    try:
+        hash(value)
+    except TypeError:
+        return bytes, bson.encode(
+            {"_id": value}, codec_options=_WRITE_CODEC_OPTIONS
+        )
+    return type(value), value
+
+
+def _get_index_value_key(value: Any) -> Any:
+    """
+    Hashable key of the indexed value. The keys are equal,
+    if the values are equal for MongoDB: numbers are compared by value
+    and the field order of the objects matters
+    """
+    if is_number(value):
+        number = to_decimal(value)
+        return Decimal, "NaN" if number.is_nan() else number
+    if isinstance(value, Mapping):
+        return dict, tuple(
+            (key, _get_index_value_key(item)) for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return list, tuple(_get_index_value_key(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return bytes, bson.encode(
+            {"value": value}, codec_options=_WRITE_CODEC_OPTIONS
+        )
+    return type(value), value
+
+
+def _normalize(document: Mapping[str, Any]) -> Document:
+    """
+    Copy of the document as MongoDB would store it: datetimes are UTC
+    with millisecond precision, tuples are lists and so on
+    """
+    return bson.decode(
+        bson.encode(document, codec_options=_WRITE_CODEC_OPTIONS)
+    )
+
+
+def _get_id(filter: Mapping[str, Any]) -> Any:
+    value = filter.get("_id", MISSING)
+    if isinstance(value, Mapping) and "$eq" in value:
+        return value["$eq"]
+    if isinstance(value, Mapping) and any(
+        isinstance(key, str) and key.startswith("$") for key in value
+    ):
+        return MISSING
+    return value
+
+
+def _get_upsert_base(filter: Mapping[str, Any]) -> Document:
+    """
+    Fields of the upserted document, taken from the equality
+    conditions of the filter
+    """
+    document: Document = {}
+    conditions = [filter]
+    while conditions:
+        condition = conditions.pop(0)
+        for key, value in condition.items():
+            if key == "$and":
+                conditions.extend(value)
+            elif key.startswith("$"):
+                continue
+            elif isinstance(value, Mapping) and "$eq" in value:
+                set_field(document, key, deepcopy(value["$eq"]))
+            elif not (
+                isinstance(value, Mapping)
+                and any(
+                    isinstance(name, str) and name.startswith("$")
+                    for name in value
+                )
+            ):
+                set_field(document, key, deepcopy(value))
+    return document
+
+
+def _check_update(update: Any) -> None:
+    if isinstance(update, list):
+        return
+    if not isinstance(update, Mapping) or not update:
+        raise ValueError("update cannot be empty")
+    if not all(isinstance(key, str) and key.startswith("$") for key in update):
+        raise ValueError("update only works with $ operators")
+
+
+def _get_conditions(filter: Mapping[str, Any]) -> list[tuple[str, Any]]:
+    conditions = []
+    for key, value in filter.items():
+        if key == "$and":
+            for condition in value:
+                conditions.extend(_get_conditions(condition))
+        elif not key.startswith("$"):
+            conditions.append((key, value))
+    return conditions
+
+
+def _match_element(match: Predicate, in_array: bool) -> Predicate:
+    # `$elemMatch` conditions are matched against an array of the element
+    def predicate(element: Any) -> bool:
+        return match({"value": [element] if in_array else element})
+
+    return predicate
+
+
+def _get_matched_index(
+    filter: Mapping[str, Any], path: str, array: list[Any]
+) -> int:
+    """
+    Index of the first array element, matched by the query,
+    which the positional `$` operator refers to
+    """
+    predicates: list[Predicate] = []
+    for key, condition in _get_conditions(filter):
+        if key == path:
+            predicates.append(
+                _match_element(
+                    compile_filter({"value": condition}),
+                    in_array=isinstance(condition, Mapping)
+                    and "$elemMatch" in condition,
+                )
+            )
+        elif key.startswith(f"{path}."):
+            predicates.append(
+                compile_filter({key[len(path) + 1 :]: condition})
+            )
+    if predicates:
+        for index, element in enumerate(array):
+            if all(predicate(element) for predicate in predicates):
+                return index
+    message = (
+        "The positional operator did not find the match needed from the query."
+    )
+    raise WriteError(message, _BAD_VALUE, {"errmsg": message})
+
+
+def _expand_path(
+    value: Any, parts: list[str], prefix: list[str], filter: Mapping[str, Any]
+) -> list[str]:
+    for position, part in enumerate(parts):
+        if part == "$" or part == "$[]":
+            if not isinstance(value, list):
+                message = (
+                    f"Cannot apply array updates to non-array element "
+                    f"{'.'.join(prefix)}"
+                )
+                raise WriteError(message, _BAD_VALUE, {"errmsg": message})
+            if part == "$":
+                indexes = [_get_matched_index(filter, ".".join(prefix), value)]
+            else:
+                indexes = list(range(len(value)))
+            return [
+                path
+                for index in indexes
+                for path in _expand_path(
+                    value[index],
+                    parts[position + 1 :],
+                    [*prefix, str(index)],
+                    filter,
+                )
+            ]
+        if part.startswith("$["):
+            raise NotSupported(
+                "Array filters are not supported by the memory backend"
+            )
+        if isinstance(value, Mapping):
+            value = value.get(part, MISSING)
+        elif isinstance(value, list) and part.isdigit():
+            index = int(part)
+            value = value[index] if index < len(value) else MISSING
+        else:
+            value = MISSING
+        prefix = [*prefix, part]
+    return [".".join(prefix)]
+
+
+def _expand_positional(
+    update: Any, filter: Mapping[str, Any], document: Document
+) -> Any:
+    """
+    Update with the positional `$` and `$[]` paths replaced
+    by the paths of the array elements of the document
+    """
+    if not isinstance(update, Mapping):
+        return update
+    result = {}
+    for operator, expression in update.items():
+        if not isinstance(expression, Mapping) or not any(
+            "$" in path for path in expression
+        ):
+            result[operator] = expression
+            continue
+        result[operator] = {
+            expanded: argument
+            for path, argument in expression.items()
+            for expanded in _expand_path(document, path.split("."), [], filter)
+        }
+    return result
+
+
+def _check_replacement(replacement: Mapping[str, Any]) -> None:
+    if any(
+        isinstance(key, str) and key.startswith("$") for key in replacement
+    ):
+        raise ValueError("replacement can not include $ operators")
+
+
+def _get_sort(sort: Any) -> list[tuple[str, int]] | None:
+    if not sort:
+        return None
+    if isinstance(sort, str):
+        return [(sort, 1)]
+    if isinstance(sort, Mapping):
+        return list(sort.items())
+    return [
+        (item, 1) if isinstance(item, str) else tuple(item) for item in sort
+    ]
+
+
+def _get_projection(projection: Any) -> Mapping[str, Any] | None:
+    if projection is None:
+        return None
+    if isinstance(projection, Mapping):
+        return projection
+    return dict.fromkeys(projection, 1)
+
+
+def _get_index_document(index_model: IndexModel) -> dict[str, Any]:
+    """
+    Index description, like the one of `index_information`.
+    Text indexes are described like MongoDB does it
+    """
+    document = dict(index_model.document)
+    key = list(document["key"].items())
+    text_fields = [field for field, kind in key if kind == "text"]
+    if text_fields:
+        position = next(
+            index for index, (_, kind) in enumerate(key) if kind == "text"
+        )
+        key = [
+            *key[:position],
+            ("_fts", "text"),
+            ("_ftsx", 1),
+            *(item for item in key[position:] if item[1] != "text"),
+        ]
+        document["weights"] = {
+            **dict.fromkeys(text_fields, 1),
+            **document.get("weights", {}),
+        }
+        document.setdefault("default_language", "english")
+        document.setdefault("language_override", "language")
+        document.setdefault("textIndexVersion", 3)
+    document["key"] = key
+    return document
+
+
+class _Storage:
+    """
+    Documents and indexes of the collection. Shared between
+    the collection objects with different options
+    """
+
+    def __init__(self) -> None:
+        self.documents: dict[Any, Document] = {}
+        self.indexes: dict[str, dict[str, Any]] = {}
+        # keys of the documents by the keys of the unique indexes
+        self.unique_keys: dict[str, dict[Any, set[Any]]] = {}
+
+
+class MemoryCursor:
+    """
+    Cursor over the already selected documents
+    """
+
+    def __init__(self, collection: "MemoryCollection", documents: list[Any]):
+        """
+        :param collection: MemoryCollection - collection to decode
+            the documents with
+        :param documents: List[Dict[str, Any]] - selected documents
+        """
+        self._collection = collection
+        self._documents = documents
+        self._position = 0
+
+    @property
+    def alive(self) -> bool:
+        return self._position < len(self._documents)
+
+    def batch_size(self, batch_size: int) -> "MemoryCursor":
+        return self
+
+    def __aiter__(self) -> "MemoryCursor":
+        return self
+
+    async def __anext__(self) -> Any:
+        if not self.alive:
+            raise StopAsyncIteration
+        return await self.next()
+
+    async def next(self) -> Any:
+        if not self.alive:
+            raise StopAsyncIteration
+        document = self._documents[self._position]
+        self._position += 1
+        return self._collection.decode(document)
+
+    async def to_list(self, length: int | None = None) -> list[Any]:
+        end = len(self._documents)
+        if length is not None:
+            end = min(end, self._position + length)
+        documents = self._documents[self._position : end]
+        self._position = end
+        return [self._collection.decode(document) for document in documents]
+
+    async def close(self) -> None:
+        self._position = len(self._documents)
+
+
+class MemoryCollection:
+    """
+    In-process replacement of the pymongo async collection.
+
+    The documents are kept in memory, in the insertion order. Queries,
+    updates and aggregation stages are evaluated by Beanie itself,
+    following MongoDB semantics. Sessions, write concerns and
+    collations are ignored
+    """
+
+    def __init__(
+        self,
+        database: "MemoryDatabase",
+        name: str,
+        codec_options: CodecOptions | None = None,
+        storage: _Storage | None = None,
+    ):
+        """
+        :param database: MemoryDatabase - database of the collection
+        :param name: str - collection name
+        :param codec_options: Optional[CodecOptions] - options to decode
+            the documents with
+        :param storage: Optional[_Storage] - storage of the collection
+            to share
+        """
+        self.database = database
+        self.name = name
+        self.full_name = f"{database.name}.{name}"
+        self.codec_options = codec_options or DEFAULT_CODEC_OPTIONS
+        self._storage = storage or _Storage()
+
+    def with_options(
+        self, codec_options: CodecOptions | None = None, **kwargs: Any
+    ) -> "MemoryCollection":
+        return MemoryCollection(
+            self.database,
+            self.name,
+            codec_options=codec_options or self.codec_options,
+            storage=self._storage,
+        )
+
+    def clear(self) -> None:
+        self._storage.documents.clear()
+        self._storage.indexes.clear()
+        self._storage.unique_keys.clear()
+
+    def decode(self, document: Document) -> Any:
+        """
+        Copy of the stored document, decoded with the collection options
+
+        :param document: Dict[str, Any] - stored document
+        :return: Any - dict or the configured document class
+        """
+        data = bson.encode(document, codec_options=_WRITE_CODEC_OPTIONS)
+        if issubclass(self.codec_options.document_class, RawBSONDocument):
+            return RawBSONDocument(
+                data,
+                codec_options=cast(
+                    "CodecOptions[RawBSONDocument]", self.codec_options
+                ),
+            )
+        return bson.decode(data, codec_options=self.codec_options)
+
+    def get_documents(self) -> list[Document]:
+        """
+        Stored documents or, for the views, the documents
+        produced by the view pipeline. Must not be changed
+
+        :return: List[Dict[str, Any]]
+        """
+        view = self.database.get_view(self.name)
+        if view is not None:
+            source, pipeline = view
+            return Pipeline(self.database, pipeline).run(
+                self.database[source].get_documents()
+            )
+        return list(self._storage.documents.values())
+
+    def _select(
+        self,
+        filter: Mapping[str, Any] | None,
+        sort: Any = None,
+        skip: int = 0,
+        limit: int = 0,
+    ) -> list[Document]:
+        documents = self.get_documents()
+        if filter:
+            predicate = compile_match(filter)
+            documents = [
+                document for document in documents if predicate(document)
+            ]
+        sort = _get_sort(sort)
+        if sort:
+            documents = sort_documents(documents, sort)
+        if skip:
+            documents = documents[skip:]
+        if limit:
+            documents = documents[: abs(limit)]
+        return documents
+
+    def _check_writable(self) -> None:
+        if self.database.get_view(self.name) is not None:
+            raise OperationFailure(
+                f"Namespace {self.full_name} is a view, not a collection",
+                166,
+            )
+
+    # Indexes
+
+    def _get_index_keys(
+        self, document: Document, index: Mapping[str, Any]
+    ) -> list[tuple[Any, ...]] | None:
+        fields = [field for field, _ in index["key"]]
+        values = [get_field(document, field) for field in fields]
+        if index.get("sparse") and all(value is MISSING for value in values):
+            return None
+        partial = index.get("partialFilterExpression")
+        if partial is not None and not compile_match(partial)(document):
+            return None
+        candidates = []
+        for value in values:
+            if value is MISSING:
+                candidates.append([None])
+            elif isinstance(value, list):
+                # multikey index: every element is a key
+                candidates.append(value or [None])
+            else:
+                candidates.append([value])
+        return list(product(*candidates))
+
+    def _get_unique_keys(
+        self, document: Document, index: Mapping[str, Any]
+    ) -> dict[Any, tuple[Any, ...]]:
+        return {
+            _get_index_value_key(value): value
+            for value in self._get_index_keys(document, index) or []
+        }
+
+    def _check_unique(
+        self, document: Document, exclude: Any = MISSING
+    ) -> None:
+        key = _get_key(document["_id"])
+        if key != exclude and key in self._storage.documents:
+            self._raise_duplicate("_id_", [("_id", 1)], (document["_id"],))
+        for name, index in self._storage.indexes.items():
+            if not index.get("unique"):
+                continue
+            owners = self._storage.unique_keys[name]
+            for index_key, value in self._get_unique_keys(
+                document, index
+            ).items():
+                if owners.get(index_key, set()) - {exclude}:
+                    self._raise_duplicate(name, index["key"], value)
+
+    def _add_unique_keys(self, key: Any, document: Document) -> None:
+        for name, index in self._storage.indexes.items():
+            if index.get("unique"):
+                owners = self._storage.unique_keys[name]
+                for index_key in self._get_unique_keys(document, index):
+                    owners.setdefault(index_key, set()).add(key)
+
+    def _remove_unique_keys(self, key: Any, document: Document) -> None:
+        for name, index in self._storage.indexes.items():
+            if index.get("unique"):
+                owners = self._storage.unique_keys[name]
+                for index_key in self._get_unique_keys(document, index):
+                    keys = owners.get(index_key)
+                    if keys is not None:
+                        keys.discard(key)
+                        if not keys:
+                            del owners[index_key]
+
+    def _raise_duplicate(
+        self,
+        name: str,
+        key: list[tuple[str, Any]],
+        value: tuple[Any, ...],
+    ) -> None:
+        key_value = {
+            field: item for (field, _), item in zip(key, value, strict=True)
+        }
+        message = (
+            f"E11000 duplicate key error collection: {self.full_name} "
+            f"index: {name} dup key: {key_value}"
+        )
+        raise DuplicateKeyError(
+            message,
+            _DUPLICATE_KEY,
+            {
+                "code": _DUPLICATE_KEY,
+                "errmsg": message,
+                "keyPattern": dict(key),
+                "keyValue": key_value,
+            },
+        )
+
+    async def index_information(self, **kwargs: Any) -> dict[str, Any]:
+        result: dict[str, Any] = {"_id_": {"v": 2, "key": [("_id", 1)]}}
+        for name, index in self._storage.indexes.items():
+            result[name] = {"v": 2, **deepcopy(index)}
+        return result
+
+    async def create_indexes(
+        self, indexes: Iterable[IndexModel], **kwargs: Any
+    ) -> list[str]:
+        names = []
+        for index_model in indexes:
+            document = _get_index_document(index_model)
+            name = document.pop("name")
+            existing = self._storage.indexes.get(name)
+            if existing is not None and existing != document:
+                raise OperationFailure(
+                    f"An existing index has the same name "
+                    f"as the requested index: {name}",
+                    _INDEX_OPTIONS_CONFLICT,
+                )
+            if existing is None and document.get("unique"):
+                owners: dict[Any, set[Any]] = {}
+                for key, stored in self._storage.documents.items():
+                    for index_key, value in self._get_unique_keys(
+                        stored, document
+                    ).items():
+                        if index_key in owners:
+                            self._raise_duplicate(name, document["key"], value)
+                        owners[index_key] = {key}
+                self._storage.unique_keys[name] = owners
+            self._storage.indexes[name] = document
+            self.database.mark_existing(self.name)
+            names.append(name)
+        return names
+
+    async def create_index(self, keys: Any, **kwargs: Any) -> str:
+        return (await self.create_indexes([IndexModel(keys, **kwargs)]))[0]
+
+    async def drop_index(self, index_or_name: Any, **kwargs: Any) -> None:
+        name = getattr(index_or_name, "document", {}).get(
+            "name", index_or_name
+        )
+        if name not in self._storage.indexes:
+            raise OperationFailure(
+                f"index not found with name [{name}]", _INDEX_NOT_FOUND
+            )
+        del self._storage.indexes[name]
+        self._storage.unique_keys.pop(name, None)
+
+    async def drop_indexes(self, **kwargs: Any) -> None:
+        self._storage.indexes.clear()
+        self._storage.unique_keys.clear()
+
+    async def drop(self, **kwargs: Any) -> None:
+        self.database.drop_collection_data(self.name)
+
+    # Reading
+
+    def find(
+        self,
+        filter: Mapping[str, Any] | None = None,
+        projection: Any = None,
+        skip: int = 0,
+        limit: int = 0,
+        sort: Any = None,
+        **kwargs: Any,
+    ) -> MemoryCursor:
+        documents = self._select(filter, sort, skip, limit)
+        projection = _get_projection(projection)
+        if projection:
+            documents = [
+                project(document, projection) for document in documents
+            ]
+        return MemoryCursor(self, documents)
+
+    async def find_one(
+        self, filter: Any = None, *args: Any, **kwargs: Any
+    ) -> Any:
+        if filter is not None and not isinstance(filter, Mapping):
+            filter = {"_id": filter}
+        kwargs["limit"] = 1
+        return await anext(self.find(filter, *args, **kwargs), None)
+
+    async def count_documents(
+        self,
+        filter: Mapping[str, Any],
+        skip: int = 0,
+        limit: int = 0,
+        **kwargs: Any,
+    ) -> int:
+        return len(self._select(filter, skip=skip, limit=limit))
+
+    async def estimated_document_count(self, **kwargs: Any) -> int:
+        return len(self.get_documents())
+
+    async def distinct(
+        self,
+        key: str,
+        filter: Mapping[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> list[Any]:
+        result: list[Any] = []
+        for document in self._select(filter):
+            value = get_field(document, key)
+            if value is MISSING:
+                continue
+            values = value if isinstance(value, list) else [value]
+            for item in values:
+                if not any(values_equal(item, other) for other in result):
+                    result.append(item)
+        # the values are read from the index by the server, so they are sorted
+        result.sort(key=cmp_to_key(compare_values))
+        return [self.decode({"value": item})["value"] for item in result]
+
+    async def aggregate(
+        self, pipeline: list[Mapping[str, Any]], **kwargs: Any
+    ) -> MemoryCursor:
+        documents = Pipeline(self.database, list(pipeline)).run(
+            self.get_documents()
+        )
+        return MemoryCursor(self, documents)
+
+    # Writing
+
+    def _store(self, document: Document, exclude: Any = MISSING) -> None:
+        self._check_unique(document, exclude)
+        documents = self._storage.documents
+        key = _get_key(document["_id"])
+        if exclude is not MISSING:
+            self._remove_unique_keys(exclude, documents[exclude])
+            # the updated document keeps its position in the natural order
+            if key != exclude:
+                del documents[exclude]
+        documents[key] = document
+        self._add_unique_keys(key, document)
+        self.database.mark_existing(self.name)
+
+    def _insert(self, document: Any) -> Any:
+        self._check_writable()
+        if "_id" not in document:
+            document["_id"] = ObjectId()
+        stored = _normalize(document)
+        self._store(stored)
+        return stored["_id"]
+
+    def _apply(
+        self,
+        document: Document,
+        update: Any,
+        insert: bool = False,
+        let: Mapping[str, Any] | None = None,
+    ) -> Document:
+        if isinstance(update, list):
+            return Pipeline(self.database, update, let).run([document])[0]
+        result = deepcopy(document)
+        try:
+            apply_update_query(result, update)
+            if insert and "$setOnInsert" in update:
+                apply_update_query(result, {"$set": update["$setOnInsert"]})
+        except ApplyChangesException as e:
+            raise WriteError(str(e), _BAD_VALUE, {"errmsg": str(e)})
+        return result
+
+    def _replace_stored(self, old: Document, new: Document) -> bool:
+        """
+        Store the changed version of the document
+
+        :return: bool - if the document was modified
+        """
+        if "_id" not in new or not values_equal(new["_id"], old["_id"]):
+            message = (
+                "Performing an update on the path '_id' would modify "
+                "the immutable field '_id'"
+            )
+            raise WriteError(message, _IMMUTABLE_FIELD, {"errmsg": message})
+        new = _normalize({"_id": old["_id"], **new})
+        if bson.encode(new) == bson.encode(old):
+            return False
+        self._store(new, exclude=_get_key(old["_id"]))
+        return True
+
+    def _upsert(self, document: Document) -> Any:
+        if "_id" not in document:
+            document = {"_id": ObjectId(), **document}
+        else:
+            document = {"_id": document.pop("_id"), **document}
+        return self._insert(document)
+
+    def _update(
+        self,
+        filter: Mapping[str, Any],
+        update: Any,
+        upsert: bool = False,
+        multi: bool = False,
+        sort: Any = None,
+        array_filters: Any = None,
+        let: Mapping[str, Any] | None = None,
+    ) -> tuple[int, int, Any, Document | None, Document | None]:
+        """
+        Update the matching documents
+
+        :return: Tuple - numbers of the matched and modified documents,
+            id of the upserted one, the document before and after the update
+        """
+        self._check_writable()
+        _check_update(update)
+        if array_filters:
+            raise NotSupported(
+                "Array filters are not supported by the memory backend"
+            )
+        documents = self._select(filter, sort=sort, limit=0 if multi else 1)
+        if not documents:
+            if not upsert:
+                return 0, 0, None, None, None
+            new = self._apply(
+                _get_upsert_base(filter), update, insert=True, let=let
+            )
+            upserted_id = self._upsert(new)
+            stored = self._storage.documents[_get_key(upserted_id)]
+            return 0, 0, upserted_id, None, stored
+        modified = 0
+        before = after = None
+        for document in documents:
+            new = self._apply(
+                document,
+                _expand_positional(update, filter, document),
+                let=let,
+            )
+            if self._replace_stored(document, new):
+                modified += 1
+            before = document
+            after = self._storage.documents[_get_key(document["_id"])]
+        return len(documents), modified, None, before, after
+
+    def _replace(
+        self,
+        filter: Mapping[str, Any],
+        replacement: Mapping[str, Any],
+        upsert: bool = False,
+        sort: Any = None,
+    ) -> tuple[int, int, Any, Document | None, Document | None]:
+        self._check_writable()
+        _check_replacement(replacement)
+        documents = self._select(filter, sort=sort, limit=1)
+        if not documents:
+            if not upsert:
+                return 0, 0, None, None, None
+            new = dict(replacement)
+            if "_id" not in new:
+                filter_id = _get_id(filter)
+                if filter_id is not MISSING:
+                    new["_id"] = deepcopy(filter_id)
+            upserted_id = self._upsert(new)
+            stored = self._storage.documents[_get_key(upserted_id)]
+            return 0, 0, upserted_id, None, stored
+        document = documents[0]
+        new = dict(replacement)
+        new.setdefault("_id", document["_id"])
+        modified = int(self._replace_stored(document, new))
+        after = self._storage.documents[_get_key(document["_id"])]
+        return 1, modified, None, document, after
+
+    def _delete(self, filter: Mapping[str, Any], multi: bool) -> int:
+        self._check_writable()
+        documents = self._select(filter, limit=0 if multi else 1)
+        for document in documents:
+            key = _get_key(document["_id"])
+            self._remove_unique_keys(key, document)
+            del self._storage.documents[key]
+        return len(documents)
+
+    @staticmethod
+    def _update_result(
+        matched: int, modified: int, upserted_id: Any
+    ) -> UpdateResult:
+        raw_result = {
+            "n": matched + int(upserted_id is not None),
+            "nModified": modified,
+            "updatedExisting": matched > 0,
+            "ok": 1.0,
+        }
+        if upserted_id is not None:
+            raw_result["upserted"] = upserted_id
+        return UpdateResult(raw_result, True)
+
+    async def insert_one(
+        self, document: Any, **kwargs: Any
+    ) -> InsertOneResult:
+        return InsertOneResult(self._insert(document), True)
+
+    async def insert_many(
+        self, documents: Iterable[Any], ordered: bool = True, **kwargs: Any
+    ) -> InsertManyResult:
+        documents = list(documents)
+        for document in documents:
+            if "_id" not in document:
+                document["_id"] = ObjectId()
+        write_errors = []
+        inserted = 0
+        for index, document in enumerate(documents):
+            try:
+                self._insert(document)
+                inserted += 1
+            except DuplicateKeyError as e:
+                write_errors.append(
+                    {**(e.details or {}), "index": index, "op": document}
+                )
+                if ordered:
+                    break
+        if write_errors:
+            raise BulkWriteError(
+                {
+                    "writeErrors": write_errors,
+                    "writeConcernErrors": [],
+                    "nInserted": inserted,
+                    "nUpserted": 0,
+                    "nMatched": 0,
+                    "nModified": 0,
+                    "nRemoved": 0,
+                    "upserted": [],
+                }
+            )
+        return InsertManyResult(
+            [document["_id"] for document in documents], True
+        )
+
+    async def update_one(
+        self,
+        filter: Mapping[str, Any],
+        update: Any,
+        upsert: bool = False,
+        array_filters: Any = None,
+        sort: Any = None,
+        let: Mapping[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> UpdateResult:
+        matched, modified, upserted_id, _, _ = self._update(
+            filter,
+            update,
+            upsert=upsert,
+            sort=sort,
+            array_filters=array_filters,
+            let=let,
+        )
+        return self._update_result(matched, modified, upserted_id)
+
+    async def update_many(
+        self,
+        filter: Mapping[str, Any],
+        update: Any,
+        upsert: bool = False,
+        array_filters: Any = None,
+        let: Mapping[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> UpdateResult:
+        matched, modified, upserted_id, _, _ = self._update(
+            filter,
+            update,
+            upsert=upsert,
+            multi=True,
+            array_filters=array_filters,
+            let=let,
+        )
+        return self._update_result(matched, modified, upserted_id)
+
+    async def replace_one(
+        self,
+        filter: Mapping[str, Any],
+        replacement: Mapping[str, Any],
+        upsert: bool = False,
+        sort: Any = None,
+        **kwargs: Any,
+    ) -> UpdateResult:
+        matched, modified, upserted_id, _, _ = self._replace(
+            filter, replacement, upsert=upsert, sort=sort
+        )
+        return self._update_result(matched, modified, upserted_id)
+
+    async def find_one_and_update(
+        self,
+        filter: Mapping[str, Any],
+        update: Any,
+        projection: Any = None,
+        sort: Any = None,
+        upsert: bool = False,
+        return_document: bool = ReturnDocument.BEFORE,
+        array_filters: Any = None,
+        let: Mapping[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        _, _, _, before, after = self._update(
+            filter,
+            update,
+            upsert=upsert,
+            sort=sort,
+            array_filters=array_filters,
+            let=let,
+        )
+        document = after if return_document else before
+        if document is None:
+            return None
+        projection = _get_projection(projection)
+        if projection:
+            document = project(document, projection)
+        return self.decode(document)
+
+    async def find_one_and_replace(
+        self,
+        filter: Mapping[str, Any],
+        replacement: Mapping[str, Any],
+        projection: Any = None,
+        sort: Any = None,
+        upsert: bool = False,
+        return_document: bool = ReturnDocument.BEFORE,
+        **kwargs: Any,
+    ) -> Any:
+        _, _, _, before, after = self._replace(
+            filter, replacement, upsert=upsert, sort=sort
+        )
+        document = after if return_document else before
+        if document is None:
+            return None
+        projection = _get_projection(projection)
+        if projection:
+            document = project(document, projection)
+        return self.decode(document)
+
+    async def delete_one(
+        self, filter: Mapping[str, Any], **kwargs: Any
+    ) -> DeleteResult:
+        return DeleteResult(
+            {"n": self._delete(filter, multi=False), "ok": 1.0}, True
+        )
+
+    async def delete_many(
+        self, filter: Mapping[str, Any], **kwargs: Any
+    ) -> DeleteResult:
+        return DeleteResult(
+            {"n": self._delete(filter, multi=True), "ok": 1.0}, True
+        )
+
+    async def bulk_write(
+        self, requests: Iterable[Any], ordered: bool = True, **kwargs: Any
+    ) -> BulkWriteResult:
+        result: dict[str, Any] = {
+            "writeErrors": [],
+            "writeConcernErrors": [],
+            "nInserted": 0,
+            "nUpserted": 0,
+            "nMatched": 0,
+            "nModified": 0,
+            "nRemoved": 0,
+            "upserted": [],
+        }
+        for index, request in enumerate(requests):
+            try:
+                upserted_id = None
+                if isinstance(request, InsertOne):
+                    self._insert(request._doc)
+                    result["nInserted"] += 1
+                elif isinstance(request, (UpdateOne, UpdateMany)):
+                    matched, modified, upserted_id, _, _ = self._update(
+                        request._filter,
+                        request._doc,
+                        upsert=bool(request._upsert),
+                        multi=isinstance(request, UpdateMany),
+                        sort=getattr(request, "_sort", None),
+                        array_filters=request._array_filters,
+                    )
+                    result["nMatched"] += matched
+                    result["nModified"] += modified
+                elif isinstance(request, ReplaceOne):
+                    matched, modified, upserted_id, _, _ = self._replace(
+                        request._filter,
+                        request._doc,
+                        upsert=bool(request._upsert),
+                        sort=getattr(request, "_sort", None),
+                    )
+                    result["nMatched"] += matched
+                    result["nModified"] += modified
+                elif isinstance(request, (DeleteOne, DeleteMany)):
+                    result["nRemoved"] += self._delete(
+                        request._filter,
+                        multi=isinstance(request, DeleteMany),
+                    )
+                else:
+                    raise TypeError(f"{request!r} is not a valid request")
+                if upserted_id is not None:
+                    result["nUpserted"] += 1
+                    result["upserted"].append(
+                        {"index": index, "_id": upserted_id}
+                    )
+            except (DuplicateKeyError, WriteError) as e:
+                result["writeErrors"].append(
+                    {
+                        **(e.details or {}),
+                        "index": index,
+                        "code": e.code,
+                        "errmsg": str(e),
+                    }
+                )
+                if ordered:
+                    break
+        if result["writeErrors"]:
+            raise BulkWriteError(result)
+        return BulkWriteResult(result, True)
@@ -0,0 +1,171 @@
+from collections.abc import Mapping
+from typing import Any
+
+from pymongo.errors import CollectionInvalid, OperationFailure
+
+from beanie.exceptions import NotSupported
+from beanie.odm.backends.memory.collection import MemoryCollection
+
+# The backend reports the server version, which supports all the features
+# Beanie checks, but doesn't pretend to support the client bulk write
+SERVER_VERSION = "7.0.0"
+
+
+class MemoryClient:
+    """
+    In-process replacement of the pymongo async client.
+    Holds the databases, which live as long as the client does
+    """
+
+    def __init__(self, default_database: str = "beanie"):
+        """
+        :param default_database: str - name of the default database
+        """
+        self._default_database = default_database
+        self._databases: dict[str, MemoryDatabase] = {}
+
+    def append_metadata(self, driver_info: Any) -> None:
+        pass
+
+    def get_database(self, name: str | None = None) -> "MemoryDatabase":
+        name = name or self._default_database
+        if name not in self._databases:
+            self._databases[name] = MemoryDatabase(self, name)
+        return self._databases[name]
+
+    def get_default_database(self) -> "MemoryDatabase":
+        return self.get_database()
+
+    def __getitem__(self, name: str) -> "MemoryDatabase":
+        return self.get_database(name)
+
+    def __getattr__(self, name: str) -> "MemoryDatabase":
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.get_database(name)
+
+    def start_session(self, **kwargs: Any) -> Any:
+        raise NotSupported(
+            "Sessions and transactions are not supported by the memory backend"
+        )
+
+    async def close(self) -> None:
+        pass
+
+    async def drop_database(self, name: str) -> None:
+        self._databases.pop(getattr(name, "name", name), None)
+
+
+class MemoryDatabase:
+    """
+    In-process replacement of the pymongo async database
+    """
+
+    def __init__(self, client: MemoryClient, name: str):
+        """
+        :param client: MemoryClient - client of the database
+        :param name: str - database name
+        """
+        self.client = client
+        self.name = name
+        self._collections: dict[str, MemoryCollection] = {}
+        # names of the collections, which were created or written to
+        self._existing: set[str] = set()
+        self._views: dict[str, tuple[str, list[Mapping[str, Any]]]] = {}
+
+    def get_collection(self, name: str, **kwargs: Any) -> MemoryCollection:
+        if name not in self._collections:
+            self._collections[name] = MemoryCollection(self, name)
+        return self._collections[name]
+
+    def __getitem__(self, name: str) -> MemoryCollection:
+        return self.get_collection(name)
+
+    def __getattr__(self, name: str) -> MemoryCollection:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.get_collection(name)
+
+    def get_view(
+        self, name: str
+    ) -> tuple[str, list[Mapping[str, Any]]] | None:
+        """
+        Source collection and pipeline of the view
+
+        :param name: str - view name
+        :return: Optional[Tuple[str, List[Mapping[str, Any]]]]
+        """
+        return self._views.get(name)
+
+    def mark_existing(self, name: str) -> None:
+        """
+        Register the collection as existing one. Collections are created
+        implicitly on the first write, like MongoDB does it
+
+        :param name: str - collection name
+        :return: None
+        """
+        self._existing.add(name)
+
+    def drop_collection_data(self, name: str) -> None:
+        """
+        Drop the collection or the view. The collection objects are kept,
+        as the document classes keep the references to them
+
+        :param name: str - collection name
+        :return: None
+        """
+        self._views.pop(name, None)
+        self._existing.discard(name)
+        if name in self._collections:
+            self._collections[name].clear()
+
+    async def command(
+        self, command: Mapping[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        if "buildInfo" in command:
+            return {
+                "version": SERVER_VERSION,
+                "versionArray": [
+                    int(part) for part in SERVER_VERSION.split(".")
+                ]
+                + [0],
+                "ok": 1.0,
+            }
+        if "ping" in command:
+            return {"ok": 1.0}
+        if "create" in command:
+            await self.create_collection(
+                command["create"],
+                viewOn=command.get("viewOn"),
+                pipeline=command.get("pipeline"),
+            )
+            return {"ok": 1.0}
+        if "drop" in command:
+            self.drop_collection_data(command["drop"])
+            return {"ok": 1.0}
+        raise OperationFailure(
+            f"Command {next(iter(command), None)} is not supported "
+            "by the memory backend"
+        )
+
+    async def list_collection_names(self, **kwargs: Any) -> list[str]:
+        return sorted(self._existing | set(self._views))
+
+    async def create_collection(
+        self,
+        name: str,
+        viewOn: str | None = None,
+        pipeline: list[Mapping[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> MemoryCollection:
+        if name in self._existing or name in self._views:
+            raise CollectionInvalid(f"collection {name} already exists")
+        if viewOn is not None:
+            self._views[name] = (viewOn, list(pipeline or []))
+        else:
+            self.mark_existing(name)
+        return self.get_collection(name)
+
+    async def drop_collection(self, name: Any, **kwargs: Any) -> None:
+        self.drop_collection_data(getattr(name, "name", name))
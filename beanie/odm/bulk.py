@@ -1,4 +1,6 @@
-from collections.abc import Mapping
+import asyncio
+import copy
+from collections.abc import Mapping, Sequence
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, TypeAlias
 
@@ -11,9 +13,14 @@ from pymongo import (
     UpdateOne,
 )
 from pymongo.asynchronous.client_session import AsyncClientSession
-from pymongo.results import BulkWriteResult
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.errors import BulkWriteError, ClientBulkWriteException
+from pymongo.results import BulkWriteResult, ClientBulkWriteResult
 from typing_extensions import Self
 
+from beanie.odm.cache import CacheRegistry
+from beanie.odm.utils.size import get_approximate_size
+
 if TYPE_CHECKING:
     from beanie import Document
     from beanie.odm.union_doc import UnionDoc
@@ -27,6 +34,116 @@ _WriteOp: TypeAlias = (
     | UpdateMany
 )
 
+_BulkResult: TypeAlias = tuple[Sequence[int], BulkWriteResult | BulkWriteError]
+
+# the first MongoDB version with the client-level bulkWrite command
+CLIENT_BULK_WRITE_MAJOR_VERSION = 8
+
+_MERGED_COUNTERS = (
+    "nInserted",
+    "nUpserted",
+    "nMatched",
+    "nModified",
+    "nRemoved",
+)
+
+
+def get_operation_size(operation: _WriteOp) -> int:
+    """
+    Approximate size of the operation in bytes
+
+    :param operation: pymongo write operation
+    :return: int
+    """
+    return sum(
+        get_approximate_size(getattr(operation, name, None))
+        for name in ("_filter", "_doc")
+    )
+
+
+def merge_bulk_write_results(
+    results: list[_BulkResult],
+) -> tuple[dict[str, Any] | None, bool]:
+    """
+    Merge the results of the flushed batches to a single result.
+    Indexes of the upserts and errors are mapped to the indexes
+    of the operations in the writer
+
+    :param results: List[Tuple[Sequence[int], Union[BulkWriteResult, BulkWriteError]]]
+        - indexes of the written operations and results
+    :return: Tuple[Optional[Dict[str, Any]], bool] - merged bulk api result
+        (None if a batch was not acknowledged) and if it has errors
+    """
+    merged: dict[str, Any] = dict.fromkeys(_MERGED_COUNTERS, 0)
+    merged.update(upserted=[], writeErrors=[], writeConcernErrors=[])
+    has_errors = False
+    for indexes, result in results:
+        if isinstance(result, BulkWriteError):
+            details = result.details
+            has_errors = True
+        elif result.acknowledged:
+            details = result.bulk_api_result
+        else:
+            return None, False
+        for counter in _MERGED_COUNTERS:
+            merged[counter] += details.get(counter, 0)
+        for key in ("upserted", "writeErrors"):
+            merged[key].extend(
+                {**item, "index": indexes[item["index"]]}
+                for item in details.get(key, ())
+            )
+        merged["writeConcernErrors"].extend(
+            details.get("writeConcernErrors", ())
+        )
+    for key in ("upserted", "writeErrors"):
+        merged[key].sort(key=lambda item: item["index"])
+    return merged, has_errors
+
+
+def convert_client_bulk_write_result(
+    result: ClientBulkWriteResult | ClientBulkWriteException,
+) -> BulkWriteResult | BulkWriteError:
+    """
+    Convert the result of the client-level bulk write
+    to the result of the collection-level one
+
+    :param result: Union[ClientBulkWriteResult, ClientBulkWriteException]
+        - verbose client-level result or error
+    :return: Union[BulkWriteResult, BulkWriteError]
+    """
+    if isinstance(result, ClientBulkWriteResult) and not result.acknowledged:
+        return BulkWriteResult({}, acknowledged=False)
+    details: Mapping[str, Any]
+    if isinstance(result, ClientBulkWriteResult):
+        details = result.bulk_api_result
+    else:
+        details = result.details
+    converted: dict[str, Any] = {
+        "nInserted": details.get("nInserted", 0),
+        "nUpserted": details.get("nUpserted", 0),
+        "nMatched": details.get("nMatched", 0),
+        "nModified": details.get("nModified", 0),
+        "nRemoved": details.get("nDeleted", 0),
+        "upserted": [
+            {"index": index, "_id": update_result.upserted_id}
+            for index, update_result in sorted(
+                (details.get("updateResults") or {}).items()
+            )
+            if update_result.upserted_id is not None
+        ],
+        "writeErrors": [
+            {
+                **{key: value for key, value in error.items() if key != "idx"},
+                "index": error["idx"],
+            }
+            for error in details.get("writeErrors") or ()
+        ],
+        "writeConcernErrors": list(details.get("writeConcernErrors") or ()),
+    }
+    if isinstance(result, ClientBulkWriteException):
+        return BulkWriteError(converted)
+    return BulkWriteResult(converted, acknowledged=True)
+
 
 class BulkWriter:
     """
@@ -54,8 +171,12 @@ class BulkWriter:
             auditing and debugging purposes.
         operations List[Union[DeleteMany, DeleteOne, InsertOne, ReplaceOne, UpdateMany, UpdateOne]]:
             A list of MongoDB operations queued for bulk execution.
+            Flushed operations are removed from it.
         object_class Type[Union[Document, UnionDoc]]:
-            The document model class associated with the operations.
+            The document model class associated with the first operation.
+
+    Operations can target different collections. They are sent with the
+    client-level bulk write on MongoDB 8.0+ or grouped by collection otherwise.
 
     Parameters:
         session Optional[AsyncClientSession]: The pymongo session for transaction support.
@@ -68,6 +189,12 @@ class BulkWriter:
         comment Optional[Any]: A custom comment attached to the bulk operation.
             Defaults to None.
         object_class Type[Union[Document, UnionDoc]]: The document model class associated with the operations.
+        max_operations Optional[int]: The queued operations are flushed in the background,
+            when there are this many of them. Defaults to None (flushed on commit only).
+        max_bytes Optional[int]: The queued operations are flushed in the background,
+            when their approximate BSON size reaches this number of bytes. Defaults to None.
+        max_concurrent_batches int: The maximum number of the flushed batches in flight.
+            Batches of an ordered writer are always written one by one. Defaults to 1.
     """
 
     def __init__(
@@ -77,16 +204,29 @@ class BulkWriter:
         object_class: type["Document"] | type["UnionDoc"] | None = None,
         bypass_document_validation: bool | None = False,
         comment: Any | None = None,
+        max_operations: int | None = None,
+        max_bytes: int | None = None,
+        max_concurrent_batches: int = 1,
     ) -> None:
+        if max_concurrent_batches < 1:
+            raise ValueError("max_concurrent_batches must be positive")
         self.operations: list[_WriteOp] = []
         self.session = session
         self.ordered = ordered
         self.object_class = object_class
         self.bypass_document_validation = bypass_document_validation
         self.comment = comment
-        self._collection_name: str | None = (
-            object_class.get_collection_name() if object_class else None
-        )
+        self.max_operations = max_operations
+        self.max_bytes = max_bytes
+        self.max_concurrent_batches = max_concurrent_batches
+        self._operation_classes: list[type[Document] | type[UnionDoc]] = []
+        self._operations_bytes = 0
+        self._flushed_count = 0
+        self._batches: list[asyncio.Task] = []
+        self._in_flight: set[asyncio.Task] = set()
+        self._results: list[_BulkResult] = []
+        self._error: BaseException | None = None
+        self._semaphore = asyncio.Semaphore(max_concurrent_batches)
 
     async def __aenter__(self) -> Self:
         return self
@@ -99,34 +239,253 @@ class BulkWriter:
     ) -> None:
         if exc_type is None:
             await self.commit()
+        elif self._batches:
+            # flushed batches are already sent
+            await asyncio.wait(self._batches)
+            self._reset()
+
+    def _reset(self) -> None:
+        self._flushed_count = 0
+        self._batches = []
+        self._results = []
+        self._error = None
+
+    @staticmethod
+    def _supports_client_bulk_write(
+        object_classes: list[type["Document"] | type["UnionDoc"]],
+        collections: list[AsyncCollection],
+    ) -> bool:
+        return len(
+            {id(collection.database.client) for collection in collections}
+        ) == 1 and all(
+            getattr(object_class, "_database_major_version", 0)
+            >= CLIENT_BULK_WRITE_MAJOR_VERSION
+            for object_class in set(object_classes)
+        )
+
+    async def _collection_bulk_write(
+        self,
+        collection: AsyncCollection,
+        operations: list[_WriteOp],
+        indexes: Sequence[int],
+    ) -> _BulkResult:
+        try:
+            result: (
+                BulkWriteResult | BulkWriteError
+            ) = await collection.bulk_write(
+                operations,
+                ordered=self.ordered,
+                bypass_document_validation=self.bypass_document_validation,
+                session=self.session,
+                comment=self.comment,
+            )
+        except BulkWriteError as e:
+            result = e
+        return indexes, result
+
+    async def _client_bulk_write(
+        self,
+        collections: list[AsyncCollection],
+        operations: list[_WriteOp],
+        indexes: Sequence[int],
+    ) -> _BulkResult:
+        models = []
+        for collection, operation in zip(collections, operations, strict=True):
+            model = copy.copy(operation)
+            model._namespace = collection.full_name
+            models.append(model)
+        client = collections[0].database.client
+        try:
+            result: (
+                ClientBulkWriteResult | ClientBulkWriteException
+            ) = await client.bulk_write(
+                models,
+                session=self.session,
+                ordered=self.ordered,
+                verbose_results=True,
+                bypass_document_validation=self.bypass_document_validation,
+                comment=self.comment,
+            )
+        except ClientBulkWriteException as e:
+            if e.error is not None:
+                raise
+            result = e
+        return indexes, convert_client_bulk_write_result(result)
+
+    async def _bulk_write(
+        self,
+        object_classes: list[type["Document"] | type["UnionDoc"]],
+        collections: list[AsyncCollection],
+        operations: list[_WriteOp],
+        indexes: Sequence[int],
+    ) -> list[_BulkResult]:
+        """
+        Write the operations of one or many collections.
+
+        Operations of many collections are sent with a single client-level
+        bulk write, if the server supports it. Otherwise, they are written
+        per collection: runs of the consecutive operations one by one for
+        an ordered writer, all the collections concurrently for an
+        unordered one
+        """
+        groups: dict[str, list[int]] = {}
+        for position, collection in enumerate(collections):
+            groups.setdefault(collection.full_name, []).append(position)
+        if len(groups) == 1:
+            return [
+                await self._collection_bulk_write(
+                    collections[0], operations, indexes
+                )
+            ]
+        if self._supports_client_bulk_write(object_classes, collections):
+            return [
+                await self._client_bulk_write(collections, operations, indexes)
+            ]
+        if not self.ordered:
+            return list(
+                await asyncio.gather(
+                    *(
+                        self._collection_bulk_write(
+                            collections[positions[0]],
+                            [operations[position] for position in positions],
+                            [indexes[position] for position in positions],
+                        )
+                        for positions in groups.values()
+                    )
+                )
+            )
+        results = []
+        start = 0
+        while start < len(operations):
+            end = start + 1
+            while (
+                end < len(operations)
+                and collections[end].full_name == collections[start].full_name
+            ):
+                end += 1
+            result = await self._collection_bulk_write(
+                collections[start], operations[start:end], indexes[start:end]
+            )
+            results.append(result)
+            if isinstance(result[1], BulkWriteError):
+                break
+            start = end
+        return results
+
+    async def _write_batch(
+        self,
+        batch: list[_WriteOp],
+        object_classes: list[type["Document"] | type["UnionDoc"]],
+        offset: int,
+        previous: asyncio.Task | None,
+    ) -> None:
+        if previous is not None:
+            await asyncio.wait([previous])
+            if self._error is not None or any(
+                isinstance(result, BulkWriteError)
+                for _, result in self._results
+            ):
+                # an ordered write stops at the first failure
+                return
+        collections = [
+            object_class.get_pymongo_collection()
+            for object_class in object_classes
+        ]
+        try:
+            async with self._semaphore:
+                self._results.extend(
+                    await self._bulk_write(
+                        object_classes,
+                        collections,
+                        batch,
+                        range(offset, offset + len(batch)),
+                    )
+                )
+        except Exception as e:
+            if self._error is None:
+                self._error = e
+        finally:
+            # a failed bulk write can be applied partially
+            for collection_name in {
+                object_class.get_collection_name()
+                for object_class in object_classes
+            }:
+                await CacheRegistry.invalidate(collection_name)
+
+    def _flush(self) -> None:
+        """
+        Send the queued operations in the background
+        """
+        batch, self.operations = self.operations, []
+        object_classes, self._operation_classes = self._operation_classes, []
+        if len(object_classes) != len(batch):
+            # the operations list was changed directly
+            object_classes = [self.object_class] * len(batch)  # type: ignore
+        self._operations_bytes = 0
+        previous = (
+            self._batches[-1] if self.ordered and self._batches else None
+        )
+        task = asyncio.ensure_future(
+            self._write_batch(
+                batch, object_classes, self._flushed_count, previous
+            )
+        )
+        self._flushed_count += len(batch)
+        self._batches.append(task)
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    def _is_full(self) -> bool:
+        return (
+            self.max_operations is not None
+            and len(self.operations) >= self.max_operations
+        ) or (
+            self.max_bytes is not None
+            and self._operations_bytes >= self.max_bytes
+        )
 
     async def commit(self) -> BulkWriteResult | None:
         """
         Commit all queued operations to the database.
 
-        Executes all queued operations in a single bulk write request. If there
+        Executes all queued operations in a single bulk write request and waits
+        for the batches, which were flushed in the background. If there
         are no operations to commit, it returns ``None``.
 
         :return: The result of the bulk write operation if operations are committed.
+                The results of all the flushed batches are merged into one.
                 Returns ``None`` if there are no operations to execute.
         :rtype: Optional[BulkWriteResult]
 
         :raises ValueError:
             If the object_class is not specified before committing.
+        :raises BulkWriteError:
+            If any of the batches failed. The error details are merged.
         """
-        if not self.operations:
+        if self.operations:
+            if not self.object_class:
+                raise ValueError(
+                    "The document model class must be specified before committing operations."
+                )
+            self._flush()
+        if not self._batches:
             return None
-        if not self.object_class:
-            raise ValueError(
-                "The document model class must be specified before committing operations."
-            )
-        return await self.object_class.get_pymongo_collection().bulk_write(
-            self.operations,
-            ordered=self.ordered,
-            bypass_document_validation=self.bypass_document_validation,
-            session=self.session,
-            comment=self.comment,
-        )
+        await asyncio.wait(self._batches)
+        results, error = self._results, self._error
+        self._reset()
+        if error is not None:
+            raise error
+        if len(results) == 1:
+            result = results[0][1]
+            if isinstance(result, BulkWriteError):
+                raise result
+            return result
+        merged, has_errors = merge_bulk_write_results(results)
+        if merged is None:
+            return BulkWriteResult({}, acknowledged=False)
+        if has_errors:
+            raise BulkWriteError(merged)
+        return BulkWriteResult(merged, acknowledged=True)
 
     def add_operation(
         self,
@@ -137,21 +496,42 @@ class BulkWriter:
         Add an operation to the queue.
 
         This method adds a MongoDB operation to the BulkWriter's operation queue.
-        All operations in the queue must belong to the same collection.
+        Operations in the queue can belong to different collections.
+        If the queue reaches ``max_operations`` or ``max_bytes``,
+        it is flushed in the background.
 
         :param object_class: Type[Union[Document, UnionDoc]]
             The document model class associated with the operation.
         :param operation: Union[DeleteMany, DeleteOne, InsertOne, ReplaceOne, UpdateMany, UpdateOne]
             The MongoDB operation to add to the queue.
-        :raises ValueError:
-            If the collection differs from the one already associated with the BulkWriter.
         """
         if self.object_class is None:
             self.object_class = object_class
-            self._collection_name = object_class.get_collection_name()
-        else:
-            if object_class.get_collection_name() != self._collection_name:
-                raise ValueError(
-                    "All the operations should be for a same collection name"
-                )
         self.operations.append(operation)
+        self._operation_classes.append(object_class)
+        if self.max_bytes is not None:
+            self._operations_bytes += get_operation_size(operation)
+        if self._is_full():
+            self._flush()
+
+    async def queue_operation(
+        self,
+        object_class: type["Document"] | type["UnionDoc"],
+        operation: _WriteOp,
+    ) -> None:
+        """
+        Add an operation to the queue and wait, while there are
+        more than ``max_concurrent_batches`` batches in flight.
+        It keeps the memory flat, when the operations are produced
+        faster than they are written
+
+        :param object_class: Type[Union[Document, UnionDoc]]
+            The document model class associated with the operation.
+        :param operation: Union[DeleteMany, DeleteOne, InsertOne, ReplaceOne, UpdateMany, UpdateOne]
+            The MongoDB operation to add to the queue.
+        """
+        self.add_operation(object_class, operation)
+        while len(self._in_flight) > self.max_concurrent_batches:
+            await asyncio.wait(
+                self._in_flight, return_when=asyncio.FIRST_COMPLETED
+            )
@@ -0,0 +1,13 @@
+from beanie.odm.cache.base import CacheBackend, CacheRegistry
+from beanie.odm.cache.lru import CacheEntry, LRUCache
+from beanie.odm.cache.redis import RedisCache
+from beanie.odm.cache.shared_memory import SharedMemoryCache
+
+__all__ = [
+    "CacheBackend",
+    "CacheRegistry",
+    "CacheEntry",
+    "LRUCache",
+    "RedisCache",
+    "SharedMemoryCache",
+]
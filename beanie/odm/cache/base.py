@@ -0,0 +1,90 @@
+import weakref
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import Any
+
+from bson.codec_options import CodecOptions
+
+from beanie.odm.cache.key import create_key
+
+
+class CacheBackend(ABC):
+    """
+    Storage of the query results.
+    Values are stored by the collection name and the cache key,
+    so all the values of a collection can be invalidated at once
+    """
+
+    @abstractmethod
+    async def get(self, collection: str, key: str) -> Any | None:
+        """
+        Get the cached value
+
+        :param collection: str - collection name
+        :param key: str - cache key
+        :return: Any - value or None if it is missing or expired
+        """
+
+    @abstractmethod
+    async def set(self, collection: str, key: str, value: Any) -> None:
+        """
+        Cache the value
+
+        :param collection: str - collection name
+        :param key: str - cache key
+        :param value: Any - value to cache
+        :return: None
+        """
+
+    @abstractmethod
+    async def invalidate(self, collection: str) -> None:
+        """
+        Drop all the cached values of the collection
+
+        :param collection: str - collection name
+        :return: None
+        """
+
+    def register_collection(
+        self, collection: str, codec_options: CodecOptions
+    ) -> None:
+        """
+        Called for every collection, which uses the cache.
+        Backends, which serialize the values, use the codec options
+        to store and restore them as the collection returns them
+
+        :param collection: str - collection name
+        :param codec_options: CodecOptions - codec options of the collection
+        :return: None
+        """
+        return None
+
+    @staticmethod
+    def create_key(query: Mapping[str, Any]) -> str:
+        return create_key(query)
+
+
+class CacheRegistry:
+    """
+    Caches of the collections. Beanie write operations
+    invalidate the caches of the written collection
+    """
+
+    _registry: dict[str, "weakref.WeakSet[CacheBackend]"] = {}
+
+    @classmethod
+    def register(cls, collection: str, cache: CacheBackend) -> None:
+        cls._registry.setdefault(collection, weakref.WeakSet()).add(cache)
+
+    @classmethod
+    async def invalidate(cls, collection: str | None) -> None:
+        """
+        Invalidate all the caches of the collection
+
+        :param collection: Optional[str] - collection name
+        :return: None
+        """
+        caches = cls._registry.get(collection) if collection else None
+        if caches:
+            for cache in list(caches):
+                await cache.invalidate(collection)  # type: ignore
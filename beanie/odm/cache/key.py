@@ -0,0 +1,84 @@
+import hashlib
+from collections.abc import Mapping
+from typing import Any
+
+import bson
+from bson.codec_options import CodecOptions, TypeRegistry
+
+# operators, which take the lists of the queries
+_QUERY_LIST_OPERATORS = frozenset({"$and", "$or", "$nor"})
+
+# values, which can not be encoded, are fingerprinted by their repr
+_KEY_CODEC_OPTIONS: CodecOptions = CodecOptions(
+    type_registry=TypeRegistry(fallback_encoder=repr)
+)
+
+
+def _is_operator_map(value: Any) -> bool:
+    return (
+        isinstance(value, Mapping)
+        and len(value) > 0
+        and all(str(key).startswith("$") for key in value)
+    )
+
+
+def _normalize_operators(operators: Mapping[str, Any]) -> dict[str, Any]:
+    # the operators of a field are ANDed. Their values are compared
+    # as is, as the field order of the embedded documents matters
+    items = []
+    for key, value in operators.items():
+        if key == "$elemMatch" and isinstance(value, Mapping):
+            value = (
+                _normalize_operators(value)
+                if _is_operator_map(value)
+                else _normalize_query(value)
+            )
+        elif key == "$not" and _is_operator_map(value):
+            value = _normalize_operators(value)
+        items.append((str(key), value))
+    items.sort(key=lambda pair: pair[0])
+    return dict(items)
+
+
+def _normalize_query(query: Mapping[str, Any]) -> dict[str, Any]:
+    # the fields of the query are ANDed, so their order doesn't matter
+    items = []
+    for key, value in query.items():
+        key = str(key)
+        if key in _QUERY_LIST_OPERATORS and isinstance(value, list):
+            value = [
+                _normalize_query(item) if isinstance(item, Mapping) else item
+                for item in value
+            ]
+        elif not key.startswith("$") and _is_operator_map(value):
+            value = _normalize_operators(value)
+        items.append((key, value))
+    items.sort(key=lambda pair: pair[0])
+    return dict(items)
+
+
+def create_key(query: Mapping[str, Any]) -> str:
+    """
+    Fingerprint of the query.
+    The fields of the query description and of its `filter` query
+    are sorted, so the order, in which they were added, does not change
+    the key. The operators of the filter fields are sorted too.
+    Everything else, e.g. the embedded documents, the lists
+    and the pipeline stages, keeps its order, as it matters for MongoDB.
+    The normalized query is encoded to BSON and hashed
+
+    :param query: Mapping[str, Any] - query description
+    :return: str
+    """
+    normalized = {
+        str(key): _normalize_query(value)
+        if key == "filter" and isinstance(value, Mapping)
+        else value
+        for key, value in query.items()
+    }
+    return hashlib.blake2b(
+        bson.encode(
+            dict(sorted(normalized.items())), codec_options=_KEY_CODEC_OPTIONS
+        ),
+        digest_size=16,
+    ).hexdigest()
@@ -0,0 +1,114 @@
+import collections
+from dataclasses import dataclass
+from datetime import timedelta
+from time import monotonic
+from typing import Any
+
+from beanie.odm.cache.base import CacheBackend
+from beanie.odm.utils.size import get_approximate_size
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    value: Any
+    expires_at: float
+    size: int
+
+
+class LRUCache(CacheBackend):
+    """
+    In-process LRU cache with expiration time.
+
+    Entries are evicted when there are more than `capacity` of them
+    or, if `max_bytes` is set, when their approximate size exceeds it.
+    Expiration uses the monotonic clock
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        expiration_time: timedelta,
+        max_bytes: int | None = None,
+    ):
+        """
+        :param capacity: int - max number of the cached values
+        :param expiration_time: timedelta - expiration time of the values
+        :param max_bytes: Optional[int] - max approximate size
+        of the cached values. Default None - not limited
+        """
+        self.capacity: int = capacity
+        self.expiration_time: timedelta = expiration_time
+        self.max_bytes = max_bytes
+        self.cache: collections.OrderedDict[tuple[str, str], CacheEntry] = (
+            collections.OrderedDict()
+        )
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._ttl = expiration_time.total_seconds()
+
+    def _remove(self, cache_key: tuple[str, str]) -> None:
+        self.current_bytes -= self.cache.pop(cache_key).size
+
+    async def get(self, collection: str, key: str) -> Any | None:
+        cache_key = (collection, key)
+        entry = self.cache.get(cache_key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if monotonic() > entry.expires_at:
+            self._remove(cache_key)
+            self.misses += 1
+            return None
+        self.cache.move_to_end(cache_key)
+        self.hits += 1
+        return entry.value
+
+    async def set(self, collection: str, key: str, value: Any) -> None:
+        cache_key = (collection, key)
+        # the previous value is stale, even if the new one is not cached
+        if cache_key in self.cache:
+            self._remove(cache_key)
+        size = 0
+        if self.max_bytes is not None:
+            size = get_approximate_size(value)
+            if size > self.max_bytes:
+                return
+        while self.cache and (
+            len(self.cache) >= self.capacity
+            or (
+                self.max_bytes is not None
+                and self.current_bytes + size > self.max_bytes
+            )
+        ):
+            self.current_bytes -= self.cache.popitem(last=False)[1].size
+            self.evictions += 1
+        self.cache[cache_key] = CacheEntry(
+            value, monotonic() + self._ttl, size
+        )
+        self.current_bytes += size
+
+    async def invalidate(self, collection: str) -> None:
+        for cache_key in [
+            cache_key for cache_key in self.cache if cache_key[0] == collection
+        ]:
+            self._remove(cache_key)
+
+    def clear(self) -> None:
+        self.cache.clear()
+        self.current_bytes = 0
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Counters of the cache, e.g. to export them to the metrics
+
+        :return: Dict[str, int]
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.cache),
+            "bytes": self.current_bytes,
+        }
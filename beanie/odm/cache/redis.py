@@ -0,0 +1,115 @@
+from contextvars import ContextVar
+from datetime import timedelta
+from typing import Any
+
+import bson
+from bson.codec_options import DEFAULT_CODEC_OPTIONS, CodecOptions
+
+from beanie.odm.cache.base import CacheBackend
+
+# versions of the collections, which were read by the cache misses
+# of the current context. The mapping is replaced, not changed,
+# so the child tasks do not share it
+_MISS_VERSIONS: ContextVar[dict[tuple[int, str, str], int] | None] = (
+    ContextVar("beanie_redis_cache_miss_versions", default=None)
+)
+
+
+class RedisCache(CacheBackend):
+    """
+    Cache, which is stored in Redis and shared by the processes.
+
+    It works over any asyncio client with the `redis.asyncio.Redis`
+    interface (`get`, `set`, `incr`).
+    Every value is a separate Redis key with its own expiration time.
+    Values are encoded as BSON with the codec options of the collection,
+    so only the BSON encodable values are cached and they are restored
+    as the collection returns them.
+
+    Keys of the values contain the version of the collection.
+    The invalidation increments the version, so the old values
+    are not read anymore and expire. A value, which was fetched
+    after a cache miss, is stored with the version of the miss,
+    so the value read before a concurrent write is not
+    stored as the current one
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        expiration_time: timedelta = timedelta(minutes=10),
+        prefix: str = "beanie:cache",
+    ):
+        """
+        :param client: redis.asyncio.Redis compatible client
+        :param expiration_time: timedelta - expiration time of the values
+        :param prefix: str - prefix of the Redis keys
+        """
+        self.client = client
+        self.expiration_time = expiration_time
+        self.prefix = prefix
+        self.codec_options: dict[str, CodecOptions] = {}
+
+    def register_collection(
+        self, collection: str, codec_options: CodecOptions
+    ) -> None:
+        self.codec_options[collection] = codec_options
+
+    def _get_codec_options(self, collection: str) -> CodecOptions:
+        return self.codec_options.get(collection, DEFAULT_CODEC_OPTIONS)
+
+    def _get_version_name(self, collection: str) -> str:
+        return f"{self.prefix}:{collection}:version"
+
+    def _get_name(self, collection: str, version: int, key: str) -> str:
+        return f"{self.prefix}:{collection}:{version}:{key}"
+
+    async def _get_version(self, collection: str) -> int:
+        version = await self.client.get(self._get_version_name(collection))
+        return 0 if version is None else int(version)
+
+    async def get(self, collection: str, key: str) -> Any | None:
+        version = await self._get_version(collection)
+        data = await self.client.get(self._get_name(collection, version, key))
+        if data is None:
+            _MISS_VERSIONS.set(
+                {
+                    **(_MISS_VERSIONS.get() or {}),
+                    (id(self), collection, key): version,
+                }
+            )
+            return None
+        return bson.decode(
+            data, codec_options=self._get_codec_options(collection)
+        )["value"]
+
+    async def set(self, collection: str, key: str, value: Any) -> None:
+        versions = _MISS_VERSIONS.get() or {}
+        miss = (id(self), collection, key)
+        if miss in versions:
+            version = versions[miss]
+            _MISS_VERSIONS.set(
+                {
+                    item: item_version
+                    for item, item_version in versions.items()
+                    if item != miss
+                }
+            )
+        else:
+            version = await self._get_version(collection)
+        try:
+            data = bson.encode(
+                {"value": value},
+                codec_options=self._get_codec_options(collection),
+            )
+        except Exception:
+            # not BSON encodable with the options of the collection
+            return
+        await self.client.set(
+            self._get_name(collection, version, key),
+            data,
+            ex=max(int(self.expiration_time.total_seconds()), 1),
+        )
+
+    async def invalidate(self, collection: str) -> None:
+        await self.client.incr(self._get_version_name(collection))
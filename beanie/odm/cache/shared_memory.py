@@ -0,0 +1,179 @@
+import hashlib
+import os
+import pickle
+import struct
+import sys
+import time
+import zlib
+from datetime import timedelta
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+from beanie.odm.cache.base import CacheBackend
+
+# number of the collection generation counters
+GENERATIONS = 256
+
+_GENERATION = struct.Struct("<Q")
+# sequence, key digest, collection generation, timestamp, length, checksum
+_SLOT_HEADER = struct.Struct("<Q16sQdII")
+# blocks, which were created by the current process,
+# they are tracked by its resource tracker
+_CREATED: set[str] = set()
+
+
+class SharedMemoryCache(CacheBackend):
+    """
+    Cache, which is stored in a shared memory block
+    and shared by the processes of the host.
+
+    The block is a direct mapped table of fixed size slots,
+    a value replaces the value of the other key in the same slot.
+    Slots are written without locks: a reader, which sees a slot
+    being changed or a broken value, gets a miss.
+    Invalidation increments the generation counter of the collection,
+    values of the previous generations are ignored
+    """
+
+    def __init__(
+        self,
+        name: str,
+        slots: int = 1024,
+        slot_size: int = 16 * 1024,
+        expiration_time: timedelta = timedelta(minutes=10),
+    ):
+        """
+        :param name: str - name of the shared memory block.
+        The block is created if it does not exist
+        :param slots: int - number of the slots
+        :param slot_size: int - size of a slot in bytes.
+        Bigger values are not cached
+        :param expiration_time: timedelta - expiration time of the values
+        """
+        if slot_size <= _SLOT_HEADER.size:
+            raise ValueError(
+                f"slot_size must be greater than {_SLOT_HEADER.size}"
+            )
+        self.slots = slots
+        self.slot_size = slot_size
+        self.expiration_time = expiration_time
+        size = GENERATIONS * _GENERATION.size + slots * slot_size
+        try:
+            self.shared_memory = SharedMemory(
+                name=name, create=True, size=size
+            )
+            _CREATED.add(name)
+        except FileExistsError:
+            self.shared_memory = self._attach(name)
+            if self.shared_memory.size < size:
+                self.shared_memory.close()
+                raise ValueError(
+                    f"Shared memory block {name} is smaller than {size} bytes"
+                )
+        buffer = self.shared_memory.buf
+        assert buffer is not None
+        self._buffer: memoryview = buffer
+
+    @staticmethod
+    def _attach(name: str) -> SharedMemory:
+        # the block is owned by the process, which created it.
+        # The resource tracker of an attached process must not
+        # unlink the block, when the process exits
+        if sys.version_info >= (3, 13):
+            return SharedMemory(name=name, track=False)
+        shared_memory = SharedMemory(name=name)
+        if os.name == "posix" and name not in _CREATED:
+            resource_tracker.unregister(
+                shared_memory._name,  # type: ignore[attr-defined]
+                "shared_memory",
+            )
+        return shared_memory
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory block
+        """
+        self.shared_memory.close()
+
+    def unlink(self) -> None:
+        """
+        Destroy the shared memory block
+        """
+        self.shared_memory.unlink()
+        _CREATED.discard(self.shared_memory.name)
+
+    @staticmethod
+    def _get_generation_offset(collection: str) -> int:
+        return (
+            zlib.crc32(collection.encode()) % GENERATIONS
+        ) * _GENERATION.size
+
+    def _get_generation(self, collection: str) -> int:
+        return _GENERATION.unpack_from(
+            self._buffer, self._get_generation_offset(collection)
+        )[0]
+
+    def _get_slot(self, collection: str, key: str) -> tuple[bytes, int]:
+        digest = hashlib.blake2b(
+            f"{collection}\0{key}".encode(), digest_size=16
+        ).digest()
+        slot = int.from_bytes(digest[:8], "little") % self.slots
+        return (
+            digest,
+            GENERATIONS * _GENERATION.size + slot * self.slot_size,
+        )
+
+    async def get(self, collection: str, key: str) -> Any | None:
+        digest, offset = self._get_slot(collection, key)
+        (
+            sequence,
+            slot_digest,
+            generation,
+            timestamp,
+            length,
+            checksum,
+        ) = _SLOT_HEADER.unpack_from(self._buffer, offset)
+        if (
+            sequence % 2
+            or slot_digest != digest
+            or generation != self._get_generation(collection)
+            or time.time() - timestamp > self.expiration_time.total_seconds()
+            or length > self.slot_size - _SLOT_HEADER.size
+        ):
+            return None
+        start = offset + _SLOT_HEADER.size
+        data = bytes(self._buffer[start : start + length])
+        if (
+            _GENERATION.unpack_from(self._buffer, offset)[0] != sequence
+            or zlib.crc32(data) != checksum
+        ):
+            return None
+        return pickle.loads(data)
+
+    async def set(self, collection: str, key: str, value: Any) -> None:
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.slot_size - _SLOT_HEADER.size:
+            return
+        digest, offset = self._get_slot(collection, key)
+        sequence = _GENERATION.unpack_from(self._buffer, offset)[0]
+        sequence += 1 if sequence % 2 == 0 else 2
+        # odd sequence marks the slot as being written
+        _GENERATION.pack_into(self._buffer, offset, sequence)
+        start = offset + _SLOT_HEADER.size
+        self._buffer[start : start + len(data)] = data
+        _SLOT_HEADER.pack_into(
+            self._buffer,
+            offset,
+            sequence + 1,
+            digest,
+            self._get_generation(collection),
+            time.time(),
+            len(data),
+            zlib.crc32(data),
+        )
+
+    async def invalidate(self, collection: str) -> None:
+        offset = self._get_generation_offset(collection)
+        generation = _GENERATION.unpack_from(self._buffer, offset)[0]
+        _GENERATION.pack_into(self._buffer, offset, (generation + 1) % 2**64)
@@ -1,6 +1,10 @@
 import asyncio
+import itertools
 import warnings
-from collections.abc import Callable, Coroutine, Iterable, Mapping
+from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from concurrent.futures import Executor
+from copy import copy, deepcopy
 from datetime import datetime, timezone
 from enum import Enum
 from typing import (
@@ -22,16 +26,18 @@ from pydantic import (
     model_validator,
 )
 from pydantic.main import BaseModel
-from pymongo import InsertOne
+from pymongo import InsertOne, ReplaceOne, UpdateOne
 from pymongo.asynchronous.client_session import AsyncClientSession
-from pymongo.errors import DuplicateKeyError
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 from pymongo.results import (
     DeleteResult,
     InsertManyResult,
+    UpdateResult,
 )
 from typing_extensions import ParamSpec, Self
 
 from beanie.exceptions import (
+    ApplyChangesException,
     CollectionWasNotInitialized,
     DocumentNotFound,
     DocumentWasNotSaved,
@@ -46,8 +52,12 @@ from beanie.odm.actions import (
     wrap_with_actions,
 )
 from beanie.odm.bulk import BulkWriter
-from beanie.odm.cache import LRUCache
-from beanie.odm.enums import SortDirection
+from beanie.odm.cache import CacheBackend, CacheRegistry
+from beanie.odm.enums import (
+    FetchLinksStrategy,
+    SortDirection,
+    UpsertStatus,
+)
 from beanie.odm.fields import (
     BackLink,
     DeleteRules,
@@ -64,6 +74,7 @@ from beanie.odm.interfaces.find import FindInterface
 from beanie.odm.interfaces.getters import OtherGettersInterface
 from beanie.odm.interfaces.inheritance import InheritanceInterface
 from beanie.odm.interfaces.setters import SettersInterface
+from beanie.odm.loader import LinkLoader
 from beanie.odm.models import (
     InspectionError,
     InspectionResult,
@@ -82,7 +93,14 @@ from beanie.odm.operators.update.general import (
 from beanie.odm.queries.find import FindMany, FindOne
 from beanie.odm.queries.update import UpdateMany, UpdateResponse
 from beanie.odm.settings.document import DocumentSettings
-from beanie.odm.utils.dump import get_dict, get_top_level_nones
+from beanie.odm.utils.dump import (
+    encode_batch,
+    get_by_path,
+    get_dict,
+    get_top_level_nones,
+    split_by_paths,
+)
+from beanie.odm.utils.encoder import Encoder, get_encoding_plan
 from beanie.odm.utils.parsing import apply_changes, merge_models
 from beanie.odm.utils.pydantic import (
     get_extra_field_info,
@@ -93,12 +111,23 @@ from beanie.odm.utils.pydantic import (
     parse_object_as,
 )
 from beanie.odm.utils.self_validation import validate_self_before
+from beanie.odm.utils.snapshot import (
+    build_state,
+    get_state_source,
+    share_subtrees,
+)
 from beanie.odm.utils.state import (
+    check_if_state_saved,
     previous_saved_state_needed,
     save_state_after,
     saved_state_needed,
 )
+from beanie.odm.utils.tracking import ChangeTracker, track
 from beanie.odm.utils.typing import extract_id_class
+from beanie.odm.utils.update_apply import (
+    SERVER_SIDE_OPERATORS,
+    get_document_update_values,
+)
 from beanie.odm.utils.update_merge import merge_update_expressions
 
 if TYPE_CHECKING:
@@ -134,6 +163,25 @@ def document_alias_generator(s: str) -> str:
     return s
 
 
+# the state management attributes are not a part of the document value
+_STATE_ATTRIBUTES = frozenset(
+    {
+        "_saved_state",
+        "_saved_state_source",
+        "_previous_saved_state",
+        "_change_tracker",
+    }
+)
+
+
+def _get_compared_private(document: "Document") -> dict[str, Any]:
+    return {
+        name: value
+        for name, value in (document.__pydantic_private__ or {}).items()
+        if name not in _STATE_ATTRIBUTES
+    }
+
+
 class MergeStrategy(str, Enum):
     local = "local"
     remote = "remote"
@@ -170,23 +218,52 @@ class Document(
     revision_id: UUID | None = Field(default=None, exclude=True)
     _saved_state: dict[str, Any] | None = PrivateAttr(default=None)
     _previous_saved_state: dict[str, Any] | None = PrivateAttr(default=None)
+    _saved_state_source: bytes | None = PrivateAttr(default=None)
+    _change_tracker: ChangeTracker | None = PrivateAttr(default=None)
+    _track_changes: ClassVar[bool] = False
 
     # Relations
     _link_fields: ClassVar[dict[str, LinkInfo] | None] = None
 
     # Cache
-    _cache: ClassVar[LRUCache | None] = None
+    _cache: ClassVar[CacheBackend | None] = None
 
     # Settings
     _document_settings: ClassVar[DocumentSettings | None] = None
 
     # Database
     _database_major_version: ClassVar[int] = 4
+    _parse_executor: ClassVar[Executor | None] = None
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.get_pymongo_collection()
 
+    def model_post_init(self, context: Any, /) -> None:
+        if self._track_changes:
+            self._change_tracker = track(self)
+
+    def __copy__(self) -> Self:
+        copied = super().__copy__()
+        # the copy shares the tracked containers with the original,
+        # so it is compared with the saved state as a whole
+        if copied.__pydantic_private__:
+            copied.__pydantic_private__["_change_tracker"] = None
+        return copied
+
+    def _mark_changed(self, name: str, value: Any) -> None:
+        """
+        Record the assignment of the field, if the changes are tracked
+        :param name: str - field name
+        :param value: Any - assigned value
+        :return: None
+        """
+        private = self.__pydantic_private__
+        if private and not name.startswith("_"):
+            tracker = private.get("_change_tracker")
+            if tracker is not None:
+                tracker.assign(self, name, value)
+
     @classmethod
     def _fill_back_refs(cls, values):
         if cls._link_fields:
@@ -222,6 +299,7 @@ class Document(
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
         with_children: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
@@ -233,6 +311,9 @@ class Document(
         :param document_id: PydanticObjectId - document id
         :param session: Optional[AsyncClientSession] - pymongo session
         :param ignore_cache: bool - ignore cache (if it is turned on)
+        :param fetch_links_strategy: Optional[FetchLinksStrategy] - how to
+            fetch the links: with `$lookup` stages or with batched `$in`
+            queries
         :param **pymongo_kwargs: pymongo native parameters for find operation
         :return: Union["Document", None]
         """
@@ -249,6 +330,7 @@ class Document(
             session=session,
             ignore_cache=ignore_cache,
             fetch_links=fetch_links,
+            fetch_links_strategy=fetch_links_strategy,
             with_children=with_children,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
@@ -342,6 +424,7 @@ class Document(
             ),
             session=session,
         )
+        await CacheRegistry.invalidate(self.get_collection_name())
         new_id = result.inserted_id
         if not isinstance(
             new_id,
@@ -390,7 +473,7 @@ class Document(
                 raise NotSupported(
                     "Cascade insert with bulk writing not supported"
                 )
-            bulk_writer.add_operation(
+            await bulk_writer.queue_operation(
                 type(document),
                 InsertOne(
                     get_dict(
@@ -408,31 +491,106 @@ class Document(
         documents: Iterable[DocType],
         session: AsyncClientSession | None = None,
         link_rule: WriteRules = WriteRules.DO_NOTHING,
+        chunk_size: int | None = None,
+        executor: Executor | None = None,
+        run_actions: bool = False,
+        save_state: bool = False,
         **pymongo_kwargs: Any,
     ) -> InsertManyResult:
         """
-        Insert many documents to the collection
+        Insert many documents to the collection.
+        Ids of the inserted documents are set to the documents
 
-        :param documents:  List["Document"] - documents to insert
+        :param documents:  Iterable["Document"] - documents to insert
         :param session: AsyncClientSession - pymongo session
         :param link_rule: InsertRules - how to manage link fields
+        :param chunk_size: Optional[int] - insert the documents by chunks
+            of this size. The iterable is consumed lazily and the next chunk
+            is encoded while the previous one is being inserted.
+            Default None - all the documents are inserted at once
+        :param executor: Optional[Executor] - executor to encode
+            the chunks with
+        :param run_actions: bool - validate the documents and run
+            the INSERT actions, like `insert` does
+        :param save_state: bool - save the state of the inserted documents
+        :param pymongo_kwargs: pymongo native parameters for insert operation
         :return: InsertManyResult
         """
         if link_rule == WriteRules.WRITE:
             raise NotSupported(
                 "Cascade insert not supported for insert many method"
             )
-        documents_list = [
-            get_dict(
-                document,
-                to_db=True,
-                keep_nulls=document.get_settings().keep_nulls,
-            )
-            for document in documents
-        ]
-        return await cls.get_pymongo_collection().insert_many(
-            documents_list, session=session, **pymongo_kwargs
-        )
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        collection = cls.get_pymongo_collection()
+        loop = asyncio.get_running_loop()
+        id_type = get_field_type(get_model_fields(cls)["id"])
+        id_class = extract_id_class(id_type)
+        iterator = iter(documents)
+        inserted_ids: list[Any] = []
+        acknowledged = True
+
+        async def finish_chunk(
+            chunk: list[DocType], insertion: "asyncio.Future[InsertManyResult]"
+        ) -> None:
+            nonlocal acknowledged
+            result = await insertion
+            acknowledged = acknowledged and result.acknowledged
+            for document, new_id in zip(
+                chunk, result.inserted_ids, strict=True
+            ):
+                if not isinstance(new_id, id_class):
+                    new_id = parse_object_as(id_type, new_id)
+                document.id = new_id
+                inserted_ids.append(new_id)
+            if save_state:
+                for document in chunk:
+                    document._save_state()
+            if run_actions:
+                await ActionRegistry.run_actions_all(
+                    chunk, EventTypes.INSERT, ActionDirections.AFTER, []
+                )
+
+        pending: tuple[list[DocType], asyncio.Future[InsertManyResult]] | None
+        pending = None
+        try:
+            while chunk := list(itertools.islice(iterator, chunk_size)):
+                if run_actions:
+                    await asyncio.gather(
+                        *(document.validate_self() for document in chunk)
+                    )
+                    await ActionRegistry.run_actions_all(
+                        chunk, EventTypes.INSERT, ActionDirections.BEFORE, []
+                    )
+                for document in chunk:
+                    if document.get_settings().use_revision:
+                        document.revision_id = uuid4()
+                if executor is None:
+                    encoded = encode_batch(chunk)
+                else:
+                    encoded = await loop.run_in_executor(
+                        executor, encode_batch, chunk
+                    )
+                if pending is not None:
+                    await finish_chunk(*pending)
+                    pending = None
+                pending = (
+                    chunk,
+                    asyncio.ensure_future(
+                        collection.insert_many(
+                            encoded, session=session, **pymongo_kwargs
+                        )
+                    ),
+                )
+            if pending is not None:
+                await finish_chunk(*pending)
+                pending = None
+        finally:
+            if pending is not None:
+                # do not leave the insertion of the previous chunk behind
+                await asyncio.gather(pending[1], return_exceptions=True)
+            await CacheRegistry.invalidate(cls.get_collection_name())
+        return InsertManyResult(inserted_ids, acknowledged)
 
     @validate_self_before
     @wrap_with_actions(EventTypes.REPLACE)
@@ -626,7 +784,9 @@ class Document(
         changes = self.get_changes()
         if self.get_settings().keep_nulls is False:
             arguments: list[SetOperator | Unset] = [SetOperator(changes)]
-            nones = get_top_level_nones(self)
+            nones = get_top_level_nones(
+                self, fields=self._get_fields_to_check()
+            )
             if nones:
                 arguments.append(Unset(nones))
             return await self.update(
@@ -661,11 +821,412 @@ class Document(
             raise ReplaceError(
                 "Some of the documents are not exist in the collection"
             )
-        async with BulkWriter(session=session) as bulk_writer:
-            for document in documents:
-                await document.replace(
-                    bulk_writer=bulk_writer, session=session
+        await cls.replace_all(documents, session=session)
+
+    def _get_write_filter(self, ignore_revision: bool) -> dict[str, Any]:
+        find_query: dict[str, Any] = {"_id": self.id}
+        if self.get_settings().use_revision and not ignore_revision:
+            find_query["revision_id"] = self.revision_id
+        return Encoder(
+            custom_encoders=self.get_settings().bson_encoders
+        ).encode(find_query)
+
+    def _get_write_update(
+        self, update: dict[str, Any], fields: AbstractSet[str] | None = None
+    ) -> dict[str, Any]:
+        if self.get_settings().keep_nulls is False:
+            nones = get_top_level_nones(self, fields=fields)
+            if nones:
+                update.update(Unset(nones).query)
+        if self.get_settings().use_revision:
+            self.revision_id = uuid4()
+            update.setdefault("$set", {})["revision_id"] = self.revision_id
+        return Encoder(
+            custom_encoders=self.get_settings().bson_encoders
+        ).encode(update)
+
+    @classmethod
+    async def _write_all(
+        cls,
+        documents: Sequence["Document"],
+        operations: Sequence[InsertOne | UpdateOne | ReplaceOne],
+        ignore_revision: bool,
+        session: AsyncClientSession | None,
+        bulk_writer: BulkWriter | None,
+    ) -> None:
+        """
+        Write the operations of the documents with a single bulk write.
+        The operations are only queued, if the bulk writer is provided
+        """
+        if bulk_writer is not None:
+            for document, operation in zip(documents, operations, strict=True):
+                await bulk_writer.queue_operation(type(document), operation)
+            return
+        check_revision = (
+            cls.get_settings().use_revision and not ignore_revision
+        )
+        writer = BulkWriter(session=session)
+        for document, operation in zip(documents, operations, strict=True):
+            writer.add_operation(type(document), operation)
+        try:
+            result = await writer.commit()
+        except BulkWriteError as e:
+            # see `update` about the duplicate key errors on the upserts
+            if check_revision and any(
+                error.get("code") == 11000
+                and (
+                    "_id" in error.get("keyPattern", {})
+                    or "revision_id" in error.get("keyPattern", {})
+                )
+                for error in e.details.get("writeErrors", [])
+            ):
+                raise RevisionIdWasChanged
+            raise
+        if (
+            result is not None
+            and result.acknowledged
+            and result.inserted_count
+            + result.matched_count
+            + result.upserted_count
+            < len(operations)
+        ):
+            if check_revision:
+                raise RevisionIdWasChanged
+            raise DocumentNotFound
+
+    @classmethod
+    async def save_all(
+        cls: type[DocType],
+        documents: list[DocType],
+        ignore_revision: bool = False,
+        session: AsyncClientSession | None = None,
+        bulk_writer: BulkWriter | None = None,
+        skip_actions: list[ActionDirections | str] | None = None,
+    ) -> list[DocType]:
+        """
+        Update the existing documents in the database or
+        insert them if they do not exist yet.
+        All the documents are written with a single bulk write.
+        Documents without ids are inserted and get the generated ids,
+        like with `insert_many`. The queued ones keep None
+
+        :param documents: List["Document"] - documents to save
+        :param ignore_revision: bool - do force save
+        :param session: Optional[AsyncClientSession] - pymongo session
+        :param bulk_writer: "BulkWriter" - Beanie bulk writer
+        :param skip_actions: Optional[List[Union[ActionDirections, str]]]
+            - actions to skip
+        :return: List["Document"]
+        """
+        if not documents:
+            return []
+        skip_actions = skip_actions or []
+        await asyncio.gather(
+            *(
+                document.validate_self(skip_actions=skip_actions)
+                for document in documents
+            )
+        )
+        for event_type in (EventTypes.SAVE, EventTypes.UPDATE):
+            await ActionRegistry.run_actions_all(
+                documents, event_type, ActionDirections.BEFORE, skip_actions
+            )
+        operations: list[InsertOne | UpdateOne | ReplaceOne] = []
+        inserted: list[tuple[DocType, dict[str, Any]]] = []
+        for document in documents:
+            if document.id is None:
+                if document.get_settings().use_revision:
+                    document.revision_id = uuid4()
+                data = get_dict(
+                    document,
+                    to_db=True,
+                    keep_nulls=document.get_settings().keep_nulls,
+                )
+                inserted.append((document, data))
+                operations.append(InsertOne(data))
+                continue
+            operations.append(
+                UpdateOne(
+                    document._get_write_filter(ignore_revision),
+                    document._get_write_update(
+                        {
+                            "$set": get_dict(
+                                document,
+                                to_db=True,
+                                keep_nulls=document.get_settings().keep_nulls,
+                            )
+                        }
+                    ),
+                    upsert=True,
+                )
+            )
+        await cls._write_all(
+            documents, operations, ignore_revision, session, bulk_writer
+        )
+        id_type = get_field_type(get_model_fields(cls)["id"])
+        id_class = extract_id_class(id_type)
+        for document, data in inserted:
+            # the driver sets the generated ids to the inserted documents
+            if "_id" in data:
+                new_id = data["_id"]
+                if not isinstance(new_id, id_class):
+                    new_id = parse_object_as(id_type, new_id)
+                document.id = new_id
+        for event_type in (EventTypes.UPDATE, EventTypes.SAVE):
+            await ActionRegistry.run_actions_all(
+                documents, event_type, ActionDirections.AFTER, skip_actions
+            )
+        for document in documents:
+            document._save_state()
+        return documents
+
+    @classmethod
+    async def save_changes_all(
+        cls: type[DocType],
+        documents: list[DocType],
+        ignore_revision: bool = False,
+        session: AsyncClientSession | None = None,
+        bulk_writer: BulkWriter | None = None,
+        skip_actions: list[ActionDirections | str] | None = None,
+    ) -> list[DocType]:
+        """
+        Save changes of the documents with a single bulk write.
+        State management usage must be turned on
+
+        :param documents: List["Document"] - documents to save
+        :param ignore_revision: bool - ignore revision id, if revision is turned on
+        :param session: Optional[AsyncClientSession] - pymongo session
+        :param bulk_writer: "BulkWriter" - Beanie bulk writer
+        :param skip_actions: Optional[List[Union[ActionDirections, str]]]
+            - actions to skip
+        :return: List["Document"] - changed documents
+        """
+        for document in documents:
+            check_if_state_saved(document)
+        skip_actions = skip_actions or []
+        await asyncio.gather(
+            *(
+                document.validate_self(skip_actions=skip_actions)
+                for document in documents
+            )
+        )
+        await ActionRegistry.run_actions_all(
+            documents,
+            EventTypes.SAVE_CHANGES,
+            ActionDirections.BEFORE,
+            skip_actions,
+        )
+        changed = [document for document in documents if document.is_changed]
+        await ActionRegistry.run_actions_all(
+            changed, EventTypes.UPDATE, ActionDirections.BEFORE, skip_actions
+        )
+        operations = []
+        for document in changed:
+            operations.append(
+                UpdateOne(
+                    document._get_write_filter(ignore_revision),
+                    document._get_write_update(
+                        {"$set": document.get_changes()},
+                        fields=document._get_fields_to_check(),
+                    ),
+                )
+            )
+        if operations:
+            await cls._write_all(
+                changed, operations, ignore_revision, session, bulk_writer
+            )
+        await ActionRegistry.run_actions_all(
+            changed, EventTypes.UPDATE, ActionDirections.AFTER, skip_actions
+        )
+        for document in changed:
+            document._save_state()
+        await ActionRegistry.run_actions_all(
+            documents,
+            EventTypes.SAVE_CHANGES,
+            ActionDirections.AFTER,
+            skip_actions,
+        )
+        return changed
+
+    @classmethod
+    async def replace_all(
+        cls: type[DocType],
+        documents: list[DocType],
+        ignore_revision: bool = False,
+        session: AsyncClientSession | None = None,
+        bulk_writer: BulkWriter | None = None,
+        skip_actions: list[ActionDirections | str] | None = None,
+    ) -> list[DocType]:
+        """
+        Fully update the documents in the database
+        with a single bulk write
+
+        :param documents: List["Document"] - documents to replace
+        :param ignore_revision: bool - do force replace.
+            Used when revision based protection is turned on.
+        :param session: Optional[AsyncClientSession] - pymongo session
+        :param bulk_writer: "BulkWriter" - Beanie bulk writer
+        :param skip_actions: Optional[List[Union[ActionDirections, str]]]
+            - actions to skip
+        :return: List["Document"]
+        """
+        if not documents:
+            return []
+        if any(document.id is None for document in documents):
+            raise ValueError("Document must have an id")
+        skip_actions = skip_actions or []
+        await asyncio.gather(
+            *(
+                document.validate_self(skip_actions=skip_actions)
+                for document in documents
+            )
+        )
+        await ActionRegistry.run_actions_all(
+            documents,
+            EventTypes.REPLACE,
+            ActionDirections.BEFORE,
+            skip_actions,
+        )
+        operations = []
+        for document in documents:
+            find_query = document._get_write_filter(ignore_revision)
+            if document.get_settings().use_revision and not ignore_revision:
+                document.revision_id = uuid4()
+            operations.append(
+                ReplaceOne(
+                    find_query,
+                    get_dict(
+                        document,
+                        to_db=True,
+                        exclude={"_id"},
+                        keep_nulls=document.get_settings().keep_nulls,
+                    ),
                 )
+            )
+        await cls._write_all(
+            documents, operations, ignore_revision, session, bulk_writer
+        )
+        for document in documents:
+            document._save_state()
+        await ActionRegistry.run_actions_all(
+            documents, EventTypes.REPLACE, ActionDirections.AFTER, skip_actions
+        )
+        return documents
+
+    @classmethod
+    async def upsert_many(
+        cls: type[DocType],
+        documents: Iterable[DocType],
+        on: list[str] | None = None,
+        update_fields: list[str] | None = None,
+        insert_only_fields: list[str] | None = None,
+        chunk_size: int = 1000,
+        session: AsyncClientSession | None = None,
+    ) -> list[UpsertStatus]:
+        """
+        Update the documents, which match the `on` fields,
+        or insert them. The documents are sent by chunks
+        with unordered bulk writes
+
+        Example:
+
+        ```python
+        statuses = await Product.upsert_many(
+            products,
+            on=[Product.sku],
+            insert_only_fields=[Product.created_at],
+        )
+        ```
+
+        :param documents: Iterable["Document"] - documents to upsert
+        :param on: Optional[List[str]] - fields to match the documents by.
+            Their values must not be None. Default ["_id"]
+        :param update_fields: Optional[List[str]] - fields to set
+            on the matched documents. Default None - all the fields,
+            except the `on` and `insert_only_fields` ones
+        :param insert_only_fields: Optional[List[str]] - fields
+            to set on the inserted documents only
+        :param chunk_size: int - number of the operations in a bulk write
+        :param session: Optional[AsyncClientSession] - pymongo session
+        :return: List[UpsertStatus] - statuses of the documents
+        """
+        on_keys = [str(key) for key in on or ["_id"]]
+        on_paths = set(on_keys)
+        insert_only_keys = {str(key) for key in insert_only_fields or []}
+        update_keys = (
+            None
+            if update_fields is None
+            else {str(key) for key in update_fields} - insert_only_keys
+        )
+        writer = BulkWriter(
+            session=session, ordered=False, max_operations=chunk_size
+        )
+        # documents without id get the ids of the inserted ones
+        documents_without_id: dict[int, DocType] = {}
+        count = 0
+        for document in documents:
+            if document.id is None:
+                if "_id" in on_keys:
+                    raise ValueError("Document must have an id")
+                documents_without_id[count] = document
+            keep_nulls = document.get_settings().keep_nulls
+            data = get_dict(document, to_db=True, keep_nulls=keep_nulls)
+            find_query = {key: get_by_path(data, key) for key in on_keys}
+            if any(value is None for value in find_query.values()):
+                # null matches the documents without the field too
+                raise ValueError("Values of the `on` fields must be set")
+            set_query: dict[str, Any] = {}
+            set_on_insert_query: dict[str, Any] = {}
+            # the other fields of the subdocuments with the `on` fields
+            # are set by the dotted keys
+            for key, value in split_by_paths(data, on_paths):
+                field = key.split(".", 1)[0]
+                if field in insert_only_keys or field == "_id":
+                    set_on_insert_query[key] = value
+                elif update_keys is None or field in update_keys:
+                    set_query[key] = value
+            if document.get_settings().use_revision:
+                document.revision_id = uuid4()
+                set_query["revision_id"] = document.revision_id
+            update: dict[str, Any] = {}
+            if set_query:
+                update["$set"] = set_query
+            if set_on_insert_query:
+                update["$setOnInsert"] = set_on_insert_query
+            if keep_nulls is False:
+                nones = {
+                    key: value
+                    for key, value in get_top_level_nones(document).items()
+                    if key not in insert_only_keys
+                    and (update_keys is None or key in update_keys)
+                }
+                if nones:
+                    update.update(Unset(nones).query)
+            await writer.queue_operation(
+                type(document),
+                UpdateOne(
+                    find_query,
+                    Encoder(
+                        custom_encoders=document.get_settings().bson_encoders
+                    ).encode(update),
+                    upsert=True,
+                ),
+            )
+            count += 1
+        result = await writer.commit()
+        statuses = [UpsertStatus.UPDATED] * count
+        if result is None or not result.acknowledged:
+            return statuses
+        id_type = get_field_type(get_model_fields(cls)["id"])
+        id_class = extract_id_class(id_type)
+        for index, new_id in (result.upserted_ids or {}).items():
+            statuses[index] = UpsertStatus.INSERTED
+            inserted = documents_without_id.get(index)
+            if inserted is not None:
+                if not isinstance(new_id, id_class):
+                    new_id = parse_object_as(id_type, new_id)
+                inserted.id = new_id
+        return statuses
 
     @save_state_after
     async def update(
@@ -676,6 +1237,7 @@ class Document(
         bulk_writer: BulkWriter | None = None,
         skip_actions: list[ActionDirections | str] | None = None,
         skip_sync: bool | None = None,
+        local_update: bool | None = None,
         **pymongo_kwargs: Any,
     ) -> Self:
         """
@@ -685,6 +1247,9 @@ class Document(
         :param session: AsyncClientSession - pymongo session.
         :param ignore_revision: bool - force update. Will update even if revision id is not the same, as stored
         :param bulk_writer: "BulkWriter" - Beanie bulk writer
+        :param local_update: Optional[bool] - apply the modifications
+        to the instance locally instead of fetching the updated document.
+        Default None - use the `local_update` setting
         :param pymongo_kwargs: pymongo native parameters for update operation
         :return: self
         """
@@ -757,14 +1322,30 @@ class Document(
         if use_revision_id:
             new_revision_id = uuid4()
             arguments.append(SetRevisionId(new_revision_id))
-        try:
-            result = await self.find_one(find_query).update(
-                *arguments,
-                session=session,
-                response_type=UpdateResponse.NEW_DOCUMENT,
-                bulk_writer=bulk_writer,
-                **pymongo_kwargs,
+
+        if local_update is None:
+            local_update = self.get_settings().local_update
+        update_query = self.find_one(find_query).update(
+            *arguments,
+            session=session,
+            response_type=UpdateResponse.NEW_DOCUMENT,
+            bulk_writer=bulk_writer,
+            **pymongo_kwargs,
+        )
+        local_values = None
+        if (
+            local_update
+            and bulk_writer is None
+            and self.id is not None
+            and "upsert" not in pymongo_kwargs
+        ):
+            local_values = self._get_local_update_values(
+                update_query.update_query
             )
+        if local_values is not None:
+            update_query.response_type = UpdateResponse.UPDATE_RESULT
+        try:
+            result = await update_query
         except DuplicateKeyError as e:
             # A DuplicateKeyError on _id during an upsert with revision
             # filtering means the revision didn't match (the filter missed
@@ -781,7 +1362,17 @@ class Document(
                 if "_id" in key_pattern or "revision_id" in key_pattern:
                     raise RevisionIdWasChanged
             raise
-        if bulk_writer is None:
+        if local_values is not None:
+            assert isinstance(result, UpdateResult)
+            if result.matched_count == 0:
+                if use_revision_id and not ignore_revision:
+                    raise RevisionIdWasChanged
+                raise DocumentNotFound
+            for name, value in local_values.items():
+                self.__dict__[name] = value
+                self.__pydantic_fields_set__.add(name)
+                self._mark_changed(name, value)
+        elif bulk_writer is None:
             if use_revision_id and not ignore_revision and result is None:
                 raise RevisionIdWasChanged
             merge_models(self, result)
@@ -795,6 +1386,35 @@ class Document(
 
         return self
 
+    def _get_local_update_values(
+        self, update_query: Any
+    ) -> dict[str, Any] | None:
+        """
+        New values of the fields, changed by the update query,
+        calculated and validated without the round trip to the database.
+        The values are validated on a copy, so the document is not changed
+        before the update is written.
+        None if the query can't be applied locally or the values are invalid
+        :param update_query: encoded update query
+        :return: Optional[Dict[str, Any]] - field names and validated values
+        """
+        if isinstance(update_query, Mapping) and any(
+            operator in SERVER_SIDE_OPERATORS for operator in update_query
+        ):
+            return None
+        try:
+            values = get_document_update_values(self, update_query)
+        except ApplyChangesException:
+            return None
+        document = copy(self)
+        validator = type(self).__pydantic_validator__
+        try:
+            for name, value in values.items():
+                validator.validate_assignment(document, name, value)
+        except ValidationError:
+            return None
+        return {name: document.__dict__[name] for name in values}
+
     @classmethod
     def update_all(
         cls,
@@ -1023,27 +1643,102 @@ class Document(
         """
         return cls.get_settings().state_management_replace_objects
 
-    def _save_state(self) -> None:
+    def _save_state(self, source: Mapping[str, Any] | None = None) -> None:
         """
         Save current document state. Internal method
+        :param source: Optional[Mapping[str, Any]] - raw data the document
+        was parsed from. The state is built from it on the first access
         :return: None
         """
         if self.use_state_management() and self.id is not None:
-            if self.state_management_save_previous():
-                self._previous_saved_state = self._saved_state
+            save_previous = self.state_management_save_previous()
+            fields = self._get_fields_to_check()
+            # the state, which is not built yet, is built
+            # only to be kept as the previous one
+            previous_state = (
+                self.get_saved_state() if save_previous else self._saved_state
+            )
+            state_source = (
+                get_state_source(self, source) if source is not None else None
+            )
 
-            self._saved_state = get_dict(
+            if state_source is not None:
+                self._saved_state = None
+                self._saved_state_source = state_source
+            elif fields is not None and previous_state is not None:
+                self._saved_state = self._copy_state_on_write(
+                    previous_state, fields
+                )
+            else:
+                state = get_dict(
+                    self,
+                    to_db=True,
+                    keep_nulls=self.get_settings().keep_nulls,
+                    exclude={"revision_id"},
+                )
+                if save_previous and previous_state is not None:
+                    share_subtrees(previous_state, state)
+                self._saved_state = state
+                self._saved_state_source = None
+
+            if save_previous:
+                self._previous_saved_state = previous_state
+            if self._change_tracker is not None:
+                self._change_tracker.reset(self)
+
+    def _copy_state_on_write(
+        self, saved_state: dict[str, Any], fields: AbstractSet[str]
+    ) -> dict[str, Any]:
+        """
+        New state, which shares the unchanged fields with the saved one.
+        Only the given fields are encoded
+        :param saved_state: Dict[str, Any] - saved state
+        :param fields: Set[str] - names of the changed fields
+        :return: Dict[str, Any]
+        """
+        state = dict(saved_state)
+        changes = share_subtrees(
+            saved_state,
+            get_dict(
                 self,
                 to_db=True,
                 keep_nulls=self.get_settings().keep_nulls,
                 exclude={"revision_id"},
+                fields=fields,
+            ),
+        )
+        plan = get_encoding_plan(type(self))
+        for name in fields:
+            key = plan.get_key(name)
+            if key in changes:
+                state[key] = changes[key]
+            else:
+                state.pop(key, None)
+        return state
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Document) or type(self) is not type(other):
+            return super().__eq__(other)
+        return (
+            _get_compared_private(self) == _get_compared_private(other)
+            and (self.__pydantic_extra__ or {})
+            == (other.__pydantic_extra__ or {})
+            and all(
+                self.__dict__.get(name) == other.__dict__.get(name)
+                for name in type(self).model_fields
             )
+        )
 
     def get_saved_state(self) -> dict[str, Any] | None:
         """
         Saved state getter. It is protected property.
         :return: Optional[Dict[str, Any]] - saved state
         """
+        if self._saved_state_source is not None:
+            self._saved_state = build_state(
+                type(self), self._saved_state_source
+            )
+            self._saved_state_source = None
         return self._saved_state
 
     def get_previous_saved_state(self) -> dict[str, Any] | None:
@@ -1053,15 +1748,54 @@ class Document(
         """
         return self._previous_saved_state
 
-    @property
-    @saved_state_needed
-    def is_changed(self) -> bool:
-        return self._saved_state != get_dict(
+    def _get_fields_to_check(self) -> AbstractSet[str] | None:
+        """
+        Names of the fields, which could be changed since the state
+        was saved. None if the changes are not tracked
+        and the whole document must be compared
+        :return: Optional[Set[str]]
+        """
+        if self._change_tracker is None:
+            return None
+        return self._change_tracker.get_fields_to_check()
+
+    def _get_compared_states(
+        self, fields: AbstractSet[str] | None
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Saved and current states of the fields to compare.
+        Only the given fields are encoded, if provided
+        :param fields: Optional[Set[str]] - names of the fields
+        :return: Tuple[Dict[str, Any], Dict[str, Any]] - saved
+        and current states
+        """
+        saved_state = self.get_saved_state()
+        assert saved_state is not None
+        current_state = get_dict(
             self,
             to_db=True,
             keep_nulls=self.get_settings().keep_nulls,
             exclude={"revision_id"},
+            fields=fields,
         )
+        if fields is None:
+            return saved_state, current_state
+        plan = get_encoding_plan(type(self))
+        compared_state = {}
+        for name in fields:
+            key = plan.get_key(name)
+            if key in saved_state:
+                compared_state[key] = saved_state[key]
+        return compared_state, current_state
+
+    @property
+    @saved_state_needed
+    def is_changed(self) -> bool:
+        fields = self._get_fields_to_check()
+        if fields is not None and not fields:
+            return False
+        saved_state, current_state = self._get_compared_states(fields)
+        return saved_state != current_state
 
     @property
     @saved_state_needed
@@ -1069,7 +1803,7 @@ class Document(
     def has_changed(self) -> bool:
         if self._previous_saved_state is None:
             return False
-        return self._previous_saved_state != self._saved_state
+        return self._previous_saved_state != self.get_saved_state()
 
     def _collect_updates(
         self, old_dict: dict[str, Any], new_dict: dict[str, Any]
@@ -1112,37 +1846,33 @@ class Document(
 
     @saved_state_needed
     def get_changes(self) -> dict[str, Any]:
-        assert self._saved_state is not None
-
-        return self._collect_updates(
-            self._saved_state,
-            get_dict(
-                self,
-                to_db=True,
-                keep_nulls=self.get_settings().keep_nulls,
-                exclude={"revision_id"},
-            ),
-        )
+        fields = self._get_fields_to_check()
+        if fields is not None and not fields:
+            return {}
+        return self._collect_updates(*self._get_compared_states(fields))
 
     @saved_state_needed
     @previous_saved_state_needed
     def get_previous_changes(self) -> dict[str, Any]:
-        assert self._saved_state is not None
+        saved_state = self.get_saved_state()
+        assert saved_state is not None
 
         if self._previous_saved_state is None:
             return {}
 
         return self._collect_updates(
             self._previous_saved_state,
-            self._saved_state,
+            saved_state,
         )
 
     @saved_state_needed
     def rollback(self) -> None:
-        assert self._saved_state is not None
+        saved_state = self.get_saved_state()
+        assert saved_state is not None
 
         if self.is_changed:
-            for key, value in self._saved_state.items():
+            # saved states share their values, they must not be mutated
+            for key, value in deepcopy(saved_state).items():
                 if key == "_id":
                     self.id = value
                 else:
@@ -1237,8 +1967,17 @@ class Document(
         ):
             if self.id is None:
                 return
-            query = {f"{link_info.lookup_field_name}.$id": self.id}
-            result = await link_info.document_class.find_one(query)
+            loader = LinkLoader.get_current()
+            if loader is not None:
+                results = await loader.load_referencing(
+                    link_info.document_class,
+                    link_info.lookup_field_name,
+                    self.id,
+                )
+                result = results[0] if results else None
+            else:
+                query = {f"{link_info.lookup_field_name}.$id": self.id}
+                result = await link_info.document_class.find_one(query)
             if result is not None:
                 setattr(self, field, result)
             return
@@ -1249,9 +1988,19 @@ class Document(
         ):
             if self.id is None:
                 return
-            results = await link_info.document_class.find(
-                {f"{link_info.lookup_field_name}.$id": self.id},
-            ).to_list()
+            loader = LinkLoader.get_current()
+            if loader is not None:
+                results = list(
+                    await loader.load_referencing(
+                        link_info.document_class,
+                        link_info.lookup_field_name,
+                        self.id,
+                    )
+                )
+            else:
+                results = await link_info.document_class.find(
+                    {f"{link_info.lookup_field_name}.$id": self.id},
+                ).to_list()
             setattr(self, field, results)
             return
 
@@ -1271,6 +2020,41 @@ class Document(
                 coros.append(self.fetch_link(ref.field_name))  # TODO lists
         await asyncio.gather(*coros)
 
+    @classmethod
+    async def fetch_links_for(
+        cls,
+        documents: Iterable["Document"],
+        fields: Iterable[str] | None = None,
+    ) -> None:
+        """
+        Fetch the links of many documents with a constant number of queries:
+        one per linked document class and one per back link field.
+
+        The current `LinkLoader` is used, if there is one. Otherwise,
+        a new one is created for the call. The documents, which link
+        the same document, share its instance.
+
+        :param documents: Iterable[Document] - documents to fetch the links of
+        :param fields: Optional[Iterable[str]] - names of the link fields
+            to fetch. All the link fields by default
+        :return: None
+        """
+        documents = list(documents)
+        fields = list(fields) if fields is not None else None
+        coros: list[Coroutine[Any, Any, Any]] = []
+        for document in documents:
+            names = (
+                fields
+                if fields is not None
+                else list(document.get_link_fields() or {})
+            )
+            coros.extend(document.fetch_link(name) for name in names)
+        if LinkLoader.get_current() is not None:
+            await asyncio.gather(*coros)
+            return
+        with LinkLoader():
+            await asyncio.gather(*coros)
+
     @classmethod
     def get_link_fields(cls) -> dict[str, LinkInfo] | None:
         return cls._link_fields
@@ -1439,8 +2223,10 @@ class DocumentWithSoftDelete(Document):
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -1460,7 +2246,9 @@ class DocumentWithSoftDelete(Document):
             session=session,
             ignore_cache=ignore_cache,
             fetch_links=fetch_links,
+            fetch_links_strategy=fetch_links_strategy,
             lazy_parse=lazy_parse,
+            raw_bson=raw_bson,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
             **pymongo_kwargs,
@@ -1477,8 +2265,10 @@ class DocumentWithSoftDelete(Document):
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -1505,7 +2295,9 @@ class DocumentWithSoftDelete(Document):
             session=session,
             ignore_cache=ignore_cache,
             fetch_links=fetch_links,
+            fetch_links_strategy=fetch_links_strategy,
             lazy_parse=lazy_parse,
+            raw_bson=raw_bson,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
             **pymongo_kwargs,
@@ -1519,6 +2311,7 @@ class DocumentWithSoftDelete(Document):
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
         with_children: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
@@ -1543,6 +2336,7 @@ class DocumentWithSoftDelete(Document):
             session=session,
             ignore_cache=ignore_cache,
             fetch_links=fetch_links,
+            fetch_links_strategy=fetch_links_strategy,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
             **pymongo_kwargs,
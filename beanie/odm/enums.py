@@ -12,6 +12,15 @@ class SortDirection(int, Enum):
     DESCENDING = pymongo.DESCENDING
 
 
+class FetchLinksStrategy(str, Enum):
+    """
+    Ways to fetch the linked documents on find
+    """
+
+    LOOKUP = "lookup"
+    BATCHED = "batched"
+
+
 class InspectionStatuses(str, Enum):
     """
     Statuses of the collection inspection
@@ -19,3 +28,21 @@ class InspectionStatuses(str, Enum):
 
     FAIL = "FAIL"
     OK = "OK"
+
+
+class StateManagementMode(str, Enum):
+    """
+    Ways to detect changes of the documents with state management
+    """
+
+    SNAPSHOT = "snapshot"
+    TRACKED = "tracked"
+
+
+class UpsertStatus(str, Enum):
+    """
+    Results of the upsert of a document
+    """
+
+    INSERTED = "INSERTED"
+    UPDATED = "UPDATED"
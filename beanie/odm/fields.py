@@ -1,5 +1,6 @@
 import asyncio
 from collections import OrderedDict
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
 from typing import (
@@ -24,6 +25,7 @@ from pydantic_core.core_schema import CoreSchema, ValidationInfo
 from pymongo import ASCENDING, IndexModel
 
 from beanie.odm.enums import SortDirection
+from beanie.odm.loader import LinkLoader
 from beanie.odm.operators.find.comparison import (
     GT,
     GTE,
@@ -341,6 +343,23 @@ class ExpressionField(str):
         return self
 
 
+@dataclass(frozen=True)
+class Param:
+    """
+    Placeholder of a value in the search criteria of a prepared query.
+    The value is passed by the name, when the query is bound
+
+    Example:
+
+    ```python
+    query = Product.prepare(Product.price < Param("max_price"))
+    products = await query.bind(max_price=10).to_list()
+    ```
+    """
+
+    name: str
+
+
 class DeleteRules(str, Enum):
     DO_NOTHING = "DO_NOTHING"
     DELETE_LINKS = "DELETE_LINKS"
@@ -381,9 +400,15 @@ class Link(Generic[T]):
         self.document_class = document_class
 
     async def fetch(self, fetch_links: bool = False) -> "T | Link[T]":
-        result = await self.document_class.get(  # type: ignore
-            self.ref.id, with_children=True, fetch_links=fetch_links
-        )
+        loader = LinkLoader.get_current()
+        if loader is not None:
+            result = await loader.load(
+                self.document_class, self.ref.id, fetch_links=fetch_links
+            )
+        else:
+            result = await self.document_class.get(  # type: ignore
+                self.ref.id, with_children=True, fetch_links=fetch_links
+            )
         return result or self
 
     @classmethod
@@ -417,11 +442,23 @@ class Link(Generic[T]):
                 ids_to_fetch.append(link.ref.id)
 
         if ids_to_fetch:
-            fetched_models = await document_class.find(  # type: ignore
-                In("_id", ids_to_fetch),
-                with_children=True,
-                fetch_links=fetch_links,
-            ).to_list()
+            loader = LinkLoader.get_current()
+            if loader is not None:
+                fetched_models = list(
+                    (
+                        await loader.load_many(
+                            document_class,  # type: ignore
+                            ids_to_fetch,
+                            fetch_links=fetch_links,
+                        )
+                    ).values()
+                )
+            else:
+                fetched_models = await document_class.find(  # type: ignore
+                    In("_id", ids_to_fetch),
+                    with_children=True,
+                    fetch_links=fetch_links,
+                ).to_list()
 
             for model in fetched_models:
                 data[model.id] = model
@@ -442,10 +479,15 @@ class Link(Generic[T]):
 
     @classmethod
     async def fetch_many(cls, links: list["Link[T]"]) -> list["T | Link[T]"]:
-        coros = []
-        for link in links:
-            coros.append(link.fetch())
-        return await asyncio.gather(*coros)
+        """
+        Fetch the links with one query per document class
+        :param links: List[Link] - links to fetch
+        :return: List - fetched documents or the links, which were not found
+        """
+        if LinkLoader.get_current() is not None:
+            return await asyncio.gather(*(link.fetch() for link in links))
+        with LinkLoader():
+            return await asyncio.gather(*(link.fetch() for link in links))
 
     @staticmethod
     def serialize(value: "Link[T] | BaseModel"):
@@ -469,7 +511,7 @@ class Link(Generic[T]):
                 return cls(ref=v, document_class=document_class)
             if isinstance(v, Link):
                 return v
-            if isinstance(v, dict) and v.keys() == {"id", "collection"}:
+            if isinstance(v, Mapping) and v.keys() == {"id", "collection"}:
                 return cls(
                     ref=DBRef(
                         collection=v["collection"],
@@ -479,7 +521,7 @@ class Link(Generic[T]):
                     ),
                     document_class=document_class,
                 )
-            if isinstance(v, (dict, BaseModel)):
+            if isinstance(v, (Mapping, BaseModel)):
                 return parse_obj(document_class, v)
 
             # Default fallback case for unknown type
@@ -548,7 +590,7 @@ class BackLink(Generic[T]):
             document_class = DocsRegistry.evaluate_fr(  # type: ignore
                 get_args(source_type)[0]
             )
-            if isinstance(v, (dict, BaseModel)):
+            if isinstance(v, (Mapping, BaseModel)):
                 return parse_obj(document_class, v)
             return cls(document_class=document_class)
 
@@ -1,6 +1,13 @@
+from concurrent.futures import Executor
 from copy import deepcopy
 
 
 class CloneInterface:
     def clone(self):
-        return deepcopy(self)
+        # executors can not be copied, so the clones share them
+        memo = {
+            id(value): value
+            for value in vars(self).values()
+            if isinstance(value, Executor)
+        }
+        return deepcopy(self, memo)
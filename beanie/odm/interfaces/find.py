@@ -13,9 +13,10 @@ from pydantic import (
 )
 from pymongo.asynchronous.client_session import AsyncClientSession
 
-from beanie.odm.enums import SortDirection
+from beanie.odm.enums import FetchLinksStrategy, SortDirection
 from beanie.odm.interfaces.detector import ModelType
 from beanie.odm.queries.find import FindMany, FindOne
+from beanie.odm.queries.prepared import PreparedQuery
 from beanie.odm.settings.base import ItemSettings
 
 if TYPE_CHECKING:
@@ -56,6 +57,8 @@ class FindInterface:
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
+        raw_bson: bool = False,
         with_children: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
@@ -71,6 +74,8 @@ class FindInterface:
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
+        raw_bson: bool = False,
         with_children: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
@@ -85,6 +90,8 @@ class FindInterface:
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
+        raw_bson: bool = False,
         with_children: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
@@ -99,6 +106,8 @@ class FindInterface:
         :param projection_model: Optional[type[BaseModel]] - projection model
         :param session: Optional[AsyncClientSession] - pymongo session.
         :param ignore_cache: bool
+        :param fetch_links_strategy: Optional[FetchLinksStrategy] - how to fetch the links: with `$lookup` stages or with batched `$in` queries
+        :param raw_bson: bool - decode the document lazily from raw BSON
         :param **pymongo_kwargs: pymongo native parameters for find operation (if Document class contains links, this parameter must fit the respective parameter of the aggregate MongoDB function)
         :return: [FindOne](query.md#findone) - find query instance
         """
@@ -109,6 +118,8 @@ class FindInterface:
             session=session,
             ignore_cache=ignore_cache,
             fetch_links=fetch_links,
+            fetch_links_strategy=fetch_links_strategy,
+            raw_bson=raw_bson,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
             **pymongo_kwargs,
@@ -126,8 +137,10 @@ class FindInterface:
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -145,8 +158,10 @@ class FindInterface:
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -163,8 +178,10 @@ class FindInterface:
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -180,7 +197,9 @@ class FindInterface:
         :param projection_model: Optional[type[BaseModel]] - projection model
         :param session: Optional[AsyncClientSession] - pymongo session.
         :param ignore_cache: bool
+        :param fetch_links_strategy: Optional[FetchLinksStrategy] - how to fetch the links: with `$lookup` stages or with batched `$in` queries
         :param lazy_parse: bool
+        :param raw_bson: bool - decode the documents lazily from raw BSON
         :param **pymongo_kwargs: pymongo native parameters for find operation (if Document class contains links, this parameter must fit the respective parameter of the aggregate MongoDB function)
         :return: [FindMany](query.md#findmany) - query instance
         """
@@ -194,7 +213,9 @@ class FindInterface:
             session=session,
             ignore_cache=ignore_cache,
             fetch_links=fetch_links,
+            fetch_links_strategy=fetch_links_strategy,
             lazy_parse=lazy_parse,
+            raw_bson=raw_bson,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
             **pymongo_kwargs,
@@ -212,8 +233,10 @@ class FindInterface:
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -231,8 +254,10 @@ class FindInterface:
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -249,8 +274,10 @@ class FindInterface:
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -267,13 +294,102 @@ class FindInterface:
             session=session,
             ignore_cache=ignore_cache,
             fetch_links=fetch_links,
+            fetch_links_strategy=fetch_links_strategy,
             with_children=with_children,
             lazy_parse=lazy_parse,
+            raw_bson=raw_bson,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
             **pymongo_kwargs,
         )
 
+    @overload
+    @classmethod
+    def prepare(  # type: ignore
+        cls: type[FindType],
+        *args: Mapping[Any, Any] | bool,
+        projection_model: None = None,
+        skip: int | None = None,
+        limit: int | None = None,
+        sort: str | list[tuple[str, SortDirection]] | None = None,
+        ignore_cache: bool = False,
+        fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
+        with_children: bool = False,
+        lazy_parse: bool = False,
+        raw_bson: bool = False,
+        nesting_depth: int | None = None,
+        nesting_depths_per_field: dict[str, int] | None = None,
+        **pymongo_kwargs: Any,
+    ) -> PreparedQuery[FindType]: ...
+
+    @overload
+    @classmethod
+    def prepare(  # type: ignore
+        cls: type[FindType],
+        *args: Mapping[Any, Any] | bool,
+        projection_model: type["DocumentProjectionType"],
+        skip: int | None = None,
+        limit: int | None = None,
+        sort: str | list[tuple[str, SortDirection]] | None = None,
+        ignore_cache: bool = False,
+        fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
+        with_children: bool = False,
+        lazy_parse: bool = False,
+        raw_bson: bool = False,
+        nesting_depth: int | None = None,
+        nesting_depths_per_field: dict[str, int] | None = None,
+        **pymongo_kwargs: Any,
+    ) -> PreparedQuery["DocumentProjectionType"]: ...
+
+    @classmethod
+    def prepare(  # type: ignore
+        cls: type[FindType],
+        *args: Mapping[Any, Any] | bool,
+        projection_model: type["DocumentProjectionType"] | None = None,
+        skip: int | None = None,
+        limit: int | None = None,
+        sort: str | list[tuple[str, SortDirection]] | None = None,
+        ignore_cache: bool = False,
+        fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
+        with_children: bool = False,
+        lazy_parse: bool = False,
+        raw_bson: bool = False,
+        nesting_depth: int | None = None,
+        nesting_depths_per_field: dict[str, int] | None = None,
+        **pymongo_kwargs: Any,
+    ) -> PreparedQuery:
+        """
+        Prepare the find query to run it many times with the different
+        values of the parameters. The values are passed with `Param`
+        placeholders in the search criteria and are bound by
+        the `bind` method of the prepared query.
+        Takes the same arguments as find_many, except the session
+
+        :param args: *Mapping[Any, Any] - search criteria
+        :return: PreparedQuery - prepared query
+        """
+        return PreparedQuery(
+            cls.find_many(
+                *args,
+                skip=skip,
+                limit=limit,
+                sort=sort,
+                projection_model=projection_model,
+                ignore_cache=ignore_cache,
+                fetch_links=fetch_links,
+                fetch_links_strategy=fetch_links_strategy,
+                with_children=with_children,
+                lazy_parse=lazy_parse,
+                raw_bson=raw_bson,
+                nesting_depth=nesting_depth,
+                nesting_depths_per_field=nesting_depths_per_field,
+                **pymongo_kwargs,
+            )
+        )
+
     @overload
     @classmethod
     def find_all(  # type: ignore
@@ -286,6 +402,7 @@ class FindInterface:
         ignore_cache: bool = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -303,6 +420,7 @@ class FindInterface:
         ignore_cache: bool = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -319,6 +437,7 @@ class FindInterface:
         ignore_cache: bool = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -344,6 +463,7 @@ class FindInterface:
             ignore_cache=ignore_cache,
             with_children=with_children,
             lazy_parse=lazy_parse,
+            raw_bson=raw_bson,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
             **pymongo_kwargs,
@@ -361,6 +481,7 @@ class FindInterface:
         ignore_cache: bool = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -378,6 +499,7 @@ class FindInterface:
         ignore_cache: bool = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -394,6 +516,7 @@ class FindInterface:
         ignore_cache: bool = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -410,6 +533,7 @@ class FindInterface:
             ignore_cache=ignore_cache,
             with_children=with_children,
             lazy_parse=lazy_parse,
+            raw_bson=raw_bson,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
             **pymongo_kwargs,
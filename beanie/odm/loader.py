@@ -0,0 +1,210 @@
+import asyncio
+from collections.abc import Hashable, Iterable
+from contextvars import ContextVar, Token
+from typing import Any
+
+from bson import DBRef
+
+from beanie.odm.operators.find.comparison import In
+
+_current_loader: ContextVar["LinkLoader | None"] = ContextVar(
+    "beanie_link_loader", default=None
+)
+
+_NOT_FOUND = object()
+
+
+def _get_referenced_ids(value: Any) -> list[Any]:
+    """
+    Ids of the documents, referenced by the link field value:
+    links, fetched documents or lists of them
+    """
+    if isinstance(value, list):
+        return [
+            item for element in value for item in _get_referenced_ids(element)
+        ]
+    ref = getattr(value, "ref", None)
+    if isinstance(ref, DBRef):
+        return [ref.id]
+    document_id = getattr(value, "id", None)
+    return [] if document_id is None else [document_id]
+
+
+class LinkLoader:
+    """
+    Batches and caches the fetching of the linked documents.
+
+    Links, which are fetched concurrently inside the loader context,
+    are collected and loaded with a single `$in` query per document
+    class, like back links are loaded with a single query per field.
+    The loaded documents are cached for the lifetime of the loader,
+    so the documents, which link the same one, share its instance.
+
+    Example:
+
+    ```python
+    with LinkLoader():
+        houses = await House.find_all().to_list()
+        await asyncio.gather(*(house.fetch_all_links() for house in houses))
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._loaded: dict[Hashable, Any] = {}
+        self._pending: dict[tuple[Any, ...], dict[Any, asyncio.Future]] = {}
+        self._scheduled = False
+        self._tokens: list[Token] = []
+        self._tasks: set[asyncio.Task] = set()
+        self.queries_count = 0
+
+    @staticmethod
+    def get_current() -> "LinkLoader | None":
+        """
+        Loader of the current context
+
+        :return: Optional[LinkLoader]
+        """
+        return _current_loader.get()
+
+    def __enter__(self) -> "LinkLoader":
+        self._tokens.append(_current_loader.set(self))
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        _current_loader.reset(self._tokens.pop())
+
+    def clear(self) -> None:
+        """
+        Forget the loaded documents
+
+        :return: None
+        """
+        self._loaded.clear()
+
+    async def load(
+        self, document_class: type, document_id: Any, fetch_links: bool = False
+    ) -> Any:
+        """
+        Load the document by id. Concurrent calls are batched
+
+        :param document_class: Type[Document] - document class. Its children
+            are loaded too
+        :param document_id: Any - document id
+        :param fetch_links: bool - fetch the links of the loaded document
+        :return: Optional[Document]
+        """
+        return (
+            await self.load_many(document_class, [document_id], fetch_links)
+        ).get(document_id)
+
+    async def load_many(
+        self,
+        document_class: type,
+        ids: Iterable[Any],
+        fetch_links: bool = False,
+    ) -> dict[Any, Any]:
+        """
+        Load the documents by ids. Concurrent calls are batched
+
+        :param document_class: Type[Document] - document class. Its children
+            are loaded too
+        :param ids: Iterable[Any] - document ids
+        :param fetch_links: bool - fetch the links of the loaded documents
+        :return: Dict[Any, Document] - found documents by their ids
+        """
+        group = ("id", document_class, fetch_links)
+        ids = list(ids)
+        await self._wait(group, ids)
+        result = {}
+        for document_id in ids:
+            document = self._loaded[group, document_id]
+            if document is not _NOT_FOUND:
+                result[document_id] = document
+        return result
+
+    async def load_referencing(
+        self,
+        document_class: type,
+        field: str,
+        document_id: Any,
+        fetch_links: bool = False,
+    ) -> list[Any]:
+        """
+        Load the documents, which link the given one by the field.
+        Concurrent calls for the same field are batched
+
+        :param document_class: Type[Document] - class of the linking documents
+        :param field: str - name of the link field of the linking documents
+        :param document_id: Any - id of the linked document
+        :param fetch_links: bool - fetch the links of the loaded documents
+        :return: List[Document]
+        """
+        group = ("field", document_class, field, fetch_links)
+        await self._wait(group, [document_id])
+        return self._loaded[group, document_id]
+
+    async def _wait(self, group: tuple[Any, ...], keys: list[Any]) -> None:
+        loop = asyncio.get_running_loop()
+        futures = []
+        for key in keys:
+            if (group, key) in self._loaded:
+                continue
+            pending = self._pending.setdefault(group, {})
+            if key not in pending:
+                pending[key] = loop.create_future()
+            futures.append(pending[key])
+        if not futures:
+            return
+        if not self._scheduled:
+            # the callback runs, when the concurrent callers
+            # have registered their keys too
+            self._scheduled = True
+            loop.call_soon(self._dispatch)
+        await asyncio.gather(*(asyncio.shield(f) for f in futures))
+
+    def _dispatch(self) -> None:
+        self._scheduled = False
+        pending, self._pending = self._pending, {}
+        for group, futures in pending.items():
+            task = asyncio.ensure_future(self._fetch(group, futures))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(
+        self, group: tuple[Any, ...], futures: dict[Any, asyncio.Future]
+    ) -> None:
+        try:
+            self.queries_count += 1
+            if group[0] == "id":
+                _, document_class, fetch_links = group
+                documents = await document_class.find(  # type: ignore
+                    In("_id", list(futures)),
+                    with_children=True,
+                    fetch_links=fetch_links,
+                ).to_list()
+                found = {document.id: document for document in documents}
+                for key in futures:
+                    self._loaded[group, key] = found.get(key, _NOT_FOUND)
+            else:
+                _, document_class, field, fetch_links = group
+                documents = await document_class.find(  # type: ignore
+                    {f"{field}.$id": {"$in": list(futures)}},
+                    fetch_links=fetch_links,
+                ).to_list()
+                referencing: dict[Any, list[Any]] = {
+                    key: [] for key in futures
+                }
+                for document in documents:
+                    for key in _get_referenced_ids(getattr(document, field)):
+                        if key in referencing:
+                            referencing[key].append(document)
+                for key, value in referencing.items():
+                    self._loaded[group, key] = value
+        except Exception as e:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future in futures.values():
+            if not future.done():
+                future.set_result(None)
@@ -8,7 +8,7 @@ from typing import (
 
 from pydantic import BaseModel
 
-from beanie.odm.cache import LRUCache
+from beanie.odm.cache import CacheBackend
 from beanie.odm.interfaces.clone import CloneInterface
 from beanie.odm.interfaces.session import SessionMethods
 from beanie.odm.queries.cursor import BaseCursorQuery
@@ -48,35 +48,45 @@ class AggregationQuery(
         self.session = None
         self.ignore_cache = ignore_cache
         self.pymongo_kwargs = pymongo_kwargs
+        self._cache_key_memo: str | None = None
 
     @property
     def _cache_key(self) -> str:
-        return LRUCache.create_key(
-            {
-                "type": "Aggregation",
-                "filter": self.find_query,
-                "pipeline": self.aggregation_pipeline,
-                "projection": get_projection(self.projection_model)
-                if self.projection_model
-                else None,
-            }
-        )
+        if self._cache_key_memo is None:
+            self._cache_key_memo = CacheBackend.create_key(
+                {
+                    "type": "Aggregation",
+                    "filter": self.find_query,
+                    "pipeline": self.aggregation_pipeline,
+                    "projection": get_projection(self.projection_model)
+                    if self.projection_model
+                    else None,
+                    "pymongo_kwargs": self.pymongo_kwargs,
+                }
+            )
+        return self._cache_key_memo
 
-    def _get_cache(self):
+    async def _get_cache(self):
         if (
             self.document_model.get_settings().use_cache
             and self.ignore_cache is False
         ):
-            return self.document_model._cache.get(self._cache_key)  # type: ignore
+            return await self.document_model._cache.get(  # type: ignore
+                self.document_model.get_collection_name(), self._cache_key
+            )
         else:
             return None
 
-    def _set_cache(self, data):
+    async def _set_cache(self, data):
         if (
             self.document_model.get_settings().use_cache
             and self.ignore_cache is False
         ):
-            return self.document_model._cache.set(self._cache_key, data)  # type: ignore
+            await self.document_model._cache.set(  # type: ignore
+                self.document_model.get_collection_name(),
+                self._cache_key,
+                data,
+            )
 
     def get_aggregation_pipeline(
         self,
@@ -1,4 +1,9 @@
+import asyncio
 from abc import abstractmethod
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import Executor
+from contextlib import suppress
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -13,10 +18,77 @@ if TYPE_CHECKING:
 
 from pydantic.main import BaseModel
 
-from beanie.odm.utils.parsing import parse_obj
+from beanie.odm.utils.parsing import parse_batch, parse_obj
 
 CursorResultType = TypeVar("CursorResultType")
 
+DEFAULT_BATCH_SIZE = 1000
+
+PARSE_CHUNK_SIZE = 1000
+
+_STREAM_END = object()
+
+
+class LinksFetchingCursor:
+    """
+    Wrapper over AsyncCursor, which fetches the links
+    of the raw documents by batches, before they are parsed
+    """
+
+    def __init__(
+        self,
+        cursor: Any,
+        fetch_links: Callable[[list[Any]], Awaitable[None]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """
+        :param cursor: AsyncCursor - cursor of the raw documents
+        :param fetch_links: Callable[[List[Any]], Awaitable[None]] - fetches
+            the links of the raw documents in place
+        :param batch_size: int - number of documents to fetch the links of
+            at once, when the cursor is iterated
+        """
+        self.cursor = cursor
+        self.fetch_links = fetch_links
+        self._batch_size = batch_size
+        self._buffer: deque[Any] = deque()
+
+    @property
+    def alive(self) -> bool:
+        return bool(self._buffer) or self.cursor.alive
+
+    def batch_size(self, batch_size: int) -> "LinksFetchingCursor":
+        self._batch_size = batch_size
+        self.cursor.batch_size(batch_size)
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Any:
+        if not self._buffer:
+            batch = await self.cursor.to_list(self._batch_size)
+            if not batch:
+                raise StopAsyncIteration
+            await self.fetch_links(batch)
+            self._buffer.extend(batch)
+        return self._buffer.popleft()
+
+    async def to_list(self, length: int | None = None) -> list[Any]:
+        result: list[Any] = []
+        while self._buffer and (length is None or len(result) < length):
+            result.append(self._buffer.popleft())
+        if length is None or len(result) < length:
+            batch = await self.cursor.to_list(
+                None if length is None else length - len(result)
+            )
+            await self.fetch_links(batch)
+            result.extend(batch)
+        return result
+
+    async def close(self) -> None:
+        await self.cursor.close()
+
 
 class BaseCursorQuery(Generic[CursorResultType]):
     """
@@ -26,6 +98,7 @@ class BaseCursorQuery(Generic[CursorResultType]):
 
     cursor = None
     lazy_parse = False
+    parse_executor: Executor | None = None
 
     @abstractmethod
     def get_projection_model(self) -> type[BaseModel] | None: ...
@@ -33,7 +106,7 @@ class BaseCursorQuery(Generic[CursorResultType]):
     @abstractmethod
     async def get_cursor(
         self,
-    ) -> "AsyncCommandCursor[dict[str, Any]] | AsyncCursor[dict[str, Any]] | None": ...
+    ) -> "AsyncCommandCursor[dict[str, Any]] | AsyncCursor[dict[str, Any]] | LinksFetchingCursor | None": ...
 
     def __aiter__(self):
         return self
@@ -49,11 +122,152 @@ class BaseCursorQuery(Generic[CursorResultType]):
             return next_item
         return parse_obj(projection, next_item, lazy_parse=self.lazy_parse)  # type: ignore
 
+    def set_parse_executor(self, executor: Executor | None = None):
+        """
+        Set executor to parse the results in.
+        Results are split into chunks, which are parsed in parallel,
+        and the event loop is not blocked while a big result is parsed.
+        It overrides the `parse_executor` passed to `init_beanie`
+
+        :param executor: Optional[Executor] - thread or process pool.
+        Process pool workers must have the document models initialized
+        :return: self
+        """
+        self.parse_executor = executor
+        return self
+
+    def get_parse_executor(self) -> Executor | None:
+        if self.parse_executor is not None:
+            return self.parse_executor
+        document_model = getattr(self, "document_model", None)
+        return getattr(document_model, "_parse_executor", None)
+
+    def _parse_batch(self, batch: list[Any]) -> list[CursorResultType]:
+        projection = self.get_projection_model()
+        if projection is None:
+            return batch
+        return cast(
+            list[CursorResultType],
+            parse_batch(projection, batch, lazy_parse=self.lazy_parse),
+        )
+
+    async def _parse_results(self, batch: list[Any]) -> list[CursorResultType]:
+        executor = self.get_parse_executor()
+        projection = self.get_projection_model()
+        # lazy parsing is cheap and lazy models are bound to the loop side
+        if (
+            executor is None
+            or projection is None
+            or self.lazy_parse
+            or not batch
+        ):
+            return self._parse_batch(batch)
+        loop = asyncio.get_running_loop()
+        chunks = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor,
+                    parse_batch,
+                    projection,
+                    batch[i : i + PARSE_CHUNK_SIZE],
+                )
+                for i in range(0, len(batch), PARSE_CHUNK_SIZE)
+            )
+        )
+        return cast(
+            list[CursorResultType],
+            [item for chunk in chunks for item in chunk],
+        )
+
+    async def iter_batches(
+        self, batch_size: int = DEFAULT_BATCH_SIZE, prefetch: bool = True
+    ) -> AsyncIterator[list[CursorResultType]]:
+        """
+        Iterate over the results by batches.
+        Every batch is fetched from the cursor and parsed at once.
+        The cache is not used
+
+        :param batch_size: int - number of documents in a batch
+        :param prefetch: bool - fetch the next batch
+        while the current one is processed
+        :return: AsyncIterator[List[BaseModel]]
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        cursor = await self.get_cursor()
+        assert cursor is not None
+        cursor.batch_size(batch_size)
+        next_batch: asyncio.Future | None = None
+        try:
+            while True:
+                if next_batch is None:
+                    batch = await cursor.to_list(batch_size)
+                else:
+                    batch = await next_batch
+                    next_batch = None
+                if not batch:
+                    return
+                is_last = not cursor.alive
+                if prefetch and not is_last:
+                    next_batch = asyncio.ensure_future(
+                        cursor.to_list(batch_size)
+                    )
+                yield await self._parse_results(batch)
+                if is_last:
+                    return
+        finally:
+            if next_batch is not None:
+                next_batch.cancel()
+                with suppress(asyncio.CancelledError):
+                    await next_batch
+            await cursor.close()
+
+    async def stream(
+        self, batch_size: int = DEFAULT_BATCH_SIZE, queue_size: int = 2
+    ) -> AsyncIterator[CursorResultType]:
+        """
+        Iterate over the results one by one.
+        Batches are fetched and parsed in the background
+        and buffered in a bounded queue. When the queue is full,
+        fetching waits for the consumer
+
+        :param batch_size: int - number of documents in a batch
+        :param queue_size: int - max number of the buffered batches
+        :return: AsyncIterator[BaseModel]
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+        async def produce() -> None:
+            try:
+                async for batch in self.iter_batches(
+                    batch_size, prefetch=False
+                ):
+                    await queue.put(batch)
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(_STREAM_END)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                batch = await queue.get()
+                if batch is _STREAM_END:
+                    return
+                if isinstance(batch, Exception):
+                    raise batch
+                for item in batch:
+                    yield item
+        finally:
+            producer.cancel()
+            with suppress(asyncio.CancelledError):
+                await producer
+
     @abstractmethod
-    def _get_cache(self) -> list[dict[str, Any]]: ...
+    async def _get_cache(self) -> list[dict[str, Any]]: ...
 
     @abstractmethod
-    def _set_cache(self, data): ...
+    async def _set_cache(self, data): ...
 
     async def to_list(
         self, length: int | None = None
@@ -65,18 +279,9 @@ class BaseCursorQuery(Generic[CursorResultType]):
         :return: Union[List[BaseModel], List[Dict[str, Any]]]
         """
         cursor = await self.get_cursor()
-        pymongo_list: list[dict[str, Any]] = self._get_cache()
+        pymongo_list: list[dict[str, Any]] = await self._get_cache()
 
         if pymongo_list is None:
             pymongo_list = await cursor.to_list(length)
-            self._set_cache(pymongo_list)
-        projection = self.get_projection_model()
-        if projection is not None:
-            return cast(
-                list[CursorResultType],
-                [
-                    parse_obj(projection, i, lazy_parse=self.lazy_parse)
-                    for i in pymongo_list
-                ],
-            )
-        return cast(list[CursorResultType], pymongo_list)
+            await self._set_cache(pymongo_list)
+        return await self._parse_results(pymongo_list)
@@ -7,6 +7,7 @@ from pymongo.asynchronous.client_session import AsyncClientSession
 from pymongo.results import DeleteResult
 
 from beanie.odm.bulk import BulkWriter
+from beanie.odm.cache import CacheRegistry
 from beanie.odm.interfaces.clone import CloneInterface
 from beanie.odm.interfaces.session import SessionMethods
 
@@ -42,7 +43,7 @@ class DeleteMany(DeleteQuery):
         :return:
         """
         if self.bulk_writer is None:
-            return (
+            result = (
                 yield from self.document_model.get_pymongo_collection()
                 .delete_many(
                     self.find_query,
@@ -51,11 +52,15 @@ class DeleteMany(DeleteQuery):
                 )
                 .__await__()
             )
+            yield from CacheRegistry.invalidate(
+                self.document_model.get_collection_name()
+            ).__await__()
+            return result
         else:
-            self.bulk_writer.add_operation(
+            yield from self.bulk_writer.queue_operation(
                 self.document_model,
                 DeleteManyPyMongo(self.find_query, **self.pymongo_kwargs),
-            )
+            ).__await__()
             return None
 
 
@@ -68,7 +73,7 @@ class DeleteOne(DeleteQuery):
         :return:
         """
         if self.bulk_writer is None:
-            return (
+            result = (
                 yield from self.document_model.get_pymongo_collection()
                 .delete_one(
                     self.find_query,
@@ -77,10 +82,14 @@ class DeleteOne(DeleteQuery):
                 )
                 .__await__()
             )
+            yield from CacheRegistry.invalidate(
+                self.document_model.get_collection_name()
+            ).__await__()
+            return result
         else:
-            self.bulk_writer.add_operation(
+            yield from self.bulk_writer.queue_operation(
                 self.document_model,
                 DeleteOnePyMongo(self.find_query),
                 **self.pymongo_kwargs,
-            )
+            ).__await__()
             return None
@@ -1,4 +1,5 @@
 from collections.abc import Callable, Coroutine, Generator, Mapping
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -12,19 +13,21 @@ from typing import (
 from pydantic import BaseModel
 from pymongo import ReplaceOne
 from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.asynchronous.collection import AsyncCollection
 from pymongo.results import UpdateResult
 
 from beanie.exceptions import DocumentNotFound
 from beanie.odm.bulk import BulkWriter
-from beanie.odm.cache import LRUCache
-from beanie.odm.enums import SortDirection
+from beanie.odm.cache import CacheBackend, CacheRegistry
+from beanie.odm.enums import FetchLinksStrategy, SortDirection
+from beanie.odm.fields import LinkTypes
 from beanie.odm.interfaces.aggregation_methods import AggregateMethods
 from beanie.odm.interfaces.clone import CloneInterface
 from beanie.odm.interfaces.session import SessionMethods
 from beanie.odm.interfaces.update import UpdateMethods
 from beanie.odm.operators.find.logical import And
 from beanie.odm.queries.aggregation import AggregationQuery
-from beanie.odm.queries.cursor import BaseCursorQuery
+from beanie.odm.queries.cursor import BaseCursorQuery, LinksFetchingCursor
 from beanie.odm.queries.delete import (
     DeleteMany,
     DeleteOne,
@@ -37,9 +40,24 @@ from beanie.odm.queries.update import (
 )
 from beanie.odm.utils.dump import get_dict
 from beanie.odm.utils.encoder import Encoder
-from beanie.odm.utils.find import construct_lookup_queries, split_text_query
+from beanie.odm.utils.find import (
+    construct_lookup_queries,
+    fetch_links_batched,
+    get_query_fields,
+    has_back_direct_links,
+    split_link_queries,
+    split_text_query,
+)
+from beanie.odm.utils.matcher import compile_filter
 from beanie.odm.utils.parsing import parse_obj
-from beanie.odm.utils.projection import get_projection
+from beanie.odm.utils.projection import (
+    FieldsTree,
+    add_field_path,
+    get_projection,
+    get_projection_fields,
+    merge_fields,
+)
+from beanie.odm.utils.raw_bson import get_raw_bson_collection
 from beanie.odm.utils.relations import resolve_query_paths
 
 if TYPE_CHECKING:
@@ -76,10 +94,13 @@ class FindQuery(
         self.ignore_cache: bool = False
         self.encoders = self.document_model.get_bson_encoders()
         self.fetch_links: bool = False
+        self.fetch_links_strategy = FetchLinksStrategy.LOOKUP
         self.pymongo_kwargs: dict[str, Any] = {}
         self.lazy_parse = False
+        self.raw_bson = False
         self.nesting_depth: int | None = None
         self.nesting_depths_per_field: dict[str, int] | None = None
+        self._cache_key_memo: str | None = None
 
     def prepare_find_expressions(self):
         if self.document_model.get_link_fields() is not None:
@@ -90,6 +111,18 @@ class FindQuery(
                     fetch_links=self.fetch_links,
                 )
 
+    def get_find_collection(self) -> AsyncCollection:
+        """
+        Collection to run the find operations with.
+        Returns documents as RawBSONDocument if `raw_bson` is used
+
+        :return: AsyncCollection
+        """
+        collection = self.document_model.get_pymongo_collection()
+        if self.raw_bson:
+            return get_raw_bson_collection(collection)
+        return collection
+
     def get_filter_query(self) -> dict[str, Any]:
         """
 
@@ -104,6 +137,29 @@ class FindQuery(
         else:
             return {}
 
+    def get_matcher(self) -> Callable[[Any], bool]:
+        """
+        Compile the filter query to a predicate, which checks
+        if a document matches it without a round trip to the database.
+        Models are encoded before the check, dicts must be encoded already.
+        Conditions on the fields of the fetched links are not supported
+
+        :return: Callable[[Union[BaseModel, Mapping[str, Any]]], bool]
+        """
+        predicate = compile_filter(self.get_filter_query())
+        encoder = Encoder(
+            custom_encoders=self.encoders,
+            to_db=True,
+            keep_nulls=self.document_model.get_settings().keep_nulls,
+        )
+
+        def matcher(document: Any) -> bool:
+            if isinstance(document, BaseModel):
+                document = encoder.encode(document)
+            return predicate(document)
+
+        return matcher
+
     def delete(
         self,
         session: AsyncClientSession | None = None,
@@ -132,6 +188,7 @@ class FindQuery(
         """
         if projection_model is not None:
             self.projection_model = projection_model
+            self._cache_key_memo = None
         return self
 
     def get_projection_model(self) -> type[FindQueryResultType]:
@@ -200,7 +257,9 @@ class FindMany(
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -217,7 +276,9 @@ class FindMany(
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -233,7 +294,9 @@ class FindMany(
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -252,10 +315,15 @@ class FindMany(
         :param projection_model: Optional[type[BaseModel]] - projection model
         :param session: Optional[AsyncClientSession] - pymongo session
         :param ignore_cache: bool
+        :param fetch_links_strategy: Optional[FetchLinksStrategy] - how to
+        fetch the links: with `$lookup` stages or with batched `$in` queries
+        :param lazy_parse: bool
+        :param raw_bson: bool - decode the documents lazily from raw BSON
         :param **pymongo_kwargs: pymongo native parameters for find operation (if Document class contains links, this parameter must fit the respective parameter of the aggregate MongoDB function)
         :return: FindMany - query instance
         """
         self.find_expressions += args  # type: ignore # bool workaround
+        self._cache_key_memo = None
         self.skip(skip)
         self.limit(limit)
         self.sort(sort)
@@ -263,11 +331,17 @@ class FindMany(
         self.set_session(session=session)
         self.ignore_cache = ignore_cache
         self.fetch_links = fetch_links
+        if fetch_links_strategy is not None:
+            self.fetch_links_strategy = FetchLinksStrategy(
+                fetch_links_strategy
+            )
         self.pymongo_kwargs.update(pymongo_kwargs)
         self.nesting_depth = nesting_depth
         self.nesting_depths_per_field = nesting_depths_per_field
         if lazy_parse is True:
             self.lazy_parse = lazy_parse
+        if raw_bson is True:
+            self.raw_bson = raw_bson
         return self
 
     # TODO probably merge FindOne and FindMany to one class to avoid this
@@ -311,7 +385,9 @@ class FindMany(
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -328,7 +404,9 @@ class FindMany(
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -344,7 +422,9 @@ class FindMany(
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -363,7 +443,9 @@ class FindMany(
             session=session,
             ignore_cache=ignore_cache,
             fetch_links=fetch_links or self.fetch_links,
+            fetch_links_strategy=fetch_links_strategy,
             lazy_parse=lazy_parse,
+            raw_bson=raw_bson,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
             **pymongo_kwargs,
@@ -386,6 +468,7 @@ class FindMany(
         the sort order for this query.
         :return: self
         """
+        self._cache_key_memo = None
         for arg in args:
             if arg is None:
                 pass
@@ -418,6 +501,7 @@ class FindMany(
         """
         if n is not None:
             self.skip_number = n
+            self._cache_key_memo = None
         return self
 
     def limit(self, n: int | None) -> "FindMany[FindQueryResultType]":
@@ -428,6 +512,7 @@ class FindMany(
         """
         if n is not None:
             self.limit_number = n
+            self._cache_key_memo = None
         return self
 
     def update(
@@ -576,113 +661,231 @@ class FindMany(
         :return:[AggregationQuery](query.md#aggregationquery)
         """
         self.set_session(session=session)
-        return self.AggregationQueryType(
-            self.document_model,
-            self.build_aggregation_pipeline(*aggregation_pipeline),
-            find_query={},
-            projection_model=projection_model,
-            ignore_cache=ignore_cache,
-            **pymongo_kwargs,
-        ).set_session(session=self.session)
+        return (
+            self.AggregationQueryType(
+                self.document_model,
+                self.build_aggregation_pipeline(*aggregation_pipeline),
+                find_query={},
+                projection_model=projection_model,
+                ignore_cache=ignore_cache,
+                **pymongo_kwargs,
+            )
+            .set_session(session=self.session)
+            .set_parse_executor(self.parse_executor)
+        )
 
     @property
     def _cache_key(self) -> str:
-        return LRUCache.create_key(
-            {
-                "type": "FindMany",
-                "filter": self.get_filter_query(),
-                "sort": self.sort_expressions,
-                "projection": get_projection(self.projection_model),
-                "skip": self.skip_number,
-                "limit": self.limit_number,
-            }
-        )
+        if self._cache_key_memo is None:
+            self._cache_key_memo = CacheBackend.create_key(
+                {
+                    "type": "FindMany",
+                    "filter": self.get_filter_query(),
+                    "sort": self.sort_expressions,
+                    "projection": get_projection(self.projection_model),
+                    "skip": self.skip_number,
+                    "limit": self.limit_number,
+                    "fetch_links": self.fetch_links,
+                    "fetch_links_strategy": self.fetch_links_strategy.value,
+                    "nesting_depth": self.nesting_depth,
+                    "nesting_depths_per_field": self.nesting_depths_per_field,
+                    "pymongo_kwargs": self.pymongo_kwargs,
+                }
+            )
+        return self._cache_key_memo
 
-    def _get_cache(self):
+    async def _get_cache(self):
         if (
             self.document_model.get_settings().use_cache
             and self.ignore_cache is False
         ):
-            return self.document_model._cache.get(self._cache_key)  # type: ignore
+            return await self.document_model._cache.get(  # type: ignore
+                self.document_model.get_collection_name(), self._cache_key
+            )
         else:
             return None
 
-    def _set_cache(self, data):
+    async def _set_cache(self, data):
         if (
             self.document_model.get_settings().use_cache
             and self.ignore_cache is False
         ):
-            return self.document_model._cache.set(self._cache_key, data)  # type: ignore
+            await self.document_model._cache.set(  # type: ignore
+                self.document_model.get_collection_name(),
+                self._cache_key,
+                data,
+            )
+
+    def _get_lookup_fields(self) -> FieldsTree | None:
+        """
+        Fields, which the query reads from the documents and the linked ones
+
+        :return: Optional[FieldsTree] - None, if all the fields are read
+        """
+        fields = get_projection_fields(self.projection_model)
+        if fields is None:
+            return None
+        query_fields = get_query_fields(self.get_filter_query())
+        if query_fields is None:
+            return None
+        merge_fields(fields, query_fields)
+        for key, _ in self.sort_expressions:
+            add_field_path(fields, key)
+        return fields
 
     def build_aggregation_pipeline(
         self, *extra_stages: dict[str, Any]
     ) -> list[dict[str, Any]]:
         if self.fetch_links:
-            aggregation_pipeline = construct_lookup_queries(
+            lookup_stages = construct_lookup_queries(
                 self.document_model,
                 nesting_depth=self.nesting_depth,
                 nesting_depths_per_field=self.nesting_depths_per_field,
+                # the extra stages can read any field
+                fields=None if extra_stages else self._get_lookup_fields(),
             )
+            link_fields = self.document_model.get_link_fields() or {}
         else:
-            aggregation_pipeline = []
+            lookup_stages = []
+            link_fields = {}
+        aggregation_pipeline: list[dict[str, Any]] = []
+        link_queries: list[dict[str, Any]] = []
         filter_query = self.get_filter_query()
 
         if filter_query:
             text_queries, non_text_queries = split_text_query(filter_query)
 
+            # $text must be the first stage
             if text_queries:
-                aggregation_pipeline.insert(
-                    0,
+                aggregation_pipeline.append(
                     {
                         "$match": (
                             {"$and": text_queries}
                             if len(text_queries) > 1
                             else text_queries[0]
                         )
-                    },
+                    }
                 )
 
-            if non_text_queries:
+            # the queries, which don't read the links, run before
+            # the lookups to decrease the number of looked up documents
+            local_queries, link_queries = split_link_queries(
+                non_text_queries, link_fields
+            )
+            if local_queries:
                 aggregation_pipeline.append(
                     {
                         "$match": (
-                            {"$and": non_text_queries}
-                            if len(non_text_queries) > 1
-                            else non_text_queries[0]
+                            {"$and": local_queries}
+                            if len(local_queries) > 1
+                            else local_queries[0]
                         )
                     }
                 )
 
-        if extra_stages:
-            aggregation_pipeline.extend(extra_stages)
+        page_stages: list[dict[str, Any]] = []
         sort_pipeline = {"$sort": {i[0]: i[1] for i in self.sort_expressions}}
         if sort_pipeline["$sort"]:
-            aggregation_pipeline.append(sort_pipeline)
+            page_stages.append(sort_pipeline)
         if self.skip_number != 0:
-            aggregation_pipeline.append({"$skip": self.skip_number})
+            page_stages.append({"$skip": self.skip_number})
         if self.limit_number != 0:
-            aggregation_pipeline.append({"$limit": self.limit_number})
+            page_stages.append({"$limit": self.limit_number})
+
+        # the page can be selected before the lookups, if it doesn't
+        # depend on the linked documents and each document is looked up
+        # into exactly one result document. Back direct links are unwound
+        # and can multiply the documents
+        unwound_fields = {
+            f"_link_{name}"
+            for name, link_info in link_fields.items()
+            if link_info.link_type
+            in (LinkTypes.BACK_DIRECT, LinkTypes.OPTIONAL_BACK_DIRECT)
+        }
+        if (
+            not extra_stages
+            and not link_queries
+            and all(
+                key.split(".", 1)[0] not in link_fields
+                for key, _ in self.sort_expressions
+            )
+            and not any(
+                stage["$lookup"]["as"] in unwound_fields
+                for stage in lookup_stages
+                if "$lookup" in stage
+            )
+        ):
+            return aggregation_pipeline + page_stages + lookup_stages
+
+        aggregation_pipeline.extend(lookup_stages)
+        if link_queries:
+            aggregation_pipeline.append(
+                {
+                    "$match": (
+                        {"$and": link_queries}
+                        if len(link_queries) > 1
+                        else link_queries[0]
+                    )
+                }
+            )
+        if extra_stages:
+            aggregation_pipeline.extend(extra_stages)
+        aggregation_pipeline.extend(page_stages)
         return aggregation_pipeline
 
+    def _is_fetched_batched(self) -> bool:
+        """
+        The links are fetched with the batched queries, if the strategy
+        is chosen, the query doesn't read the linked documents fields
+        and there are no back direct links. Otherwise, the `$lookup`
+        stages are used
+
+        :return: bool
+        """
+        if (
+            not self.fetch_links
+            or self.fetch_links_strategy is not FetchLinksStrategy.BATCHED
+            or self.raw_bson
+        ):
+            return False
+        link_fields = self.document_model.get_link_fields() or {}
+        if has_back_direct_links(link_fields.values()):
+            return False
+        query_fields = get_query_fields(self.get_filter_query())
+        if query_fields is None or any(
+            name in link_fields for name in query_fields
+        ):
+            return False
+        if any(
+            key.split(".", 1)[0] in link_fields
+            for key, _ in self.sort_expressions
+        ):
+            return False
+        projection = get_projection(self.projection_model) or {}
+        # the projection is applied before the links are fetched
+        return all(
+            value in (0, 1)
+            and (key in link_fields or key.split(".", 1)[0] not in link_fields)
+            for key, value in projection.items()
+        )
+
     async def get_cursor(
         self,
-    ) -> "AsyncCommandCursor[dict[str, Any]] | AsyncCursor[dict[str, Any]] | None":
-        if self.fetch_links:
+    ) -> "AsyncCommandCursor[dict[str, Any]] | AsyncCursor[dict[str, Any]] | LinksFetchingCursor | None":
+        if self.fetch_links and not self._is_fetched_batched():
             aggregation_pipeline = self.build_aggregation_pipeline()
             projection = get_projection(self.projection_model)
 
             if projection is not None:
                 aggregation_pipeline.append({"$project": projection})
 
-            return (
-                await self.document_model.get_pymongo_collection().aggregate(
-                    aggregation_pipeline,
-                    session=self.session,
-                    **self.pymongo_kwargs,
-                )
+            return await self.get_find_collection().aggregate(
+                aggregation_pipeline,
+                session=self.session,
+                **self.pymongo_kwargs,
             )
 
-        return self.document_model.get_pymongo_collection().find(
+        cursor = self.get_find_collection().find(
             filter=self.get_filter_query(),
             sort=self.sort_expressions,
             projection=get_projection(self.projection_model),
@@ -691,6 +894,19 @@ class FindMany(
             session=self.session,
             **self.pymongo_kwargs,
         )
+        if self.fetch_links:
+            return LinksFetchingCursor(
+                cursor,
+                partial(
+                    fetch_links_batched,
+                    self.document_model,
+                    nesting_depth=self.nesting_depth,
+                    nesting_depths_per_field=self.nesting_depths_per_field,
+                    fields=self._get_lookup_fields(),
+                    session=self.session,
+                ),
+            )
+        return cursor
 
     async def first_or_none(self) -> FindQueryResultType | None:
         """
@@ -746,25 +962,24 @@ class FindMany(
         """
         if self.fetch_links:
             aggregation_pipeline = [
-                *(
-                    stage
-                    for stage in self.build_aggregation_pipeline()
-                    if "$sort" not in stage
-                    and "$skip" not in stage
-                    and "$limit" not in stage
-                ),
-                {
-                    "$unwind": {
-                        "path": f"${key}",
-                        "preserveNullAndEmptyArrays": True,
-                    }
-                },
-                {
-                    "$group": {
-                        "_id": None,
-                        "distinct": {"$addToSet": f"${key}"},
-                    }
-                },
+                stage
+                for stage in self.build_aggregation_pipeline(
+                    {
+                        "$unwind": {
+                            "path": f"${key}",
+                            "preserveNullAndEmptyArrays": True,
+                        }
+                    },
+                    {
+                        "$group": {
+                            "_id": None,
+                            "distinct": {"$addToSet": f"${key}"},
+                        }
+                    },
+                )
+                if "$sort" not in stage
+                and "$skip" not in stage
+                and "$limit" not in stage
             ]
             kwargs = {**self.pymongo_kwargs, **kwargs}
             cursor = (
@@ -831,6 +1046,8 @@ class FindOne(FindQuery[FindQueryResultType]):
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -844,6 +1061,8 @@ class FindOne(FindQuery[FindQueryResultType]):
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -856,6 +1075,8 @@ class FindOne(FindQuery[FindQueryResultType]):
         session: AsyncClientSession | None = None,
         ignore_cache: bool = False,
         fetch_links: bool = False,
+        fetch_links_strategy: FetchLinksStrategy | None = None,
+        raw_bson: bool = False,
         nesting_depth: int | None = None,
         nesting_depths_per_field: dict[str, int] | None = None,
         **pymongo_kwargs: Any,
@@ -869,14 +1090,23 @@ class FindOne(FindQuery[FindQueryResultType]):
         :param projection_model: Optional[type[BaseModel]] - projection model
         :param session: Optional[AsyncClientSession] - pymongo session
         :param ignore_cache: bool
+        :param fetch_links_strategy: Optional[FetchLinksStrategy] - how to
+        fetch the links: with `$lookup` stages or with batched `$in` queries
+        :param raw_bson: bool - decode the document lazily from raw BSON
         :param **pymongo_kwargs: pymongo native parameters for find operation (if Document class contains links, this parameter must fit the respective parameter of the aggregate MongoDB function)
         :return: FindOne - query instance
         """
         self.find_expressions += args  # type: ignore # bool workaround
+        self._cache_key_memo = None
         self.project(projection_model)
         self.set_session(session=session)
         self.ignore_cache = ignore_cache
         self.fetch_links = fetch_links or self.fetch_links
+        if fetch_links_strategy is not None:
+            self.fetch_links_strategy = FetchLinksStrategy(
+                fetch_links_strategy
+            )
+        self.raw_bson = raw_bson or self.raw_bson
         self.pymongo_kwargs.update(pymongo_kwargs)
         self.nesting_depth = nesting_depth
         self.nesting_depths_per_field = nesting_depths_per_field
@@ -1024,12 +1254,15 @@ class FindOne(FindQuery[FindQueryResultType]):
                     session=self.session,
                 )
             )
+            await CacheRegistry.invalidate(
+                self.document_model.get_collection_name()
+            )
 
             if not result.raw_result["updatedExisting"]:
                 raise DocumentNotFound
             return result
         else:
-            bulk_writer.add_operation(
+            await bulk_writer.queue_operation(
                 self.document_model,
                 ReplaceOne(
                     self.get_filter_query(),
@@ -1050,18 +1283,39 @@ class FindOne(FindQuery[FindQueryResultType]):
                 *self.find_expressions,
                 session=self.session,
                 fetch_links=self.fetch_links,
+                fetch_links_strategy=self.fetch_links_strategy,
                 projection_model=self.projection_model,
+                raw_bson=self.raw_bson,
                 nesting_depth=self.nesting_depth,
                 nesting_depths_per_field=self.nesting_depths_per_field,
                 **self.pymongo_kwargs,
             ).first_or_none()
-        return await self.document_model.get_pymongo_collection().find_one(
+        return await self.get_find_collection().find_one(
             filter=self.get_filter_query(),
             projection=get_projection(self.projection_model),
             session=self.session,
             **self.pymongo_kwargs,
         )
 
+    @property
+    def _cache_key(self) -> str:
+        if self._cache_key_memo is None:
+            self._cache_key_memo = CacheBackend.create_key(
+                {
+                    "type": "FindOne",
+                    "filter": self.get_filter_query(),
+                    # linked documents are cached parsed
+                    "projection_model": f"{self.projection_model.__module__}."
+                    f"{self.projection_model.__qualname__}",
+                    "fetch_links": self.fetch_links,
+                    "fetch_links_strategy": self.fetch_links_strategy.value,
+                    "nesting_depth": self.nesting_depth,
+                    "nesting_depths_per_field": self.nesting_depths_per_field,
+                    "pymongo_kwargs": self.pymongo_kwargs,
+                }
+            )
+        return self._cache_key_memo
+
     def __await__(
         self,
     ) -> Generator[Coroutine, Any, FindQueryResultType | None]:
@@ -1074,19 +1328,16 @@ class FindOne(FindQuery[FindQueryResultType]):
             self.document_model.get_settings().use_cache
             and self.ignore_cache is False
         ):
-            cache_key = LRUCache.create_key(
-                "FindOne",
-                self.get_filter_query(),
-                self.projection_model,
-                self.session,
-                self.fetch_links,
-            )
-            document: dict[str, Any] = self.document_model._cache.get(  # type: ignore
-                cache_key
-            )
+            cache = self.document_model._cache
+            collection = self.document_model.get_collection_name()
+            document: dict[str, Any] = yield from cache.get(  # type: ignore
+                collection, self._cache_key
+            ).__await__()
             if document is None:
                 document = yield from self._find_one().__await__()  # type: ignore
-                self.document_model._cache.set(cache_key, document)  # type: ignore
+                yield from cache.set(  # type: ignore
+                    collection, self._cache_key, document
+                ).__await__()
         else:
             document = yield from self._find_one().__await__()  # type: ignore
         if document is None:
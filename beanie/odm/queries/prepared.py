@@ -0,0 +1,212 @@
+from collections.abc import Callable, Mapping
+from typing import Any, Generic
+
+from beanie.odm.fields import Param
+from beanie.odm.queries.find import FindMany, FindQueryResultType
+from beanie.odm.utils.encoder import Encoder
+
+Binder = Callable[[Mapping[str, Any]], Any]
+
+
+def compile_binder(value: Any, names: set[str]) -> Binder | None:
+    """
+    Compile the value with the parameters to a function, which substitutes
+    the values of the parameters. The parts of the value without
+    the parameters are shared between the results
+
+    :param value: Any - encoded query or pipeline with `Param` placeholders
+    :param names: Set[str] - names of the found parameters are added here
+    :return: Optional[Callable[[Mapping[str, Any]], Any]] - None,
+        if the value has no parameters
+    """
+    if isinstance(value, Param):
+        names.add(value.name)
+        return lambda values: values[value.name]
+    if isinstance(value, Mapping):
+        items = [
+            (key, item, compile_binder(item, names))
+            for key, item in value.items()
+        ]
+        if all(binder is None for _, _, binder in items):
+            return None
+        return lambda values: {
+            key: item if binder is None else binder(values)
+            for key, item, binder in items
+        }
+    if isinstance(value, list):
+        elements = [(item, compile_binder(item, names)) for item in value]
+        if all(binder is None for _, binder in elements):
+            return None
+        return lambda values: [
+            item if binder is None else binder(values)
+            for item, binder in elements
+        ]
+    return None
+
+
+def _get_pipeline_state(query: FindMany) -> tuple:
+    # everything, except the filter, the pipeline depends on
+    return (
+        tuple(
+            (str(key), direction) for key, direction in query.sort_expressions
+        ),
+        query.skip_number,
+        query.limit_number,
+        query.projection_model,
+        query.fetch_links,
+        query.fetch_links_strategy,
+        query.nesting_depth,
+        query.nesting_depths_per_field,
+        query.raw_bson,
+    )
+
+
+class PreparedQuery(Generic[FindQueryResultType]):
+    """
+    Find query, which is compiled once and is run many times
+    with the different values of its parameters.
+
+    The filter is resolved and encoded, and the aggregation pipeline
+    of the links fetching is built, when the query is prepared.
+    Binding only encodes the values of the parameters
+    and puts them in place of the `Param` placeholders.
+
+    Example:
+
+    ```python
+    query = Product.prepare(Product.price < Param("max_price"))
+    products = await query.bind(max_price=10).to_list()
+    ```
+    """
+
+    def __init__(self, query: FindMany[FindQueryResultType]):
+        """
+        :param query: FindMany - query with `Param` placeholders
+            in its search criteria
+        """
+        self.query = query
+        names: set[str] = set()
+        self.filter_query = query.get_filter_query()
+        self._bind_filter = compile_binder(self.filter_query, names)
+        self.is_fetched_batched = query._is_fetched_batched()
+        self.pipeline: list[dict[str, Any]] | None = None
+        self._bind_pipeline: Binder | None = None
+        if query.fetch_links:
+            self.pipeline = query.build_aggregation_pipeline()
+            self._bind_pipeline = compile_binder(self.pipeline, set())
+        self.params = frozenset(names)
+        self.state = _get_pipeline_state(query)
+        self._encoder = Encoder(custom_encoders=query.encoders)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def bind(self, **params: Any) -> "BoundFindMany[FindQueryResultType]":
+        """
+        Find query with the given values of the parameters
+
+        :param params: values of the parameters by their names
+        :return: BoundFindMany - query instance
+        """
+        missing = self.params - params.keys()
+        if missing:
+            raise ValueError(f"Missing query parameters: {sorted(missing)}")
+        unknown = params.keys() - self.params
+        if unknown:
+            raise ValueError(f"Unknown query parameters: {sorted(unknown)}")
+        values = {
+            name: self._encoder.encode(value) for name, value in params.items()
+        }
+        return BoundFindMany(self, values)
+
+    def bind_filter(self, values: Mapping[str, Any]) -> dict[str, Any]:
+        """
+        Filter query with the given encoded values of the parameters
+
+        :param values: Mapping[str, Any] - encoded values by the names
+        :return: Dict[str, Any]
+        """
+        if self._bind_filter is None:
+            return dict(self.filter_query)
+        return self._bind_filter(values)
+
+    def bind_pipeline(
+        self, values: Mapping[str, Any]
+    ) -> list[dict[str, Any]] | None:
+        """
+        Aggregation pipeline with the given encoded values of the parameters
+
+        :param values: Mapping[str, Any] - encoded values by the names
+        :return: Optional[List[Dict[str, Any]]] - None, if the query
+            doesn't fetch the links
+        """
+        if self.pipeline is None:
+            return None
+        if self._bind_pipeline is None:
+            return list(self.pipeline)
+        return self._bind_pipeline(values)
+
+
+class BoundFindMany(FindMany[FindQueryResultType]):
+    """
+    Find query of the prepared query with the bound parameters.
+    It can be changed like the usual find query. The changes,
+    which affect the aggregation pipeline, make it to be built again
+    """
+
+    def __init__(
+        self,
+        prepared: PreparedQuery[FindQueryResultType],
+        values: Mapping[str, Any],
+    ):
+        query = prepared.query
+        super().__init__(document_model=query.document_model)
+        self.find_many(
+            projection_model=query.projection_model,
+            skip=query.skip_number,
+            limit=query.limit_number,
+            sort=list(query.sort_expressions),
+            session=query.session,
+            ignore_cache=query.ignore_cache,
+            fetch_links=query.fetch_links,
+            fetch_links_strategy=query.fetch_links_strategy,
+            lazy_parse=query.lazy_parse,
+            raw_bson=query.raw_bson,
+            nesting_depth=query.nesting_depth,
+            nesting_depths_per_field=query.nesting_depths_per_field,
+            **query.pymongo_kwargs,
+        )
+        self.prepared = prepared
+        self.values = values
+        self.bound_filter_query = prepared.bind_filter(values)
+
+    def _is_prepared(self) -> bool:
+        return (
+            not self.find_expressions
+            and _get_pipeline_state(self) == self.prepared.state
+        )
+
+    def get_filter_query(self) -> dict[str, Any]:
+        if not self.find_expressions:
+            return self.bound_filter_query
+        filter_query = super().get_filter_query()
+        if not self.bound_filter_query:
+            return filter_query
+        return {"$and": [self.bound_filter_query, filter_query]}
+
+    def build_aggregation_pipeline(
+        self, *extra_stages: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        if not extra_stages and self._is_prepared():
+            pipeline = self.prepared.bind_pipeline(self.values)
+            if pipeline is not None:
+                return pipeline
+        return super().build_aggregation_pipeline(*extra_stages)
+
+    def _is_fetched_batched(self) -> bool:
+        if self._is_prepared():
+            return self.prepared.is_fetched_batched
+        return super()._is_fetched_batched()
@@ -10,6 +10,7 @@ from pymongo.asynchronous.client_session import AsyncClientSession
 from pymongo.results import InsertOneResult, UpdateResult
 
 from beanie.odm.bulk import BulkWriter
+from beanie.odm.cache import CacheRegistry
 from beanie.odm.interfaces.clone import CloneInterface
 from beanie.odm.interfaces.session import SessionMethods
 from beanie.odm.interfaces.update import (
@@ -160,7 +161,7 @@ class UpdateMany(UpdateQuery):
 
     async def _update(self):
         if self.bulk_writer is None:
-            return (
+            result = (
                 await self.document_model.get_pymongo_collection().update_many(
                     self.find_query,
                     self.update_query,
@@ -168,8 +169,12 @@ class UpdateMany(UpdateQuery):
                     **self.pymongo_kwargs,
                 )
             )
+            await CacheRegistry.invalidate(
+                self.document_model.get_collection_name()
+            )
+            return result
         else:
-            self.bulk_writer.add_operation(
+            await self.bulk_writer.queue_operation(
                 self.document_model,
                 UpdateManyPyMongo(
                     self.find_query, self.update_query, **self.pymongo_kwargs
@@ -295,12 +300,16 @@ class UpdateOne(UpdateQuery):
     async def _update(self):
         if not self.bulk_writer:
             if self.response_type is UpdateResponse.UPDATE_RESULT:
-                return await self.document_model.get_pymongo_collection().update_one(
+                update_result = await self.document_model.get_pymongo_collection().update_one(
                     self.find_query,
                     self.update_query,
                     session=self.session,
                     **self.pymongo_kwargs,
                 )
+                await CacheRegistry.invalidate(
+                    self.document_model.get_collection_name()
+                )
+                return update_result
             else:
                 result = await self.document_model.get_pymongo_collection().find_one_and_update(
                     self.find_query,
@@ -313,11 +322,14 @@ class UpdateOne(UpdateQuery):
                     ),
                     **self.pymongo_kwargs,
                 )
+                await CacheRegistry.invalidate(
+                    self.document_model.get_collection_name()
+                )
                 if result is not None:
                     result = parse_obj(self.document_model, result)
                 return result
         else:
-            self.bulk_writer.add_operation(
+            await self.bulk_writer.queue_operation(
                 self.document_model,
                 UpdateOnePyMongo(
                     self.find_query, self.update_query, **self.pymongo_kwargs
@@ -5,13 +5,17 @@ from pydantic import BaseModel, ConfigDict, Field
 from pymongo.asynchronous.collection import AsyncCollection
 from pymongo.asynchronous.database import AsyncDatabase
 
+from beanie.odm.cache import CacheBackend
+
 
 class ItemSettings(BaseModel):
     name: str | None = None
 
     use_cache: bool = False
     cache_capacity: int = 32
+    cache_max_bytes: int | None = None
     cache_expiration_time: timedelta = timedelta(minutes=10)
+    cache_backend: CacheBackend | None = None
     bson_encoders: dict[Any, Any] = Field(default_factory=dict)
     projection: dict[str, Any] | None = None
 
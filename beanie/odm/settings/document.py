@@ -1,5 +1,6 @@
 from pydantic import ConfigDict, Field
 
+from beanie.odm.enums import StateManagementMode
 from beanie.odm.fields import IndexModelField
 from beanie.odm.settings.base import ItemSettings
 from beanie.odm.settings.timeseries import TimeSeriesConfig
@@ -10,6 +11,7 @@ class DocumentSettings(ItemSettings):
     use_state_management: bool = False
     state_management_replace_objects: bool = False
     state_management_save_previous: bool = False
+    state_management_mode: StateManagementMode = StateManagementMode.SNAPSHOT
     validate_on_save: bool = False
     use_revision: bool = False
     single_root_inheritance: bool = False
@@ -21,6 +23,7 @@ class DocumentSettings(ItemSettings):
     lazy_parsing: bool = False
 
     keep_nulls: bool = True
+    local_update: bool = False
 
     action_conflict_resolution: ActionConflictResolution = (
         ActionConflictResolution.UPDATE_WINS
@@ -0,0 +1,215 @@
+import re
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from bson import Binary, DBRef, Decimal128, MaxKey, MinKey, ObjectId, Regex
+from bson.timestamp import Timestamp
+
+# Order of the BSON types, used by MongoDB to compare values
+# of different types
+_MIN_KEY = 1
+_NULL = 2
+_NUMBER = 3
+_STRING = 4
+_OBJECT = 5
+_ARRAY = 6
+_BINARY = 7
+_OBJECT_ID = 8
+_BOOLEAN = 9
+_DATE = 10
+_TIMESTAMP = 11
+_REGEX = 12
+_MAX_KEY = 13
+
+
+def get_type_order(value: Any) -> int:
+    """
+    Position of the BSON type of the value in the MongoDB comparison order
+
+    :param value: Any - encoded value
+    :return: int
+    """
+    if value is None:
+        return _NULL
+    if isinstance(value, bool):
+        return _BOOLEAN
+    if is_number(value):
+        return _NUMBER
+    if isinstance(value, str):
+        return _STRING
+    if isinstance(value, (Mapping, DBRef)):
+        return _OBJECT
+    if isinstance(value, (list, tuple)):
+        return _ARRAY
+    if isinstance(value, (bytes, UUID)):
+        return _BINARY
+    if isinstance(value, ObjectId):
+        return _OBJECT_ID
+    if isinstance(value, datetime):
+        return _DATE
+    if isinstance(value, Timestamp):
+        return _TIMESTAMP
+    if isinstance(value, (Regex, re.Pattern)):
+        return _REGEX
+    if isinstance(value, MinKey):
+        return _MIN_KEY
+    if isinstance(value, MaxKey):
+        return _MAX_KEY
+    raise TypeError(f"Can't compare {type(value).__name__}")
+
+
+def is_number(value: Any) -> bool:
+    """
+    Check if the value is a BSON number
+
+    :param value: Any - encoded value
+    :return: bool
+    """
+    return isinstance(
+        value, (int, float, Decimal, Decimal128)
+    ) and not isinstance(value, bool)
+
+
+def to_decimal(value: Any) -> Decimal:
+    """
+    Convert a BSON number to Decimal to calculate and compare
+    numbers of different types without losing precision
+
+    :param value: Any - BSON number
+    :return: Decimal
+    """
+    if isinstance(value, Decimal128):
+        return value.to_decimal()
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(value)
+
+
+def _sign(value: Any) -> int:
+    return (value > 0) - (value < 0)
+
+
+def _compare_numbers(left: Any, right: Any) -> int:
+    left, right = to_decimal(left), to_decimal(right)
+    # NaN is less than any other number
+    if left.is_nan() or right.is_nan():
+        return int(not left.is_nan()) - int(not right.is_nan())
+    return (left > right) - (left < right)
+
+
+def _to_utc(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _get_binary(value: Any) -> tuple[int, int, bytes]:
+    if isinstance(value, UUID):
+        value = Binary.from_uuid(value)
+    subtype = value.subtype if isinstance(value, Binary) else 0
+    return len(value), subtype, bytes(value)
+
+
+def _get_regex(value: Any) -> tuple[str, str]:
+    if isinstance(value, re.Pattern):
+        value = Regex.from_native(value)
+    flags = value.flags
+    if isinstance(flags, int):
+        flags = "".join(
+            letter
+            for letter, flag in zip(
+                "ilmsux",
+                (
+                    re.IGNORECASE,
+                    re.LOCALE,
+                    re.MULTILINE,
+                    re.DOTALL,
+                    re.UNICODE,
+                    re.VERBOSE,
+                ),
+                strict=True,
+            )
+            if flags & flag
+        )
+    return value.pattern, flags
+
+
+def _compare_sequences(left: Any, right: Any) -> int:
+    for left_item, right_item in zip(left, right, strict=False):
+        result = compare_values(left_item, right_item)
+        if result:
+            return result
+    return _sign(len(left) - len(right))
+
+
+def _compare_objects(left: Mapping, right: Mapping) -> int:
+    for (left_key, left_value), (right_key, right_value) in zip(
+        left.items(), right.items(), strict=False
+    ):
+        result = _sign(
+            get_type_order(left_value) - get_type_order(right_value)
+        )
+        if result:
+            return result
+        result = (left_key > right_key) - (left_key < right_key)
+        if result:
+            return result
+        result = compare_values(left_value, right_value)
+        if result:
+            return result
+    return _sign(len(left) - len(right))
+
+
+def compare_values(left: Any, right: Any) -> int:
+    """
+    Compare two encoded values like MongoDB does it.
+    Values of different types are ordered by their BSON types
+
+    :param left: Any - encoded value
+    :param right: Any - encoded value
+    :return: int - negative, if left is less than right, zero, if they
+    are equal, and positive otherwise
+    """
+    left_order, right_order = get_type_order(left), get_type_order(right)
+    if left_order != right_order:
+        return _sign(left_order - right_order)
+    if left_order == _NUMBER:
+        return _compare_numbers(left, right)
+    if left_order == _OBJECT:
+        if isinstance(left, DBRef):
+            left = left.as_doc()
+        if isinstance(right, DBRef):
+            right = right.as_doc()
+        return _compare_objects(left, right)
+    if left_order == _ARRAY:
+        return _compare_sequences(left, right)
+    if left_order == _BINARY:
+        left, right = _get_binary(left), _get_binary(right)
+    elif left_order == _DATE:
+        left, right = _to_utc(left), _to_utc(right)
+    elif left_order == _TIMESTAMP:
+        left, right = (left.time, left.inc), (right.time, right.inc)
+    elif left_order == _REGEX:
+        left, right = _get_regex(left), _get_regex(right)
+    elif left_order in (_NULL, _MIN_KEY, _MAX_KEY):
+        return 0
+    return (left > right) - (left < right)
+
+
+def values_equal(left: Any, right: Any) -> bool:
+    """
+    Check if two encoded values are equal for MongoDB.
+    Numbers of different types are equal, if they have the same value,
+    booleans are not numbers and the field order of the objects matters
+
+    :param left: Any - encoded value
+    :param right: Any - encoded value
+    :return: bool
+    """
+    try:
+        return compare_values(left, right) == 0
+    except TypeError:
+        return left == right
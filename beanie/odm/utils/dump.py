@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING
+from collections.abc import Container, Iterator, Mapping
+from collections.abc import Set as AbstractSet
+from typing import TYPE_CHECKING, Any
 
 from beanie.odm.utils.encoder import Encoder
 
@@ -11,6 +13,7 @@ def get_dict(
     to_db: bool = False,
     exclude: set[str] | None = None,
     keep_nulls: bool = True,
+    fields: Container[str] | None = None,
 ):
     if exclude is None:
         exclude = set()
@@ -24,9 +27,70 @@ def get_dict(
     encoder = Encoder(
         exclude=exclude, include=include, to_db=to_db, keep_nulls=keep_nulls
     )
+    if fields is not None:
+        return encoder.encode_document(document, fields=fields)
     return encoder.encode(document)
 
 
+def encode_batch(documents: list["Document"]) -> list[dict[str, Any]]:
+    """
+    Encode a batch of documents to insert them.
+    It is a module level function, so it can be sent to a process pool
+
+    :param documents: List[Document] - documents to encode
+    :return: List[Dict[str, Any]]
+    """
+    return [
+        get_dict(
+            document,
+            to_db=True,
+            keep_nulls=document.get_settings().keep_nulls,
+        )
+        for document in documents
+    ]
+
+
+def get_by_path(data: Mapping[str, Any], path: str) -> Any:
+    """
+    Get the value of the encoded document by the dotted path
+
+    :param data: Mapping[str, Any] - encoded document
+    :param path: str - dotted path
+    :return: Any - value or None if there is no such path
+    """
+    value: Any = data
+    for key in path.split("."):
+        if not isinstance(value, Mapping):
+            return None
+        value = value.get(key)
+    return value
+
+
+def split_by_paths(
+    data: Mapping[str, Any], paths: AbstractSet[str], prefix: str = ""
+) -> Iterator[tuple[str, Any]]:
+    """
+    Items of the encoded document without the values of the dotted paths.
+    Subdocuments, which contain the paths, are split into the items
+    of their other fields with the dotted keys
+
+    :param data: Mapping[str, Any] - encoded document
+    :param paths: AbstractSet[str] - dotted paths to leave out
+    :param prefix: str - dotted path of the data with the trailing dot
+    :return: Iterator[Tuple[str, Any]] - dotted keys and values
+    """
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if path in paths:
+            continue
+        if isinstance(value, Mapping) and any(
+            other.startswith(f"{path}.") for other in paths
+        ):
+            yield from split_by_paths(value, paths, f"{path}.")
+        else:
+            yield path, value
+
+
 def get_nulls(
     document: "Document",
     exclude: set[str] | None = None,
@@ -38,6 +102,7 @@ def get_nulls(
 def get_top_level_nones(
     document: "Document",
     exclude: set[str] | None = None,
+    fields: Container[str] | None = None,
 ):
     if exclude is None:
         exclude = set()
@@ -46,7 +111,9 @@ def get_top_level_nones(
     # SetRevisionId produces, causing a MongoDB OperationFailure.
     if document.get_settings().use_revision:
         exclude.add("revision_id")
-    dictionary = get_dict(document, exclude=exclude, keep_nulls=True)
+    dictionary = get_dict(
+        document, exclude=exclude, keep_nulls=True, fields=fields
+    )
     return {k: v for k, v in dictionary.items() if v is None}
 
 
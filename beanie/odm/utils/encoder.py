@@ -23,7 +23,7 @@ from pydantic import AnyUrl
 from pydantic_core import Url
 
 import beanie
-from beanie.odm.fields import Link, LinkTypes
+from beanie.odm.fields import Link, LinkTypes, Param
 from beanie.odm.utils.pydantic import (
     get_model_fields,
 )
@@ -67,6 +67,159 @@ BSON_SCALAR_TYPES = (
 )
 
 
+_MISSING = object()
+
+# max number of the memoized exclude/include sets per model
+_MAX_ACTIVE_FIELDS = 256
+
+
+@dc.dataclass(frozen=True)
+class FieldEncodingPlan:
+    """
+    Precomputed encoding instructions for a single model field
+    """
+
+    name: str
+    key: str
+    exclude: bool = False
+    link_type: LinkTypes | None = None
+
+
+class ModelEncodingPlan:
+    """
+    Encoding plan of a pydantic model class.
+
+    It is compiled once per class and keeps everything that does not
+    depend on the encoded instance: field aliases, exclude flags, link
+    handling and, for documents, the class id values and the sub-encoders.
+    """
+
+    def __init__(self, model: type[pydantic.BaseModel]):
+        self.model = model
+        self.is_document = issubclass(model, beanie.Document)
+        self.custom_iter = model.__iter__ is not pydantic.BaseModel.__iter__
+
+        link_fields: Mapping[str, Any] = {}
+        self.custom_encoders: Mapping[type, SingleArgCallable] = {}
+        self.class_id_items: tuple[tuple[str, Any], ...] = ()
+        if self.is_document:
+            settings = model.get_settings()  # type: ignore[attr-defined]
+            link_fields = model.get_link_fields() or {}  # type: ignore[attr-defined]
+            self.custom_encoders = settings.bson_encoders
+            class_id_items = {}
+            if settings.union_doc is not None:
+                class_id_items[settings.class_id] = (
+                    settings.union_doc_alias or model.__name__
+                )
+            if model._class_id:  # type: ignore[attr-defined]
+                class_id_items[settings.class_id] = model._class_id  # type: ignore[attr-defined]
+            self.class_id_items = tuple(class_id_items.items())
+
+        fields = []
+        for name, field_info in get_model_fields(model).items():
+            link_info = link_fields.get(name)
+            fields.append(
+                FieldEncodingPlan(
+                    name=name,
+                    key=field_info.alias or name,
+                    exclude=field_info.exclude is True,
+                    link_type=link_info.link_type
+                    if link_info is not None
+                    else None,
+                )
+            )
+        self.fields: tuple[FieldEncodingPlan, ...] = tuple(fields)
+        self.fields_by_name: dict[str, FieldEncodingPlan] = {
+            field.name: field for field in fields
+        }
+        self._active_fields: dict[
+            tuple[frozenset, frozenset], tuple[FieldEncodingPlan, ...]
+        ] = {}
+        self._sub_encoders: dict[tuple[bool, bool], Encoder] = {}
+
+    def get_key(self, name: str) -> str:
+        """
+        Key of the field in the encoded dict. Extra fields keep their names
+        """
+        field = self.fields_by_name.get(name)
+        return field.key if field is not None else name
+
+    def active_fields(
+        self, exclude: Container[str], include: Container[str]
+    ) -> tuple[FieldEncodingPlan, ...]:
+        """
+        Fields which are not excluded for the given exclude/include sets.
+        The result is memoized for hashable sets.
+        """
+        if not isinstance(exclude, (set, frozenset)) or not isinstance(
+            include, (set, frozenset)
+        ):
+            return self._select_fields(exclude, include)
+        memo_key = (frozenset(exclude), frozenset(include))
+        fields = self._active_fields.get(memo_key)
+        if fields is None:
+            fields = self._select_fields(exclude, include)
+            if len(self._active_fields) >= _MAX_ACTIVE_FIELDS:
+                del self._active_fields[next(iter(self._active_fields))]
+            self._active_fields[memo_key] = fields
+        return fields
+
+    def _select_fields(
+        self, exclude: Container[str], include: Container[str]
+    ) -> tuple[FieldEncodingPlan, ...]:
+        return tuple(
+            field
+            for field in self.fields
+            if field.key in include
+            or not (field.exclude or field.key in exclude)
+        )
+
+    def sub_encoder(self, to_db: bool, keep_nulls: bool) -> "Encoder":
+        """
+        Encoder for the values of a document.
+        Exclude and include sets are not propagated to subdocuments.
+        """
+        encoder = self._sub_encoders.get((to_db, keep_nulls))
+        if encoder is None:
+            encoder = Encoder(
+                custom_encoders=self.custom_encoders,
+                to_db=to_db,
+                keep_nulls=keep_nulls,
+            )
+            self._sub_encoders[to_db, keep_nulls] = encoder
+        return encoder
+
+
+_ENCODING_PLANS: dict[type, ModelEncodingPlan] = {}
+
+
+def compile_encoding_plan(
+    model: type[pydantic.BaseModel],
+) -> ModelEncodingPlan:
+    """
+    Compile (or recompile) the encoding plan of the model class
+
+    :param model: type[BaseModel] - model class
+    :return: ModelEncodingPlan
+    """
+    plan = ModelEncodingPlan(model)
+    _ENCODING_PLANS[model] = plan
+    return plan
+
+
+def get_encoding_plan(model: type[pydantic.BaseModel]) -> ModelEncodingPlan:
+    """
+    Get the encoding plan of the model class. Compiles it on the first call.
+
+    :param model: type[BaseModel] - model class
+    :return: ModelEncodingPlan
+    """
+    plan = _ENCODING_PLANS.get(model)
+    if plan is None:
+        plan = compile_encoding_plan(model)
+    return plan
+
+
 @dc.dataclass
 class Encoder:
     """
@@ -80,28 +233,32 @@ class Encoder:
     )
     to_db: bool = False
     keep_nulls: bool = True
+    _dispatch: "EncoderDispatchTable" = dc.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._dispatch = get_dispatch_table(self.custom_encoders)
 
-    def _encode_document(self, obj: "beanie.Document") -> Mapping[str, Any]:
+    def encode_document(
+        self,
+        obj: "beanie.Document",
+        fields: Container[str] | None = None,
+    ) -> Mapping[str, Any]:
+        """
+        Encode the document
+
+        :param obj: Document - document to encode
+        :param fields: Optional[Container[str]] - names of the fields
+            to encode. All the fields (and the class id) are encoded if None
+        :return: Mapping[str, Any]
+        """
         obj.parse_store()
-        settings = obj.get_settings()
-        obj_dict = {}
-        if settings.union_doc is not None:
-            obj_dict[settings.class_id] = (
-                settings.union_doc_alias or obj.__class__.__name__
-            )
-        if obj._class_id:
-            obj_dict[settings.class_id] = obj._class_id
-
-        link_fields = obj.get_link_fields() or {}
-        sub_encoder = Encoder(
-            # don't propagate self.exclude to subdocuments
-            custom_encoders=settings.bson_encoders,
-            to_db=self.to_db,
-            keep_nulls=self.keep_nulls,
-        )
-        for key, value in self._iter_model_items(obj):
-            if key in link_fields:
-                link_type = link_fields[key].link_type
+        plan = get_encoding_plan(type(obj))
+        obj_dict = dict(plan.class_id_items) if fields is None else {}
+        sub_encode = plan.sub_encoder(self.to_db, self.keep_nulls).encode
+        for key, link_type, value in self._iter_plan_items(plan, obj, fields):
+            if link_type is not None:
                 if link_type in (LinkTypes.DIRECT, LinkTypes.OPTIONAL_DIRECT):
                     if value is not None:
                         value = value.to_ref()
@@ -110,72 +267,189 @@ class Encoder:
                         value = [link.to_ref() for link in value]
                 elif self.to_db:
                     continue
-            obj_dict[key] = sub_encoder.encode(value)
+            obj_dict[key] = sub_encode(value)
         return obj_dict
 
     def encode(self, obj: Any) -> Any:
-        if self.custom_encoders:
-            encoder = _get_encoder(obj, self.custom_encoders)
-            if encoder is not None:
-                return encoder(obj)
-
-        if isinstance(obj, BSON_SCALAR_TYPES):
+        handler, takes_encoder = self._dispatch.resolve(type(obj))
+        if handler is None:
             return obj
+        if takes_encoder:
+            return handler(self, obj)
+        return handler(obj)
 
-        encoder = _get_encoder(obj, DEFAULT_CUSTOM_ENCODERS)
-        if encoder is not None:
-            return encoder(obj)
-
-        if isinstance(obj, beanie.Document):
-            return self._encode_document(obj)
-        if isinstance(obj, pydantic.RootModel):
-            return self.encode(obj.root)
-        if isinstance(obj, pydantic.BaseModel):
-            items = self._iter_model_items(obj)
-            return {key: self.encode(value) for key, value in items}
-        if isinstance(obj, Mapping):
-            return {
-                key if isinstance(key, Enum) else str(key): self.encode(value)
-                for key, value in obj.items()
-            }
-        if isinstance(obj, Iterable):
-            return [self.encode(value) for value in obj]
+    def _encode_root_model(self, obj: pydantic.RootModel) -> Any:
+        return self.encode(obj.root)
+
+    def _encode_model(self, obj: pydantic.BaseModel) -> Mapping[str, Any]:
+        items = self._iter_plan_items(get_encoding_plan(type(obj)), obj)
+        return {key: self.encode(value) for key, _, value in items}
 
+    def _encode_mapping(self, obj: Mapping) -> Mapping[Any, Any]:
+        return {
+            key if isinstance(key, Enum) else str(key): self.encode(value)
+            for key, value in obj.items()
+        }
+
+    def _encode_iterable(self, obj: Iterable) -> list[Any]:
+        return [self.encode(value) for value in obj]
+
+    def _encode_unknown(self, obj: Any) -> Any:
         raise ValueError(f"Cannot encode {obj!r}")
 
-    def _iter_model_items(
-        self, obj: pydantic.BaseModel
-    ) -> Iterable[tuple[str, Any]]:
+    def _iter_plan_items(
+        self,
+        plan: ModelEncodingPlan,
+        obj: pydantic.BaseModel,
+        fields: Container[str] | None = None,
+    ) -> Iterable[tuple[str, LinkTypes | None, Any]]:
         keep_nulls = self.keep_nulls
-        get_model_field = get_model_fields(obj).get
-        for key, value in obj.__iter__():
-            field_info = get_model_field(key)
-            if field_info is not None:
-                key = field_info.alias or key
-            if not self._should_exclude_field(key, field_info) and (
-                value is not None or keep_nulls
-            ):
-                yield key, value
-
-    def _should_exclude_field(
-        self, key: str, field_info: pydantic.fields.FieldInfo | None
-    ):
+        if plan.custom_iter:
+            # respect overridden __iter__ methods
+            get_field = plan.fields_by_name.get
+            for key, value in obj.__iter__():
+                if fields is not None and key not in fields:
+                    continue
+                field = get_field(key)
+                if field is not None:
+                    key = field.key
+                if not self._should_exclude_key(
+                    key, field is not None and field.exclude
+                ) and (value is not None or keep_nulls):
+                    yield (
+                        key,
+                        field.link_type if field is not None else None,
+                        value,
+                    )
+            return
+
+        values = obj.__dict__
+        for field in plan.active_fields(self.exclude, self.include):
+            if fields is not None and field.name not in fields:
+                continue
+            value = values.get(field.name, _MISSING)
+            if value is _MISSING or (value is None and not keep_nulls):
+                continue
+            yield field.key, field.link_type, value
+
+        extra = obj.__pydantic_extra__
+        if extra:
+            for key, value in extra.items():
+                if fields is not None and key not in fields:
+                    continue
+                if not self._should_exclude_key(key, False) and (
+                    value is not None or keep_nulls
+                ):
+                    yield key, None, value
+
+    def _should_exclude_key(self, key: str, is_excluded_field: bool) -> bool:
         if key in self.include:
             return False
+        return key in self.exclude or is_excluded_field
 
-        is_pydantic_excluded_field = (
-            field_info is not None and field_info.exclude is True
-        )
-        return key in self.exclude or is_pydantic_excluded_field
 
+_Handler = tuple[Callable[..., Any] | None, bool]
+
+
+class EncoderDispatchTable:
+    """
+    Type-keyed encoder dispatch table.
+
+    The handler of a concrete type is resolved once, by walking the type's
+    MRO over the custom encoders, the BSON scalar types and the default
+    encoders, in this order. The result is cached, so encoding a value
+    costs a single dict lookup afterwards.
+
+    Handlers are tuples of a callable (``None`` for values, which are
+    passed as is) and a flag if the callable takes the encoder instance.
+    """
+
+    def __init__(self, custom_encoders: Mapping[type, SingleArgCallable]):
+        self.custom_encoders = custom_encoders
+        self._handlers: dict[type, _Handler] = {}
+
+    def resolve(self, obj_type: type) -> _Handler:
+        handler = self._handlers.get(obj_type)
+        if handler is None:
+            handler = self._resolve(obj_type)
+            self._handlers[obj_type] = handler
+        return handler
+
+    def invalidate(self) -> None:
+        self._handlers.clear()
+
+    def _resolve(self, obj_type: type) -> _Handler:
+        if self.custom_encoders:
+            encoder = _find_encoder(obj_type, self.custom_encoders)
+            if encoder is not None:
+                return encoder, False
+
+        # parameters of the prepared queries are encoded, when bound
+        if issubclass(obj_type, (*BSON_SCALAR_TYPES, Param)):
+            return None, False
+
+        encoder = _find_encoder(obj_type, DEFAULT_CUSTOM_ENCODERS)
+        if encoder is not None:
+            return encoder, False
+
+        if issubclass(obj_type, beanie.Document):
+            return Encoder.encode_document, True
+        if issubclass(obj_type, pydantic.RootModel):
+            return Encoder._encode_root_model, True
+        if issubclass(obj_type, pydantic.BaseModel):
+            return Encoder._encode_model, True
+        if issubclass(obj_type, Mapping):
+            return Encoder._encode_mapping, True
+        if issubclass(obj_type, Iterable):
+            return Encoder._encode_iterable, True
+        return Encoder._encode_unknown, True
+
+
+_DEFAULT_DISPATCH_TABLE = EncoderDispatchTable({})
+_DISPATCH_TABLES: dict[int, EncoderDispatchTable] = {}
+_MAX_DISPATCH_TABLES = 256
+
+
+def get_dispatch_table(
+    custom_encoders: Mapping[type, SingleArgCallable],
+) -> EncoderDispatchTable:
+    """
+    Get the dispatch table shared by all the encoders
+    with the same custom encoders mapping
 
-def _get_encoder(
-    obj: Any, custom_encoders: Mapping[type, SingleArgCallable]
+    :param custom_encoders: Mapping[type, Callable] - custom encoders
+    :return: EncoderDispatchTable
+    """
+    if not custom_encoders:
+        return _DEFAULT_DISPATCH_TABLE
+    table = _DISPATCH_TABLES.get(id(custom_encoders))
+    if table is None or table.custom_encoders is not custom_encoders:
+        if len(_DISPATCH_TABLES) >= _MAX_DISPATCH_TABLES:
+            del _DISPATCH_TABLES[next(iter(_DISPATCH_TABLES))]
+        table = EncoderDispatchTable(custom_encoders)
+        _DISPATCH_TABLES[id(custom_encoders)] = table
+    return table
+
+
+def invalidate_dispatch_tables() -> None:
+    """
+    Reset all the resolved handlers. Must be called after the custom
+    or the default encoders were changed in place.
+    """
+    _DEFAULT_DISPATCH_TABLE.invalidate()
+    for table in _DISPATCH_TABLES.values():
+        table.invalidate()
+
+
+def _find_encoder(
+    obj_type: type, custom_encoders: Mapping[type, SingleArgCallable]
 ) -> SingleArgCallable | None:
-    encoder = custom_encoders.get(type(obj))
-    if encoder is not None:
-        return encoder
+    for cls in obj_type.__mro__:
+        encoder = custom_encoders.get(cls)
+        if encoder is not None:
+            return encoder
+    # virtual subclasses (ABCs) are not in the MRO
     for cls, encoder in custom_encoders.items():
-        if isinstance(obj, cls):
+        if issubclass(obj_type, cls):
             return encoder
     return None
@@ -1,6 +1,17 @@
-from typing import TYPE_CHECKING, Any
+import asyncio
+from collections.abc import Container, Hashable, Mapping
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, cast
+
+from bson import DBRef
 
 from beanie.odm.fields import LinkInfo, LinkTypes
+from beanie.odm.utils.projection import (
+    FieldsTree,
+    add_field_path,
+    get_expression_fields,
+    merge_fields,
+)
 
 if TYPE_CHECKING:
     from beanie import Document
@@ -9,16 +20,126 @@ if TYPE_CHECKING:
 # TODO: check if this is the most efficient way for
 #  appending subqueries to the queries var
 
+# Built lookup stages by the document class and the fetch parameters
+_LOOKUP_QUERIES: dict[Hashable, list[dict[str, Any]]] = {}
+
+_MAX_LOOKUP_QUERIES = 1024
+
 
 def construct_lookup_queries(
     cls: type["Document"],
     nesting_depth: int | None = None,
     nesting_depths_per_field: dict[str, int] | None = None,
+    fields: FieldsTree | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Build the `$lookup` stages, which fetch the linked documents
+
+    :param cls: Type[Document] - document class
+    :param nesting_depth: Optional[int] - max nesting depth of the links
+    :param nesting_depths_per_field: Optional[Dict[str, int]] - max nesting
+        depths of the specific link fields
+    :param fields: Optional[FieldsTree] - fields, which are read from the
+        documents. The links, which are not read, are not looked up and the
+        looked up documents are projected to the read fields.
+        All the links are looked up as whole documents, if None
+    :return: List[Dict[str, Any]] - aggregation stages
+    """
+    key = (
+        cls,
+        nesting_depth,
+        _freeze(nesting_depths_per_field),
+        _freeze(fields),
+    )
+    queries = _LOOKUP_QUERIES.get(key)
+    if queries is None:
+        queries = _construct_lookup_queries(
+            cls, nesting_depth, nesting_depths_per_field, fields
+        )
+        queries = _freeze_stages(queries)
+        if len(_LOOKUP_QUERIES) >= _MAX_LOOKUP_QUERIES:
+            del _LOOKUP_QUERIES[next(iter(_LOOKUP_QUERIES))]
+        _LOOKUP_QUERIES[key] = queries
+    # the stages are shared between the queries, so they are frozen
+    return list(queries)
+
+
+def invalidate_lookup_queries() -> None:
+    """
+    Forget the built lookup stages. Must be called after the document
+    classes were initialized, as the stages depend on the collection
+    names and the database version
+    """
+    _LOOKUP_QUERIES.clear()
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def _immutable(self, *args: Any, **kwargs: Any) -> Any:
+    raise TypeError("The cached lookup stages can not be changed")
+
+
+class _FrozenDict(dict):
+    """
+    Dict, which can not be changed. Its copies are usual dicts
+    """
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return {k: deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self) -> Any:
+        return dict, (dict(self),)
+
+
+class _FrozenList(list):
+    """
+    List, which can not be changed. Its copies are usual lists
+    """
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = pop = remove = clear = _immutable
+    sort = reverse = _immutable
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return [deepcopy(v, memo) for v in self]
+
+    def __reduce__(self) -> Any:
+        return list, (list(self),)
+
+
+def _freeze_stages(value: Any) -> Any:
+    if isinstance(value, dict):
+        return _FrozenDict((k, _freeze_stages(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return _FrozenList(_freeze_stages(v) for v in value)
+    return value
+
+
+def _construct_lookup_queries(
+    cls: type["Document"],
+    nesting_depth: int | None,
+    nesting_depths_per_field: dict[str, int] | None,
+    fields: FieldsTree | None,
 ) -> list[dict[str, Any]]:
     queries: list[dict[str, Any]] = []
     link_fields = cls.get_link_fields()
     if link_fields is not None:
         for link_info in link_fields.values():
+            if fields is not None and link_info.field_name not in fields:
+                continue
             final_nesting_depth = (
                 nesting_depths_per_field.get(link_info.field_name, None)
                 if nesting_depths_per_field is not None
@@ -31,15 +152,54 @@ def construct_lookup_queries(
                 queries=queries,
                 database_major_version=cls._database_major_version,
                 current_depth=final_nesting_depth,
+                fields=(
+                    fields[link_info.field_name]
+                    if fields is not None
+                    else None
+                ),
             )
     return queries
 
 
+def construct_nested_queries(
+    link_info: LinkInfo,
+    lookup: dict[str, Any],
+    database_major_version: int,
+    current_depth: int | None = None,
+    fields: FieldsTree | None = None,
+):
+    """
+    Add the projection of the linked documents and the lookups
+    of their links to the `$lookup` stage sub-pipeline
+    """
+    new_depth = current_depth - 1 if current_depth is not None else None
+    # MongoDB < 5.0 doesn't support `localField` with `pipeline`
+    if fields is not None and (
+        "pipeline" in lookup or database_major_version >= 5
+    ):
+        lookup.setdefault("pipeline", []).append(
+            {"$project": {name: 1 for name in fields} or {"_id": 1}}
+        )
+    if link_info.nested_links is not None:
+        pipeline = lookup.setdefault("pipeline", [])
+        for name, nested_link in link_info.nested_links.items():
+            if fields is not None and name not in fields:
+                continue
+            construct_query(
+                link_info=nested_link,
+                queries=pipeline,
+                database_major_version=database_major_version,
+                current_depth=new_depth,
+                fields=fields[name] if fields is not None else None,
+            )
+
+
 def construct_query(
     link_info: LinkInfo,
     queries: list[dict[str, Any]],
     database_major_version: int,
     current_depth: int | None = None,
+    fields: FieldsTree | None = None,
 ):
     if link_info.is_fetchable is False or (
         current_depth is not None and current_depth <= 0
@@ -83,18 +243,13 @@ def construct_query(
                 },
                 {"$project": {f"_link_{link_info.field_name}": 0}},
             ]  # type: ignore
-            new_depth = (
-                current_depth - 1 if current_depth is not None else None
+            construct_nested_queries(
+                link_info=link_info,
+                lookup=lookup_steps[0]["$lookup"],  # type: ignore
+                database_major_version=database_major_version,
+                current_depth=current_depth,
+                fields=fields,
             )
-            if link_info.nested_links is not None:
-                lookup_steps[0]["$lookup"]["pipeline"] = []  # type: ignore
-                for nested_link in link_info.nested_links:
-                    construct_query(
-                        link_info=link_info.nested_links[nested_link],
-                        queries=lookup_steps[0]["$lookup"]["pipeline"],  # type: ignore
-                        database_major_version=database_major_version,
-                        current_depth=new_depth,
-                    )
             queries += lookup_steps
 
         else:
@@ -139,16 +294,13 @@ def construct_query(
                 },
                 {"$project": {f"_link_{link_info.field_name}": 0}},
             ]
-            new_depth = (
-                current_depth - 1 if current_depth is not None else None
+            construct_nested_queries(
+                link_info=link_info,
+                lookup=lookup_steps[0]["$lookup"],  # type: ignore
+                database_major_version=database_major_version,
+                current_depth=current_depth,
+                fields=fields,
             )
-            for nested_link in link_info.nested_links:
-                construct_query(
-                    link_info=link_info.nested_links[nested_link],
-                    queries=lookup_steps[0]["$lookup"]["pipeline"],  # type: ignore
-                    database_major_version=database_major_version,
-                    current_depth=new_depth,
-                )
             queries += lookup_steps
 
     elif link_info.link_type in [
@@ -189,18 +341,13 @@ def construct_query(
                 },
                 {"$project": {f"_link_{link_info.field_name}": 0}},
             ]  # type: ignore
-            new_depth = (
-                current_depth - 1 if current_depth is not None else None
+            construct_nested_queries(
+                link_info=link_info,
+                lookup=lookup_steps[0]["$lookup"],  # type: ignore
+                database_major_version=database_major_version,
+                current_depth=current_depth,
+                fields=fields,
             )
-            if link_info.nested_links is not None:
-                lookup_steps[0]["$lookup"]["pipeline"] = []  # type: ignore
-                for nested_link in link_info.nested_links:
-                    construct_query(
-                        link_info=link_info.nested_links[nested_link],
-                        queries=lookup_steps[0]["$lookup"]["pipeline"],  # type: ignore
-                        database_major_version=database_major_version,
-                        current_depth=new_depth,
-                    )
             queries += lookup_steps
 
         else:
@@ -248,16 +395,13 @@ def construct_query(
                 },
                 {"$project": {f"_link_{link_info.field_name}": 0}},
             ]
-            new_depth = (
-                current_depth - 1 if current_depth is not None else None
+            construct_nested_queries(
+                link_info=link_info,
+                lookup=lookup_steps[0]["$lookup"],  # type: ignore
+                database_major_version=database_major_version,
+                current_depth=current_depth,
+                fields=fields,
             )
-            for nested_link in link_info.nested_links:
-                construct_query(
-                    link_info=link_info.nested_links[nested_link],
-                    queries=lookup_steps[0]["$lookup"]["pipeline"],  # type: ignore
-                    database_major_version=database_major_version,
-                    current_depth=new_depth,
-                )
             queries += lookup_steps
 
     elif link_info.link_type in [
@@ -275,18 +419,13 @@ def construct_query(
                     }
                 }
             )
-            new_depth = (
-                current_depth - 1 if current_depth is not None else None
+            construct_nested_queries(
+                link_info=link_info,
+                lookup=queries[-1]["$lookup"],  # type: ignore
+                database_major_version=database_major_version,
+                current_depth=current_depth,
+                fields=fields,
             )
-            if link_info.nested_links is not None:
-                queries[-1]["$lookup"]["pipeline"] = []
-                for nested_link in link_info.nested_links:
-                    construct_query(
-                        link_info=link_info.nested_links[nested_link],
-                        queries=queries[-1]["$lookup"]["pipeline"],
-                        database_major_version=database_major_version,
-                        current_depth=new_depth,
-                    )
         else:
             lookup_step = {
                 "$lookup": {
@@ -298,16 +437,13 @@ def construct_query(
                     ],
                 }
             }
-            new_depth = (
-                current_depth - 1 if current_depth is not None else None
+            construct_nested_queries(
+                link_info=link_info,
+                lookup=lookup_step["$lookup"],  # type: ignore
+                database_major_version=database_major_version,
+                current_depth=current_depth,
+                fields=fields,
             )
-            for nested_link in link_info.nested_links:
-                construct_query(
-                    link_info=link_info.nested_links[nested_link],
-                    queries=lookup_step["$lookup"]["pipeline"],
-                    database_major_version=database_major_version,
-                    current_depth=new_depth,
-                )
             queries.append(lookup_step)
 
     elif link_info.link_type in [
@@ -325,18 +461,13 @@ def construct_query(
                     }
                 }
             )
-            new_depth = (
-                current_depth - 1 if current_depth is not None else None
+            construct_nested_queries(
+                link_info=link_info,
+                lookup=queries[-1]["$lookup"],  # type: ignore
+                database_major_version=database_major_version,
+                current_depth=current_depth,
+                fields=fields,
             )
-            if link_info.nested_links is not None:
-                queries[-1]["$lookup"]["pipeline"] = []
-                for nested_link in link_info.nested_links:
-                    construct_query(
-                        link_info=link_info.nested_links[nested_link],
-                        queries=queries[-1]["$lookup"]["pipeline"],
-                        database_major_version=database_major_version,
-                        current_depth=new_depth,
-                    )
         else:
             lookup_step = {
                 "$lookup": {
@@ -357,19 +488,339 @@ def construct_query(
                     ],
                 }
             }
+            construct_nested_queries(
+                link_info=link_info,
+                lookup=lookup_step["$lookup"],  # type: ignore
+                database_major_version=database_major_version,
+                current_depth=current_depth,
+                fields=fields,
+            )
+            queries.append(lookup_step)
+
+    return queries
+
+
+def _get_linked_ids(value: Any) -> list[Any]:
+    if isinstance(value, list):
+        return [item for element in value for item in _get_linked_ids(element)]
+    if isinstance(value, DBRef):
+        return [value.id]
+    if isinstance(value, Mapping) and "$id" in value:
+        return [value["$id"]]
+    return []
+
+
+def _get_copy(
+    copies: dict[Any, dict[str, Any]], document: dict[str, Any]
+) -> dict[str, Any]:
+    if document["_id"] not in copies:
+        copies[document["_id"]] = dict(document)
+    return copies[document["_id"]]
+
+
+class _LinkLevel:
+    """
+    Documents of one collection, which are requested on the current
+    level of the links
+    """
+
+    def __init__(self, collection: Any):
+        self.collection = collection
+        self.ids: dict[Any, None] = {}
+        self.back_ids: dict[str, dict[Any, None]] = {}
+        self.fields: FieldsTree | None = {}
+        self.found: dict[Any, dict[str, Any]] = {}
+        self.referencing: dict[str, dict[Any, list[dict[str, Any]]]] = {}
+
+    def add_fields(self, fields: FieldsTree | None) -> None:
+        if fields is None or self.fields is None:
+            self.fields = None
+        else:
+            merge_fields(self.fields, fields)
+
+    async def fetch(self, session: Any = None) -> None:
+        queries: list[dict[str, Any]] = []
+        if self.ids:
+            queries.append({"_id": {"$in": list(self.ids)}})
+        for field, ids in self.back_ids.items():
+            queries.append({f"{field}.$id": {"$in": list(ids)}})
+        projection = None
+        if self.fields is not None:
+            projection = {name: 1 for name in self.fields}
+            # back links are distributed by the link fields
+            projection.update({field: 1 for field in self.back_ids})
+        documents = await self.collection.find(
+            queries[0] if len(queries) == 1 else {"$or": queries},
+            projection=projection or None,
+            session=session,
+        ).to_list(None)
+        for field in self.back_ids:
+            self.referencing[field] = {}
+        for document in documents:
+            if document["_id"] in self.ids:
+                self.found[document["_id"]] = document
+            for field, referencing in self.referencing.items():
+                for linked_id in _get_linked_ids(document.get(field)):
+                    if linked_id in self.back_ids[field]:
+                        referencing.setdefault(linked_id, []).append(document)
+
+
+def has_back_direct_links(link_infos: Any) -> bool:
+    """
+    Check, if the links or their nested links are back direct links.
+    `$lookup` stages unwind them and return one result document
+    per referencing document, what the batched queries can't do
+
+    :param link_infos: Iterable[LinkInfo] - links to check
+    :return: bool
+    """
+    for link_info in link_infos:
+        if not link_info.is_fetchable:
+            continue
+        if link_info.link_type in [
+            LinkTypes.BACK_DIRECT,
+            LinkTypes.OPTIONAL_BACK_DIRECT,
+        ]:
+            return True
+        if link_info.nested_links is not None and has_back_direct_links(
+            link_info.nested_links.values()
+        ):
+            return True
+    return False
+
+
+async def fetch_links_batched(
+    cls: type["Document"],
+    documents: list[dict[str, Any]],
+    nesting_depth: int | None = None,
+    nesting_depths_per_field: dict[str, int] | None = None,
+    fields: FieldsTree | None = None,
+    session: Any = None,
+) -> None:
+    """
+    Replace the links of the raw documents with the linked documents,
+    like the `$lookup` stages do. Every level of the links is fetched
+    with one `$in` query per linked collection, the queries of the level
+    run concurrently
+
+    :param cls: Type[Document] - document class
+    :param documents: List[Dict[str, Any]] - raw documents
+    :param nesting_depth: Optional[int] - max nesting depth of the links
+    :param nesting_depths_per_field: Optional[Dict[str, int]] - max nesting
+        depths of the specific link fields
+    :param fields: Optional[FieldsTree] - fields, which are read from the
+        documents. All the links are fetched as whole documents, if None
+    :param session: Optional[AsyncClientSession] - pymongo session
+    :return: None
+    """
+    tasks: list[tuple[LinkInfo, list[dict[str, Any]], int | None, Any]] = []
+    link_fields = cls.get_link_fields()
+    if link_fields is not None and documents:
+        for link_info in link_fields.values():
+            if fields is not None and link_info.field_name not in fields:
+                continue
+            final_nesting_depth = (
+                nesting_depths_per_field.get(link_info.field_name, None)
+                if nesting_depths_per_field is not None
+                else None
+            )
+            if final_nesting_depth is None:
+                final_nesting_depth = nesting_depth
+            tasks.append(
+                (
+                    link_info,
+                    documents,
+                    final_nesting_depth,
+                    fields[link_info.field_name]
+                    if fields is not None
+                    else None,
+                )
+            )
+    while tasks:
+        tasks = await _fetch_links_level(tasks, session)
+
+
+def _get_collection(link_info: LinkInfo) -> Any:
+    document_class = cast("type[Document]", link_info.document_class)
+    return document_class.get_pymongo_collection()
+
+
+async def _fetch_links_level(
+    tasks: list[tuple[LinkInfo, list[dict[str, Any]], int | None, Any]],
+    session: Any,
+) -> list[tuple[LinkInfo, list[dict[str, Any]], int | None, Any]]:
+    tasks = [
+        task
+        for task in tasks
+        if task[0].is_fetchable and (task[2] is None or task[2] > 0)
+    ]
+    levels: dict[str, _LinkLevel] = {}
+    for link_info, documents, _, fields in tasks:
+        collection = _get_collection(link_info)
+        level = levels.setdefault(collection.name, _LinkLevel(collection))
+        level.add_fields(fields)
+        if link_info.link_type in [
+            LinkTypes.BACK_DIRECT,
+            LinkTypes.OPTIONAL_BACK_DIRECT,
+            LinkTypes.BACK_LIST,
+            LinkTypes.OPTIONAL_BACK_LIST,
+        ]:
+            back_ids = level.back_ids.setdefault(
+                link_info.lookup_field_name, {}
+            )
+            for document in documents:
+                if "_id" in document:
+                    back_ids[document["_id"]] = None
+        else:
+            for document in documents:
+                for linked_id in _get_linked_ids(
+                    document.get(link_info.lookup_field_name)
+                ):
+                    level.ids[linked_id] = None
+    levels = {
+        name: level
+        for name, level in levels.items()
+        if level.ids or level.back_ids
+    }
+    await asyncio.gather(*(level.fetch(session) for level in levels.values()))
+
+    next_tasks = []
+    for link_info, documents, current_depth, fields in tasks:
+        linked_level = levels.get(_get_collection(link_info).name)
+        # the documents of every task get own copies of the linked
+        # documents, as their links can be fetched with other depths
+        copies: dict[Any, dict[str, Any]] = {}
+        for document in documents:
+            if link_info.link_type in [
+                LinkTypes.DIRECT,
+                LinkTypes.OPTIONAL_DIRECT,
+            ]:
+                for linked_id in _get_linked_ids(
+                    document.get(link_info.lookup_field_name)
+                ):
+                    if (
+                        linked_level is not None
+                        and linked_id in linked_level.found
+                    ):
+                        document[link_info.field_name] = _get_copy(
+                            copies, linked_level.found[linked_id]
+                        )
+            elif link_info.link_type in [
+                LinkTypes.LIST,
+                LinkTypes.OPTIONAL_LIST,
+            ]:
+                linked_ids = dict.fromkeys(
+                    _get_linked_ids(document.get(link_info.lookup_field_name))
+                )
+                document[link_info.field_name] = [
+                    _get_copy(copies, linked_level.found[linked_id])
+                    for linked_id in linked_ids
+                    if linked_level is not None
+                    and linked_id in linked_level.found
+                ]
+            else:
+                referencing = (
+                    linked_level.referencing[link_info.lookup_field_name].get(
+                        document.get("_id"), []
+                    )
+                    if linked_level is not None
+                    else []
+                )
+                if link_info.link_type in [
+                    LinkTypes.BACK_LIST,
+                    LinkTypes.OPTIONAL_BACK_LIST,
+                ]:
+                    document[link_info.field_name] = [
+                        _get_copy(copies, linked) for linked in referencing
+                    ]
+                elif referencing:
+                    # the queries with back direct links use `$lookup`,
+                    # which returns the document per referencing one
+                    document[link_info.field_name] = _get_copy(
+                        copies, referencing[0]
+                    )
+
+        if link_info.nested_links is not None and copies:
             new_depth = (
                 current_depth - 1 if current_depth is not None else None
             )
-            for nested_link in link_info.nested_links:
-                construct_query(
-                    link_info=link_info.nested_links[nested_link],
-                    queries=lookup_step["$lookup"]["pipeline"],
-                    database_major_version=database_major_version,
-                    current_depth=new_depth,
+            for name, nested_link in link_info.nested_links.items():
+                if fields is not None and name not in fields:
+                    continue
+                next_tasks.append(
+                    (
+                        nested_link,
+                        list(copies.values()),
+                        new_depth,
+                        fields[name] if fields is not None else None,
+                    )
                 )
-            queries.append(lookup_step)
+    return next_tasks
 
-    return queries
+
+def get_query_fields(query: Any) -> FieldsTree | None:
+    """
+    Fields, which the find query reads
+
+    :param query: Any - find query
+    :return: Optional[FieldsTree] - None, if the fields can't be detected
+    """
+    fields: FieldsTree = {}
+    if isinstance(query, (list, tuple)):
+        for item in query:
+            item_fields = get_query_fields(item)
+            if item_fields is None:
+                return None
+            merge_fields(fields, item_fields)
+        return fields
+    if not isinstance(query, dict):
+        return None
+    for key, value in query.items():
+        if key in ("$and", "$or", "$nor"):
+            value_fields = get_query_fields(value)
+        elif key == "$expr":
+            value_fields = get_expression_fields(value)
+        elif key in ("$text", "$comment"):
+            continue
+        elif key.startswith("$"):
+            # `$where` and others can read any field
+            return None
+        else:
+            add_field_path(fields, key)
+            continue
+        if value_fields is None:
+            return None
+        merge_fields(fields, value_fields)
+    return fields
+
+
+def split_link_queries(
+    queries: list[dict[str, Any]], link_fields: Container[str]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Divide queries into the ones, which read only the document fields,
+    and the ones, which read the link fields
+
+    :param queries: List[Dict[str, Any]] - queries, which are combined by AND
+    :param link_fields: Container[str] - names of the link fields
+    :return: Tuple[List[Dict[str, Any]], List[Dict[str, Any]]] - local and
+        link queries, respectively
+    """
+    local_queries: list[dict[str, Any]] = []
+    link_queries: list[dict[str, Any]] = []
+    for query in queries:
+        local_query: dict[str, Any] = {}
+        link_query: dict[str, Any] = {}
+        for key, value in query.items():
+            fields = get_query_fields({key: value})
+            if fields is None or any(name in link_fields for name in fields):
+                link_query[key] = value
+            else:
+                local_query[key] = value
+        if local_query:
+            local_queries.append(local_query)
+        if link_query:
+            link_queries.append(link_query)
+    return local_queries, link_queries
 
 
 def split_text_query(
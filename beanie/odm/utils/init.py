@@ -1,5 +1,6 @@
 import importlib
 import inspect
+from concurrent.futures import Executor
 from importlib.metadata import version
 from types import UnionType
 from typing import (  # noqa: UP035
@@ -18,8 +19,10 @@ from pymongo.driver_info import DriverInfo
 
 from beanie.exceptions import Deprecation, MongoDBVersionError
 from beanie.odm.actions import ActionRegistry
-from beanie.odm.cache import LRUCache
+from beanie.odm.backends import BackendRegistry
+from beanie.odm.cache import CacheRegistry, LRUCache
 from beanie.odm.documents import DocType, Document
+from beanie.odm.enums import StateManagementMode
 from beanie.odm.fields import (
     BackLink,
     ExpressionField,
@@ -33,11 +36,17 @@ from beanie.odm.settings.document import DocumentSettings, IndexModelField
 from beanie.odm.settings.union_doc import UnionDocSettings
 from beanie.odm.settings.view import ViewSettings
 from beanie.odm.union_doc import UnionDoc, UnionDocType
+from beanie.odm.utils.encoder import (
+    compile_encoding_plan,
+    invalidate_dispatch_tables,
+)
+from beanie.odm.utils.find import invalidate_lookup_queries
 from beanie.odm.utils.pydantic import (
     get_extra_field_info,
     get_model_fields,
     parse_model,
 )
+from beanie.odm.utils.tracking import tracked_delattr, tracked_setattr
 from beanie.odm.utils.typing import get_index_attributes, is_generic_alias
 from beanie.odm.views import View
 
@@ -61,6 +70,8 @@ class Initializer:
         allow_index_dropping: bool = False,
         recreate_views: bool = False,
         skip_indexes: bool = False,
+        parse_executor: Executor | None = None,
+        backend: str | None = None,
     ):
         """
         Beanie initializer
@@ -74,15 +85,27 @@ class Initializer:
             Default False
         :param recreate_views: bool - if views should be recreated. Default False
         :param skip_indexes: bool - if you want to skip working with indexes. Default False
+        :param parse_executor: Optional[Executor] - executor to parse
+            the query results in. Default None
+        :param backend: Optional[str] - name of the registered storage
+            backend, like "memory", to use instead of MongoDB. Default None
         :return: None
         """
 
         self.inited_classes: list[type] = []
+        self.parse_executor = parse_executor
         self.allow_index_dropping = allow_index_dropping
         self.skip_indexes = skip_indexes
         self.recreate_views = recreate_views
 
-        if (connection_string is None and database is None) or (
+        if backend is not None:
+            if connection_string is not None or database is not None:
+                raise ValueError(
+                    "backend parameter can't be used with connection_string "
+                    "or database parameters"
+                )
+            database = BackendRegistry.get_database(backend)
+        elif (connection_string is None and database is None) or (
             connection_string is not None and database is not None
         ):
             raise ValueError(
@@ -127,9 +150,14 @@ class Initializer:
         self._existing_collections: list[str] = []
 
     def __await__(self):
+        invalidate_dispatch_tables()
+        invalidate_lookup_queries()
         yield from self._load_cached_info().__await__()
         for model in self.document_models:
             yield from self.init_class(model).__await__()
+        # the stages could be built by the concurrent queries
+        # while the classes were initialized
+        invalidate_lookup_queries()
 
     async def _load_cached_info(self):
         build_info = await self.database.command({"buildInfo": 1})
@@ -367,10 +395,17 @@ class Initializer:
         Init model's cache
         :return: None
         """
-        if cls.get_settings().use_cache:
-            cls._cache = LRUCache(
-                capacity=cls.get_settings().cache_capacity,
-                expiration_time=cls.get_settings().cache_expiration_time,
+        settings = cls.get_settings()
+        if settings.use_cache:
+            cls._cache = settings.cache_backend or LRUCache(
+                capacity=settings.cache_capacity,
+                expiration_time=settings.cache_expiration_time,
+                max_bytes=settings.cache_max_bytes,
+            )
+            CacheRegistry.register(cls.get_collection_name(), cls._cache)
+            cls._cache.register_collection(
+                cls.get_collection_name(),
+                cls.get_pymongo_collection().codec_options,
             )
 
     def init_document_fields(self, cls) -> None:
@@ -423,6 +458,41 @@ class Initializer:
                     funct=f,
                 )
 
+    @staticmethod
+    def init_tracking(cls):
+        """
+        Hook the assignments of the class with the tracked
+        state management. Other classes keep the plain pydantic ones
+        """
+        settings = cls.get_settings()
+        tracked = (
+            settings.use_state_management
+            and settings.state_management_mode is StateManagementMode.TRACKED
+        )
+        hooks = {
+            "__setattr__": tracked_setattr,
+            "__delattr__": tracked_delattr,
+        }
+        for name, hook in hooks.items():
+            if cls.__dict__.get(name) is hook:
+                delattr(cls, name)
+            method = getattr(cls, name)
+            if tracked and method is getattr(BaseModel, name):
+                setattr(cls, name, hook)
+            elif not tracked and method is hook:
+                setattr(cls, name, getattr(BaseModel, name))
+        # custom assignments of the class can not be tracked
+        cls._track_changes = tracked and all(
+            getattr(cls, name) is hook for name, hook in hooks.items()
+        )
+
+    @staticmethod
+    def init_encoding_plan(cls):
+        """
+        Compile the BSON encoding plan of the class
+        """
+        compile_encoding_plan(cls)
+
     async def init_document_collection(self, cls):
         """
         Init collection for the Document-based class
@@ -554,6 +624,7 @@ class Initializer:
 
         # get db version
         cls._database_major_version = self._database_major_version
+        cls._parse_executor = self.parse_executor
 
         own_settings = cls.__dict__.get("Settings")
         class_id_value = getattr(own_settings, "class_id_value", None)
@@ -597,6 +668,8 @@ class Initializer:
             self.init_document_fields(cls)
             self.init_cache(cls)
             self.init_actions(cls)
+            self.init_encoding_plan(cls)
+            self.init_tracking(cls)
 
             self.inited_classes.append(cls)
 
@@ -668,6 +741,7 @@ class Initializer:
         :return:
         """
         cls._database_major_version = self._database_major_version
+        cls._parse_executor = self.parse_executor
 
         self.init_settings(cls)
         self.init_view_collection(cls)
@@ -755,6 +829,8 @@ async def init_beanie(
     allow_index_dropping: bool = False,
     recreate_views: bool = False,
     skip_indexes: bool = False,
+    parse_executor: Executor | None = None,
+    backend: str | None = None,
 ):
     """
     Beanie initialization
@@ -768,6 +844,12 @@ async def init_beanie(
     :param recreate_views: bool - if views should be recreated. Defaults to False.
     :param skip_indexes: bool - if you want to skip working with the indexes.
         Defaults to False.
+    :param parse_executor: Optional[Executor] - thread or process pool
+        to parse the query results in. Defaults to None.
+    :param backend: Optional[str] - name of the registered storage backend
+        to use instead of MongoDB, like "memory" for the in-process one.
+        Can't be used with `database` or `connection_string`.
+        Defaults to None.
     :return: None
     """
 
@@ -778,4 +860,6 @@ async def init_beanie(
         allow_index_dropping=allow_index_dropping,
         recreate_views=recreate_views,
         skip_indexes=skip_indexes,
+        parse_executor=parse_executor,
+        backend=backend,
     )
@@ -0,0 +1,437 @@
+import re
+from collections.abc import Callable, Mapping
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from bson import DBRef, Decimal128, Int64, MaxKey, MinKey, ObjectId, Regex
+from bson.timestamp import Timestamp
+
+from beanie.exceptions import NotSupported
+from beanie.odm.utils.bson_order import (
+    compare_values,
+    get_type_order,
+    values_equal,
+)
+
+Predicate = Callable[[Any], bool]
+
+_MISSING = object()
+
+_INT32_RANGE = range(-(2**31), 2**31)
+
+_REGEX_FLAGS = {
+    "i": re.IGNORECASE,
+    "m": re.MULTILINE,
+    "s": re.DOTALL,
+    "x": re.VERBOSE,
+}
+
+
+def _get_type_names(value: Any) -> set[str]:
+    if value is None:
+        return {"null"}
+    if isinstance(value, bool):
+        return {"bool"}
+    if isinstance(value, Int64):
+        return {"long", "number"}
+    if isinstance(value, int):
+        return {"int" if value in _INT32_RANGE else "long", "number"}
+    if isinstance(value, float):
+        return {"double", "number"}
+    if isinstance(value, (Decimal, Decimal128)):
+        return {"decimal", "number"}
+    if isinstance(value, str):
+        return {"string"}
+    if isinstance(value, (Mapping, DBRef)):
+        return {"object"}
+    if isinstance(value, (list, tuple)):
+        return {"array"}
+    if isinstance(value, (bytes, UUID)):
+        return {"binData"}
+    if isinstance(value, ObjectId):
+        return {"objectId"}
+    if isinstance(value, datetime):
+        return {"date"}
+    if isinstance(value, Timestamp):
+        return {"timestamp"}
+    if isinstance(value, (Regex, re.Pattern)):
+        return {"regex"}
+    if isinstance(value, MinKey):
+        return {"minKey"}
+    if isinstance(value, MaxKey):
+        return {"maxKey"}
+    return set()
+
+
+_TYPE_ALIASES = {
+    1: "double",
+    2: "string",
+    3: "object",
+    4: "array",
+    5: "binData",
+    7: "objectId",
+    8: "bool",
+    9: "date",
+    10: "null",
+    11: "regex",
+    16: "int",
+    17: "timestamp",
+    18: "long",
+    19: "decimal",
+    -1: "minKey",
+    127: "maxKey",
+}
+
+
+def _is_operator_expression(value: Any) -> bool:
+    return (
+        isinstance(value, Mapping)
+        and len(value) > 0
+        and all(isinstance(key, str) and key.startswith("$") for key in value)
+    )
+
+
+def _resolve(value: Any, parts: list[str]) -> list[Any]:
+    """
+    Values by the path. Arrays on the path are traversed,
+    so there can be many of them. _MISSING marks absent values
+    """
+    if not parts:
+        return [value]
+    part, rest = parts[0], parts[1:]
+    if isinstance(value, DBRef):
+        value = value.as_doc()
+    if isinstance(value, Mapping):
+        if part not in value:
+            return [_MISSING]
+        return _resolve(value[part], rest)
+    if isinstance(value, list):
+        results = []
+        if part.isdigit() and int(part) < len(value):
+            results.extend(_resolve(value[int(part)], rest))
+        for item in value:
+            if isinstance(item, (Mapping, DBRef)):
+                results.extend(_resolve(item, parts))
+        return results or [_MISSING]
+    return [_MISSING]
+
+
+def _expand(value: Any) -> list[Any]:
+    """
+    Candidates to match: the value itself and, for arrays, their elements
+    """
+    if isinstance(value, list):
+        return [value, *value]
+    return [value]
+
+
+def _compile_regex(pattern: Any, options: str = "") -> re.Pattern:
+    if isinstance(pattern, re.Pattern):
+        if not options:
+            return pattern
+        pattern = pattern.pattern
+    elif isinstance(pattern, Regex):
+        if not options:
+            return pattern.try_compile()
+        pattern = pattern.pattern
+    flags = 0
+    for option in options:
+        if option not in _REGEX_FLAGS:
+            raise NotSupported(f"Regex option {option} is not supported")
+        flags |= _REGEX_FLAGS[option]
+    return re.compile(pattern, flags)
+
+
+def _regex_matches(regex: re.Pattern, value: Any) -> bool:
+    if isinstance(value, str):
+        return regex.search(value) is not None
+    if isinstance(value, (Regex, re.Pattern)):
+        return _compile_regex(value).pattern == regex.pattern
+    return False
+
+
+def _compile_regex_match(regex: re.Pattern) -> Predicate:
+    return lambda value: _regex_matches(regex, value)
+
+
+def _compile_equality(argument: Any) -> Predicate:
+    if isinstance(argument, (Regex, re.Pattern)):
+        return _compile_regex_match(_compile_regex(argument))
+    if argument is None:
+        # null matches the missing fields too
+        return lambda value: value is _MISSING or value is None
+    return lambda value: value is not _MISSING and values_equal(
+        value, argument
+    )
+
+
+def _compile_comparison(
+    argument: Any, check: Callable[[int], bool]
+) -> Predicate:
+    argument_order = get_type_order(argument)
+
+    def predicate(value: Any) -> bool:
+        if value is _MISSING:
+            value = None
+        # values of different types are not compared
+        if get_type_order(value) != argument_order:
+            return False
+        return check(compare_values(value, argument))
+
+    return predicate
+
+
+def _compile_in(argument: Any) -> Predicate:
+    if not isinstance(argument, (list, tuple)):
+        raise ValueError("$in needs an array")
+    predicates = [_compile_equality(item) for item in argument]
+    return lambda value: any(predicate(value) for predicate in predicates)
+
+
+def _compile_type(argument: Any) -> Predicate:
+    names = set()
+    for item in argument if isinstance(argument, list) else [argument]:
+        name = _TYPE_ALIASES.get(item, item)
+        if not isinstance(name, str):
+            raise ValueError(f"Unknown $type: {item}")
+        names.add(name)
+    return lambda value: bool(names & _get_type_names(value))
+
+
+def _compile_mod(argument: Any) -> Predicate:
+    divisor, remainder = argument
+
+    def predicate(value: Any) -> bool:
+        if isinstance(value, bool) or not isinstance(
+            value, (int, float, Decimal, Decimal128)
+        ):
+            return False
+        if isinstance(value, Decimal128):
+            value = value.to_decimal()
+        value = int(value)
+        # the remainder has the sign of the dividend, like in C
+        result = abs(value) % abs(divisor)
+        return (-result if value < 0 else result) == remainder
+
+    return predicate
+
+
+def _get_bit_mask(argument: Any) -> int:
+    if isinstance(argument, list):
+        mask = 0
+        for position in argument:
+            mask |= 1 << position
+        return mask
+    if isinstance(argument, int) and not isinstance(argument, bool):
+        return argument
+    raise NotSupported("Only integer and position list bitmasks are supported")
+
+
+def _compile_bits(argument: Any, check: Callable[[int, int], bool]):
+    mask = _get_bit_mask(argument)
+
+    def predicate(value: Any) -> bool:
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        if isinstance(value, bool) or not isinstance(value, int):
+            return False
+        return check(value, mask)
+
+    return predicate
+
+
+# Operators, which are checked against the field value
+# and, for arrays, against each of their elements
+_ELEMENT_OPERATORS: dict[str, Callable[[Any], Predicate]] = {
+    "$eq": _compile_equality,
+    "$gt": lambda argument: _compile_comparison(argument, lambda r: r > 0),
+    "$gte": lambda argument: _compile_comparison(argument, lambda r: r >= 0),
+    "$lt": lambda argument: _compile_comparison(argument, lambda r: r < 0),
+    "$lte": lambda argument: _compile_comparison(argument, lambda r: r <= 0),
+    "$in": _compile_in,
+    "$type": _compile_type,
+    "$mod": _compile_mod,
+    "$bitsAllSet": lambda argument: _compile_bits(
+        argument, lambda value, mask: value & mask == mask
+    ),
+    "$bitsAnySet": lambda argument: _compile_bits(
+        argument, lambda value, mask: value & mask != 0
+    ),
+    "$bitsAllClear": lambda argument: _compile_bits(
+        argument, lambda value, mask: value & mask == 0
+    ),
+    "$bitsAnyClear": lambda argument: _compile_bits(
+        argument, lambda value, mask: value & mask != mask
+    ),
+}
+
+# Operators, which are the negations of the element operators
+_NEGATED_OPERATORS = {"$ne": "$eq", "$nin": "$in"}
+
+
+def _any_candidate(predicate: Predicate) -> Callable[[list[Any]], bool]:
+    def match(values: list[Any]) -> bool:
+        for value in values:
+            for candidate in _expand(value):
+                if predicate(candidate):
+                    return True
+        return False
+
+    return match
+
+
+def _compile_size(argument: Any) -> Callable[[list[Any]], bool]:
+    return lambda values: any(
+        isinstance(value, list) and len(value) == argument for value in values
+    )
+
+
+def _compile_exists(argument: Any) -> Callable[[list[Any]], bool]:
+    if argument:
+        return lambda values: any(value is not _MISSING for value in values)
+    return lambda values: all(value is _MISSING for value in values)
+
+
+def _compile_elem_match(argument: Any) -> Callable[[list[Any]], bool]:
+    if not isinstance(argument, Mapping):
+        raise ValueError("$elemMatch needs an object")
+    if _is_operator_expression(argument) and not any(
+        key in ("$and", "$or", "$nor") for key in argument
+    ):
+        # conditions on the elements themselves
+        element_match = _compile_conditions(argument)
+
+        def predicate(element: Any) -> bool:
+            return element_match([element])
+    else:
+        document_match = compile_filter(argument)
+
+        def predicate(element: Any) -> bool:
+            return isinstance(element, Mapping) and document_match(element)
+
+    return lambda values: any(
+        isinstance(value, list) and any(predicate(item) for item in value)
+        for value in values
+    )
+
+
+def _compile_all(argument: Any) -> Callable[[list[Any]], bool]:
+    if not isinstance(argument, list):
+        raise ValueError("$all needs an array")
+    if not argument:
+        return lambda values: False
+    matchers = [
+        _compile_elem_match(item["$elemMatch"])
+        if isinstance(item, Mapping) and "$elemMatch" in item
+        else _any_candidate(_compile_equality(item))
+        for item in argument
+    ]
+    return lambda values: all(matcher(values) for matcher in matchers)
+
+
+_ARRAY_OPERATORS: dict[str, Callable[[Any], Callable[[list[Any]], bool]]] = {
+    "$size": _compile_size,
+    "$exists": _compile_exists,
+    "$elemMatch": _compile_elem_match,
+    "$all": _compile_all,
+}
+
+
+def _negate(
+    match: Callable[[list[Any]], bool],
+) -> Callable[[list[Any]], bool]:
+    return lambda values: not match(values)
+
+
+def _compile_not(argument: Any) -> Callable[[list[Any]], bool]:
+    if isinstance(argument, (Regex, re.Pattern)):
+        match = _any_candidate(_compile_equality(argument))
+    elif _is_operator_expression(argument):
+        match = _compile_conditions(argument)
+    else:
+        raise ValueError("$not needs a regex or an operator expression")
+    return _negate(match)
+
+
+def _compile_conditions(
+    conditions: Mapping[str, Any],
+) -> Callable[[list[Any]], bool]:
+    """
+    Compile the operator expression of a field to the function,
+    which gets the resolved values of the field
+    """
+    matchers: list[Callable[[list[Any]], bool]] = []
+    options = conditions.get("$options", "")
+    for operator, argument in conditions.items():
+        if operator == "$options":
+            if "$regex" not in conditions:
+                raise ValueError("$options needs a $regex")
+        elif operator == "$regex":
+            regex = _compile_regex(argument, options)
+            matchers.append(_any_candidate(_compile_regex_match(regex)))
+        elif operator in _ELEMENT_OPERATORS:
+            matchers.append(
+                _any_candidate(_ELEMENT_OPERATORS[operator](argument))
+            )
+        elif operator in _NEGATED_OPERATORS:
+            positive = _any_candidate(
+                _ELEMENT_OPERATORS[_NEGATED_OPERATORS[operator]](argument)
+            )
+            matchers.append(_negate(positive))
+        elif operator in _ARRAY_OPERATORS:
+            matchers.append(_ARRAY_OPERATORS[operator](argument))
+        elif operator == "$not":
+            matchers.append(_compile_not(argument))
+        else:
+            raise NotSupported(f"{operator} can't be evaluated locally")
+    return lambda values: all(matcher(values) for matcher in matchers)
+
+
+def _compile_field(path: str, condition: Any) -> Predicate:
+    parts = path.split(".")
+    if _is_operator_expression(condition):
+        match = _compile_conditions(condition)
+    else:
+        match = _any_candidate(_compile_equality(condition))
+    return lambda document: match(_resolve(document, parts))
+
+
+def _compile_logical(operator: str, argument: Any) -> Predicate:
+    if not isinstance(argument, list) or not argument:
+        raise ValueError(f"{operator} needs a non-empty array")
+    predicates = [compile_filter(query) for query in argument]
+    if operator == "$and":
+        return lambda document: all(p(document) for p in predicates)
+    if operator == "$or":
+        return lambda document: any(p(document) for p in predicates)
+    return lambda document: not any(p(document) for p in predicates)
+
+
+def compile_filter(query: Mapping[str, Any]) -> Predicate:
+    """
+    Compile the encoded MongoDB filter query to a predicate,
+    which checks if an encoded document matches it,
+    following MongoDB semantics.
+
+    NotSupported is raised for the operators, which can't be evaluated
+    without the server: `$expr`, `$where`, `$text`, `$jsonSchema`
+    and the geospatial ones
+
+    :param query: Mapping[str, Any] - encoded filter query
+    :return: Callable[[Mapping[str, Any]], bool]
+    """
+    predicates: list[Predicate] = []
+    for key, condition in query.items():
+        if key in ("$and", "$or", "$nor"):
+            predicates.append(_compile_logical(key, condition))
+        elif key == "$comment":
+            continue
+        elif key.startswith("$"):
+            raise NotSupported(f"{key} can't be evaluated locally")
+        else:
+            predicates.append(_compile_field(key, condition))
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda document: all(p(document) for p in predicates)
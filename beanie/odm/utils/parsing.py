@@ -1,5 +1,7 @@
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any
 
+from bson.raw_bson import RawBSONDocument
 from pydantic import BaseModel
 
 from beanie.exceptions import (
@@ -36,6 +38,8 @@ def _safe_setattr(model: BaseModel, field_name: str, value: Any) -> None:
         # documents or models built via model_dump), not from raw or
         # otherwise untrusted user input.
         object.__setattr__(model, field_name, value)
+        if hasattr(model, "_mark_changed"):
+            model._mark_changed(field_name, value)
     else:
         model.__setattr__(field_name, value)
 
@@ -108,9 +112,11 @@ def apply_changes(changes: dict[str, Any], target: BaseModel | dict[str, Any]):
                 )
 
 
-def save_state(item: BaseModel):
+def save_state(item: BaseModel, data: Any = None):
     if hasattr(item, "_save_state"):
-        item._save_state()  # type: ignore
+        item._save_state(  # type: ignore
+            source=data if isinstance(data, Mapping) else None
+        )
 
 
 def parse_obj(
@@ -125,7 +131,7 @@ def parse_obj(
         if model._document_models is None:  # type: ignore
             raise UnionHasNoRegisteredDocs
 
-        if isinstance(data, dict):
+        if isinstance(data, Mapping):
             class_name = data[model.get_settings().class_id]  # type: ignore
         else:
             class_name = data._class_id
@@ -142,7 +148,7 @@ def parse_obj(
         and model.get_model_type() is ModelType.Document  # type: ignore
         and model._inheritance_inited  # type: ignore
     ):
-        if isinstance(data, dict):
+        if isinstance(data, Mapping):
             class_name = data.get(model.get_settings().class_id)  # type: ignore
         elif hasattr(data, model.get_settings().class_id):  # type: ignore
             class_name = data._class_id
@@ -156,6 +162,12 @@ def parse_obj(
                 lazy_parse=lazy_parse,
             )  # type: ignore
 
+    source = data
+    if isinstance(data, RawBSONDocument):
+        from beanie.odm.utils.raw_bson import decode_shared_values
+
+        data = decode_shared_values(model, data)
+
     if (
         lazy_parse
         and hasattr(model, "get_model_type")
@@ -165,5 +177,22 @@ def parse_obj(
         o._saved_state = {"_id": o.id}
         return o
     result = parse_model(model, data)
-    save_state(result)
+    save_state(result, source)
     return result
+
+
+def parse_batch(
+    model: type[BaseModel] | type["Document"],
+    batch: list[Any],
+    lazy_parse: bool = False,
+) -> list[BaseModel]:
+    """
+    Parse a batch of raw documents.
+    It is a module level function, so it can be sent to a process pool
+
+    :param model: type[BaseModel] - model to parse with
+    :param batch: List[Any] - raw documents
+    :param lazy_parse: bool - parse lazily
+    :return: List[BaseModel]
+    """
+    return [parse_obj(model, data, lazy_parse=lazy_parse) for data in batch]
@@ -1,4 +1,5 @@
-from typing import TypeVar
+from types import UnionType
+from typing import Any, TypeVar, Union, get_args, get_origin
 
 from pydantic import BaseModel
 
@@ -7,6 +8,10 @@ from beanie.odm.utils.pydantic import get_config_value, get_model_fields
 
 ProjectionModelType = TypeVar("ProjectionModelType", bound=BaseModel)
 
+# Tree of the field names, which are read from the documents.
+# `None` value means the whole field value is read
+FieldsTree = dict[str, Any]
+
 
 def get_projection(
     model: type[ProjectionModelType],
@@ -34,3 +39,134 @@ def get_projection(
     for name, field in get_model_fields(model).items():
         document_projection[field.alias or name] = 1
     return document_projection
+
+
+def merge_fields(fields: FieldsTree, other: FieldsTree) -> FieldsTree:
+    """
+    Merge the other fields tree into the fields one
+
+    :param fields: FieldsTree - fields tree to update
+    :param other: FieldsTree - fields tree to merge
+    :return: FieldsTree - updated fields tree
+    """
+    for name, value in other.items():
+        if name not in fields:
+            fields[name] = value
+        elif fields[name] is None or value is None:
+            fields[name] = None
+        else:
+            merge_fields(fields[name], value)
+    return fields
+
+
+def add_field_path(fields: FieldsTree, path: str) -> FieldsTree:
+    """
+    Add the dotted field path to the fields tree. Array indexes
+    and positional operators mean the whole array is read
+
+    :param fields: FieldsTree - fields tree to update
+    :param path: str - dotted field path
+    :return: FieldsTree - updated fields tree
+    """
+    parts = []
+    for part in path.split("."):
+        if part.isdigit() or part.startswith("$"):
+            break
+        parts.append(part)
+    if not parts:
+        return fields
+    tree: FieldsTree | None = None
+    for part in reversed(parts):
+        tree = {part: tree}
+    return merge_fields(fields, tree)  # type: ignore
+
+
+def get_expression_fields(expression: Any) -> FieldsTree | None:
+    """
+    Fields, which the aggregation expression reads
+
+    :param expression: Any - aggregation expression
+    :return: Optional[FieldsTree] - None, if the whole document is read
+    """
+    fields: FieldsTree = {}
+    if isinstance(expression, str):
+        if expression.startswith(("$$ROOT", "$$CURRENT")):
+            return None
+        if expression.startswith("$") and not expression.startswith("$$"):
+            add_field_path(fields, expression[1:])
+    elif isinstance(expression, dict):
+        for key, value in expression.items():
+            if key == "$literal":
+                continue
+            value_fields = get_expression_fields(value)
+            if value_fields is None:
+                return None
+            merge_fields(fields, value_fields)
+    elif isinstance(expression, (list, tuple)):
+        for value in expression:
+            value_fields = get_expression_fields(value)
+            if value_fields is None:
+                return None
+            merge_fields(fields, value_fields)
+    return fields
+
+
+def _get_nested_model(annotation: Any) -> type[BaseModel] | None:
+    origin = get_origin(annotation)
+    if (
+        origin in (list, set, tuple)
+        or origin is Union
+        or isinstance(annotation, UnionType)
+    ):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+    else:
+        args = None
+    if args is not None:
+        if len(args) != 1:
+            return None
+        return _get_nested_model(args[0])
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+def get_projection_fields(
+    model: type[BaseModel], _visited: frozenset[type] = frozenset()
+) -> FieldsTree | None:
+    """
+    Fields, which the projection model reads from the documents.
+    Nested models read only their own fields
+
+    :param model: Type[BaseModel] - projection model
+    :return: Optional[FieldsTree] - None, if the whole document is read
+    """
+    projection = get_projection(model)
+    if projection is None or model in _visited:
+        return None
+    fields: FieldsTree = {}
+    if hasattr(model, "Settings") and hasattr(model.Settings, "projection"):
+        for key, value in projection.items():
+            if value == 1:
+                add_field_path(fields, key)
+            elif value == 0:
+                # exclusion projection reads all the other fields
+                return None
+            else:
+                value_fields = get_expression_fields(value)
+                if value_fields is None:
+                    return None
+                merge_fields(fields, value_fields)
+        return fields
+    for name, field in get_model_fields(model).items():
+        nested_model = _get_nested_model(field.annotation)
+        merge_fields(
+            fields,
+            {
+                field.alias or name: (
+                    get_projection_fields(nested_model, _visited | {model})
+                    if nested_model is not None
+                    else None
+                )
+            },
+        )
+    return fields
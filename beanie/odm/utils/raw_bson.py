@@ -0,0 +1,55 @@
+from collections.abc import Mapping
+from typing import Any
+
+from bson.raw_bson import RawBSONDocument
+from pydantic import BaseModel
+from pymongo.asynchronous.collection import AsyncCollection
+
+from beanie.odm.utils.snapshot import get_shared_keys
+
+
+def get_raw_bson_collection(collection: AsyncCollection) -> AsyncCollection:
+    """
+    Get the collection, which returns documents as RawBSONDocument.
+    Values of such documents are decoded on the first access
+
+    :param collection: AsyncCollection - pymongo collection
+    :return: AsyncCollection
+    """
+    return collection.with_options(
+        codec_options=collection.codec_options.with_options(
+            document_class=RawBSONDocument
+        )
+    )
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, RawBSONDocument):
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+def decode_shared_values(
+    model: type[BaseModel], data: RawBSONDocument
+) -> Mapping[str, Any]:
+    """
+    Decode the values, which would be kept by the parsed model as is
+    (`Any`, bare containers, extras). All the other values stay raw
+    and are decoded by pydantic only when they are validated
+
+    :param model: type[BaseModel] - model class
+    :param data: RawBSONDocument - raw document
+    :return: Mapping[str, Any]
+    """
+    shared_keys, field_keys = get_shared_keys(model)
+    if not shared_keys and field_keys is None:
+        return data
+    return {
+        key: _decode(value)
+        if key in shared_keys
+        or (field_keys is not None and key not in field_keys)
+        else value
+        for key, value in data.items()
+    }
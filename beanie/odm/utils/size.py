@@ -0,0 +1,29 @@
+import sys
+from collections.abc import Mapping
+from typing import Any
+
+import bson
+from bson.errors import InvalidDocument
+from bson.raw_bson import RawBSONDocument
+
+
+def get_approximate_size(value: Any) -> int:
+    """
+    Approximate size of the value in bytes.
+    Documents are measured by their BSON size
+
+    :param value: Any - value to measure
+    :return: int
+    """
+    if isinstance(value, RawBSONDocument):
+        return len(value.raw)
+    if isinstance(value, Mapping):
+        try:
+            return len(bson.encode(value))
+        except (InvalidDocument, TypeError, OverflowError):
+            pass
+    if isinstance(value, list):
+        return sys.getsizeof(value) + sum(
+            get_approximate_size(item) for item in value
+        )
+    return sys.getsizeof(value)
@@ -0,0 +1,181 @@
+from collections.abc import Mapping
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Literal,
+    TypeVar,
+    get_args,
+    get_origin,
+)
+
+import bson
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from pydantic import BaseModel
+
+from beanie.odm.fields import BackLink, Link
+from beanie.odm.utils.dump import get_dict
+from beanie.odm.utils.encoder import get_encoding_plan
+from beanie.odm.utils.pydantic import (
+    get_config_value,
+    get_model_fields,
+    parse_model,
+)
+
+if TYPE_CHECKING:
+    from beanie.odm.documents import Document
+
+_MUTABLE_BARE_TYPES = (dict, list, set, tuple, frozenset)
+
+_SHARED_KEYS: dict[type, tuple[frozenset[str], frozenset[str] | None]] = {}
+
+
+def _may_share_input(annotation: Any, seen: set[type]) -> bool:
+    """
+    Can the validated value of the annotation keep references
+    to the mutable objects of the input data
+    """
+    if annotation is Any or annotation is object:
+        return True
+    if isinstance(annotation, TypeVar):
+        return True
+    if annotation in _MUTABLE_BARE_TYPES:
+        return True
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _may_share_input(get_args(annotation)[0], seen)
+    if origin is Literal or origin is Link or origin is BackLink:
+        return False
+    if origin is not None:
+        return any(
+            _may_share_input(arg, seen)
+            for arg in get_args(annotation)
+            if arg is not Ellipsis
+        )
+    if isinstance(annotation, type):
+        if not issubclass(annotation, BaseModel) or annotation in seen:
+            return False
+        seen.add(annotation)
+        if get_config_value(annotation, "extra") == "allow":
+            return True
+        return any(
+            _may_share_input(field.annotation, seen)
+            for field in get_model_fields(annotation).values()
+        )
+    # forward references and other unresolved annotations
+    return True
+
+
+def get_shared_keys(
+    model: type[BaseModel],
+) -> tuple[frozenset[str], frozenset[str] | None]:
+    """
+    Keys of the input data, which values can be referenced
+    by the parsed model. If the extra values are kept as is,
+    keys of the fields are returned too, as all the other keys are shared
+
+    :param model: type[BaseModel] - model class
+    :return: Tuple[FrozenSet[str], Optional[FrozenSet[str]]]
+    """
+    shared = _SHARED_KEYS.get(model)
+    if shared is None:
+        fields = get_model_fields(model)
+        plan = get_encoding_plan(model)
+        shared = (
+            frozenset(
+                field.key
+                for field in plan.fields
+                if _may_share_input(fields[field.name].annotation, {model})
+            ),
+            frozenset(field.key for field in plan.fields)
+            if get_config_value(model, "extra") == "allow"
+            else None,
+        )
+        _SHARED_KEYS[model] = shared
+    return shared
+
+
+def share_subtrees(
+    previous: Mapping[str, Any], current: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Replace values of the current state, which are equal to the values of
+    the previous state, with the previous ones. Both the states can
+    reference the same objects, as the saved states are never mutated
+
+    :param previous: Mapping[str, Any] - previous state
+    :param current: Dict[str, Any] - current state
+    :return: Dict[str, Any]
+    """
+    for key, value in current.items():
+        previous_value = previous.get(key)
+        if type(previous_value) is not type(value):
+            continue
+        if previous_value == value:
+            current[key] = previous_value
+        elif isinstance(previous_value, dict):
+            current[key] = share_subtrees(previous_value, value)
+    return current
+
+
+def _get_codec_options(document_class: type["Document"]) -> CodecOptions:
+    return document_class.get_pymongo_collection().codec_options
+
+
+def get_state_source(
+    document: "Document", data: Mapping[str, Any]
+) -> bytes | None:
+    """
+    BSON of the raw data, which the document was parsed from.
+    The saved state is built from it on the first access.
+    Raw BSON documents are used as is, other data is encoded by the
+    BSON C extension, which is much cheaper than the state encoding.
+    None if the data can not be used: the missing fields could get other
+    values from their default factories, when the data is parsed again
+
+    :param document: Document - parsed document
+    :param data: Mapping[str, Any] - raw data of the document
+    :return: Optional[bytes]
+    """
+    fields = get_model_fields(type(document))
+    for field in get_encoding_plan(type(document)).fields:
+        if (
+            field.key not in data
+            and field.name not in data
+            and fields[field.name].default_factory is not None
+        ):
+            return None
+    if isinstance(data, RawBSONDocument):
+        return data.raw
+    try:
+        return bson.encode(
+            data, codec_options=_get_codec_options(type(document))
+        )
+    except Exception:
+        # not BSON encodable, the state is built right away
+        return None
+
+
+def build_state(
+    document_class: type["Document"], source: bytes
+) -> dict[str, Any]:
+    """
+    Build the saved state from the BSON of the raw data
+
+    :param document_class: type[Document] - document class
+    :param source: bytes - BSON of the raw data
+    :return: Dict[str, Any]
+    """
+    data = bson.decode(
+        source,
+        codec_options=_get_codec_options(document_class).with_options(
+            document_class=dict
+        ),
+    )
+    return get_dict(
+        parse_model(document_class, data),
+        to_db=True,
+        keep_nulls=document_class.get_settings().keep_nulls,
+        exclude={"revision_id"},
+    )
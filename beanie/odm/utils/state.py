@@ -19,7 +19,7 @@ def check_if_state_saved(self: "DocType"):
         raise StateManagementIsTurnedOff(
             "State management is turned off for this document"
         )
-    if self._saved_state is None:
+    if self._saved_state is None and self._saved_state_source is None:
         raise StateNotSaved("No state was saved")
 
 
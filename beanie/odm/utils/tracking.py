@@ -0,0 +1,339 @@
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from beanie.odm.utils.encoder import (
+    BSON_SCALAR_TYPES,
+    DEFAULT_CUSTOM_ENCODERS,
+    get_encoding_plan,
+)
+
+if TYPE_CHECKING:
+    from beanie.odm.documents import Document
+
+IMMUTABLE_TYPES = BSON_SCALAR_TYPES + tuple(DEFAULT_CUSTOM_ENCODERS)
+
+_UNTRACKABLE = object()
+
+
+class ChangeTracker:
+    """
+    Dirty fields registry of a document.
+
+    - `dirty` - names of the fields which were assigned or mutated
+    through the tracked containers since the state was saved
+    - `untracked` - names of the fields which hold values
+    the tracker can not observe (nested models, custom objects, extras,
+    containers which are not tracked). They are compared with
+    the saved state on every check
+    """
+
+    __slots__ = ("dirty", "untracked")
+
+    def __init__(self) -> None:
+        self.dirty: set[str] = set()
+        self.untracked: set[str] = set()
+
+    def mark(self, field_name: str) -> None:
+        self.dirty.add(field_name)
+
+    def assign(
+        self, document: "Document", field_name: str, value: Any
+    ) -> None:
+        """
+        Mark the assigned field as dirty. The validated copy
+        of the value is replaced with the tracked one,
+        as nothing else references it. The value itself is kept,
+        so the references of the caller stay attached
+
+        :param document: Document - document of the tracker
+        :param field_name: str - name of the assigned field
+        :param value: Any - assigned value
+        :return: None
+        """
+        self.dirty.add(field_name)
+        values = document.__dict__
+        stored = values.get(field_name, value)
+        if stored is not value:
+            wrapped = _track_value(document, stored, self, field_name)
+            if wrapped is not _UNTRACKABLE and wrapped is not stored:
+                values[field_name] = wrapped
+
+    def reset(self, document: "Document") -> None:
+        """
+        Start recording the changes since the state is saved.
+        The dirty fields, which hold the values the tracker
+        can not observe, are compared with the saved state from now on
+
+        :param document: Document - document of the tracker
+        :return: None
+        """
+        values = document.__dict__
+        for field_name in self.dirty:
+            if field_name in values and _is_tracked(
+                document, values[field_name], self, field_name
+            ):
+                self.untracked.discard(field_name)
+            else:
+                self.untracked.add(field_name)
+        self.dirty.clear()
+
+    def get_fields_to_check(self) -> set[str]:
+        return self.dirty | self.untracked
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> None:
+        # deep copies of the document are compared with the saved state
+        # as a whole
+        return None
+
+
+class TrackedList(list):
+    """
+    List, which marks the owner field as dirty on every mutation
+    """
+
+    __slots__ = ("_field_name", "_tracker")
+
+    def __init__(
+        self, iterable: Any, tracker: ChangeTracker, field_name: str
+    ) -> None:
+        super().__init__(iterable)
+        self._tracker = tracker
+        self._field_name = field_name
+
+    def __reduce_ex__(self, protocol: Any):
+        return type(self), (list(self), self._tracker, self._field_name)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list:
+        return deepcopy(list(self), memo)
+
+
+class TrackedDict(dict):
+    """
+    Dict, which marks the owner field as dirty on every mutation
+    """
+
+    __slots__ = ("_field_name", "_tracker")
+
+    def __init__(
+        self, iterable: Any, tracker: ChangeTracker, field_name: str
+    ) -> None:
+        super().__init__(iterable)
+        self._tracker = tracker
+        self._field_name = field_name
+
+    def __reduce_ex__(self, protocol: Any):
+        return type(self), (dict(self), self._tracker, self._field_name)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict:
+        return deepcopy(dict(self), memo)
+
+
+class TrackedSet(set):
+    """
+    Set, which marks the owner field as dirty on every mutation
+    """
+
+    __slots__ = ("_field_name", "_tracker")
+
+    def __init__(
+        self, iterable: Any, tracker: ChangeTracker, field_name: str
+    ) -> None:
+        super().__init__(iterable)
+        self._tracker = tracker
+        self._field_name = field_name
+
+    def __reduce_ex__(self, protocol: Any):
+        return type(self), (set(self), self._tracker, self._field_name)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> set:
+        return deepcopy(set(self), memo)
+
+
+def _mutating(base: type, method_name: str):
+    base_method = getattr(base, method_name)
+
+    def method(self, *args, **kwargs):
+        self._tracker.mark(self._field_name)
+        return base_method(self, *args, **kwargs)
+
+    method.__name__ = method_name
+    method.__qualname__ = f"{base.__name__}.{method_name}"
+    return method
+
+
+for _tracked_type, _method_names in (
+    (
+        TrackedList,
+        (
+            "__setitem__",
+            "__delitem__",
+            "__iadd__",
+            "__imul__",
+            "append",
+            "extend",
+            "insert",
+            "pop",
+            "remove",
+            "clear",
+            "sort",
+            "reverse",
+        ),
+    ),
+    (
+        TrackedDict,
+        (
+            "__setitem__",
+            "__delitem__",
+            "__ior__",
+            "pop",
+            "popitem",
+            "clear",
+            "update",
+            "setdefault",
+        ),
+    ),
+    (
+        TrackedSet,
+        (
+            "__ior__",
+            "__iand__",
+            "__isub__",
+            "__ixor__",
+            "add",
+            "discard",
+            "remove",
+            "pop",
+            "clear",
+            "update",
+            "difference_update",
+            "intersection_update",
+            "symmetric_difference_update",
+        ),
+    ),
+):
+    for _method_name in _method_names:
+        setattr(
+            _tracked_type,
+            _method_name,
+            _mutating(_tracked_type.__bases__[0], _method_name),
+        )
+
+
+def _wrap(value: Any, tracker: ChangeTracker, field_name: str) -> Any:
+    """
+    Return the value with all the mutable containers replaced by
+    the tracked ones or `_UNTRACKABLE` if the value can be mutated
+    without the tracker noticing it
+    """
+    if isinstance(value, IMMUTABLE_TYPES):
+        return value
+    value_type = type(value)
+    if value_type is list or value_type is TrackedList:
+        items = []
+        for item in value:
+            item = _wrap(item, tracker, field_name)
+            if item is _UNTRACKABLE:
+                return _UNTRACKABLE
+            items.append(item)
+        return TrackedList(items, tracker, field_name)
+    if value_type is dict or value_type is TrackedDict:
+        items_dict = {}
+        for key, item in value.items():
+            item = _wrap(item, tracker, field_name)
+            if item is _UNTRACKABLE:
+                return _UNTRACKABLE
+            items_dict[key] = item
+        return TrackedDict(items_dict, tracker, field_name)
+    is_set = value_type is set or value_type is TrackedSet
+    if is_set or isinstance(value, (tuple, frozenset)):
+        for item in value:
+            if not isinstance(item, IMMUTABLE_TYPES):
+                return _UNTRACKABLE
+        if is_set:
+            return TrackedSet(value, tracker, field_name)
+        return value
+    return _UNTRACKABLE
+
+
+def _is_link_field(document: "Document", field_name: str) -> bool:
+    field = get_encoding_plan(type(document)).fields_by_name.get(field_name)
+    return field is not None and field.link_type is not None
+
+
+def _track_value(
+    document: "Document", value: Any, tracker: ChangeTracker, field_name: str
+) -> Any:
+    if _is_link_field(document, field_name):
+        # links are stored as references,
+        # only the list of them can be changed in place
+        if type(value) is list:
+            return TrackedList(value, tracker, field_name)
+        return value
+    return _wrap(value, tracker, field_name)
+
+
+def _is_tracked(
+    document: "Document", value: Any, tracker: ChangeTracker, field_name: str
+) -> bool:
+    """
+    Check, if all the changes of the value are recorded by the tracker
+    """
+    if isinstance(value, IMMUTABLE_TYPES):
+        return True
+    value_type = type(value)
+    if value_type in (TrackedList, TrackedDict, TrackedSet):
+        if value._tracker is not tracker or value._field_name != field_name:
+            return False
+    elif value_type is not tuple and value_type is not frozenset:
+        return (
+            value_type is not list
+            and value_type is not dict
+            and value_type is not set
+            and _is_link_field(document, field_name)
+        )
+    if _is_link_field(document, field_name):
+        return True
+    items = value.values() if value_type is TrackedDict else value
+    return all(
+        _is_tracked(document, item, tracker, field_name) for item in items
+    )
+
+
+def track(document: "Document") -> ChangeTracker:
+    """
+    Start tracking changes of the just validated document.
+    Mutable containers of the top level fields are replaced
+    with the tracked copies, before anything references them
+
+    :param document: Document - document to track
+    :return: ChangeTracker
+    """
+    tracker = ChangeTracker()
+    values = document.__dict__
+    for name, value in values.items():
+        wrapped = _track_value(document, value, tracker, name)
+        if wrapped is _UNTRACKABLE:
+            tracker.untracked.add(name)
+        elif wrapped is not value:
+            values[name] = wrapped
+    if document.__pydantic_extra__:
+        tracker.untracked.update(document.__pydantic_extra__)
+    return tracker
+
+
+def tracked_setattr(document: "Document", name: str, value: Any) -> None:
+    """
+    `__setattr__` of the documents with the tracked state management
+    """
+    BaseModel.__setattr__(document, name, value)
+    document._mark_changed(name, value)
+
+
+def tracked_delattr(document: "Document", name: str) -> None:
+    """
+    `__delattr__` of the documents with the tracked state management
+    """
+    BaseModel.__delattr__(document, name)
+    document._mark_changed(name, None)
@@ -0,0 +1,575 @@
+import time
+from collections.abc import Callable, Mapping
+from datetime import datetime, timezone
+from decimal import Decimal
+from functools import cmp_to_key
+from typing import TYPE_CHECKING, Any
+
+from bson import Decimal128
+from bson.timestamp import Timestamp
+
+from beanie.exceptions import ApplyChangesException, NotSupported
+from beanie.odm.operators.update.general import SetRevisionId
+from beanie.odm.utils.bson_order import (
+    compare_values,
+    is_number,
+    to_decimal,
+    values_equal,
+)
+from beanie.odm.utils.dump import get_dict
+from beanie.odm.utils.encoder import Encoder, get_encoding_plan
+from beanie.odm.utils.matcher import compile_filter
+from beanie.odm.utils.pydantic import get_config_value, get_model_fields
+
+if TYPE_CHECKING:
+    from beanie.odm.documents import Document
+
+_MISSING = object()
+
+# Operators, which values are set by the server
+SERVER_SIDE_OPERATORS = frozenset({"$currentDate"})
+
+
+def _split_path(path: str) -> list[str]:
+    parts = path.split(".")
+    if any(part.startswith("$") for part in parts):
+        raise ApplyChangesException(
+            f"Positional path {path} can't be applied locally"
+        )
+    return parts
+
+
+def _get_child(container: Any, part: str, create: bool) -> Any:
+    if isinstance(container, dict):
+        if part not in container:
+            if not create:
+                return _MISSING
+            container[part] = {}
+        return container[part]
+    if isinstance(container, list) and part.isdigit():
+        index = int(part)
+        if index >= len(container):
+            if not create:
+                return _MISSING
+            container.extend([None] * (index - len(container)))
+            container.append({})
+        return container[index]
+    raise ApplyChangesException(
+        f"Can't traverse {type(container).__name__} by {part}"
+    )
+
+
+def _get_parent(data: dict[str, Any], parts: list[str], create: bool) -> Any:
+    """
+    Container of the last path part or _MISSING if it does not exist
+    """
+    current: Any = data
+    for part in parts[:-1]:
+        current = _get_child(current, part, create)
+        if current is _MISSING:
+            return _MISSING
+    return current
+
+
+def _get_value(container: Any, part: str) -> Any:
+    if isinstance(container, dict):
+        return container.get(part, _MISSING)
+    if isinstance(container, list) and part.isdigit():
+        index = int(part)
+        return container[index] if index < len(container) else _MISSING
+    return _MISSING
+
+
+def _set_value(container: Any, part: str, value: Any) -> None:
+    if isinstance(container, dict):
+        container[part] = value
+    elif isinstance(container, list) and part.isdigit():
+        index = int(part)
+        if index >= len(container):
+            container.extend([None] * (index + 1 - len(container)))
+        container[index] = value
+    else:
+        raise ApplyChangesException(
+            f"Can't set {part} of {type(container).__name__}"
+        )
+
+
+def _get_by_path(value: Any, path: str) -> Any:
+    for part in path.split("."):
+        value = _get_value(value, part)
+        if value is _MISSING:
+            return None
+    return value
+
+
+def _update_value(
+    data: dict[str, Any], path: str, update: Callable[[Any], Any]
+) -> None:
+    """
+    Replace the value by the path with the result of the update function.
+    It gets _MISSING, if there is no value
+    """
+    parts = _split_path(path)
+    parent = _get_parent(data, parts, create=True)
+    _set_value(parent, parts[-1], update(_get_value(parent, parts[-1])))
+
+
+def _update_existing_value(
+    data: dict[str, Any], path: str, update: Callable[[Any], Any]
+) -> None:
+    """
+    Replace the value by the path with the result of the update function,
+    if the value exists
+    """
+    parts = _split_path(path)
+    parent = _get_parent(data, parts, create=False)
+    if parent is _MISSING:
+        return
+    value = _get_value(parent, parts[-1])
+    if value is not _MISSING:
+        _set_value(parent, parts[-1], update(value))
+
+
+def _check_number(value: Any, operator: str) -> None:
+    if not is_number(value):
+        raise ApplyChangesException(
+            f"{operator} can't be applied to {type(value).__name__}"
+        )
+
+
+def _calculate(
+    left: Any, right: Any, operation: Callable[[Any, Any], Any]
+) -> Any:
+    if isinstance(left, (Decimal, Decimal128)) or isinstance(
+        right, (Decimal, Decimal128)
+    ):
+        return Decimal128(operation(to_decimal(left), to_decimal(right)))
+    return operation(left, right)
+
+
+def _get_array(value: Any, operator: str) -> list[Any]:
+    if value is _MISSING:
+        return []
+    if not isinstance(value, list):
+        raise ApplyChangesException(
+            f"{operator} can't be applied to {type(value).__name__}"
+        )
+    return value
+
+
+def _is_operator_expression(value: Any) -> bool:
+    return isinstance(value, Mapping) and any(
+        isinstance(key, str) and key.startswith("$") for key in value
+    )
+
+
+def _compile_pull_condition(condition: Any) -> Callable[[Any], bool]:
+    """
+    Predicate for the array elements to remove with $pull
+    """
+    try:
+        if _is_operator_expression(condition):
+            predicate = compile_filter({"element": condition})
+            return lambda item: predicate({"element": item})
+        if isinstance(condition, Mapping):
+            # documents are matched as queries
+            query = compile_filter(condition)
+            return lambda item: isinstance(item, Mapping) and query(item)
+    except NotSupported as e:
+        raise ApplyChangesException(str(e)) from e
+    return lambda item: values_equal(item, condition)
+
+
+def _set(data: dict[str, Any], path: str, argument: Any) -> None:
+    _update_value(data, path, lambda _: argument)
+
+
+def _unset(data: dict[str, Any], path: str, argument: Any) -> None:
+    parts = _split_path(path)
+    parent = _get_parent(data, parts, create=False)
+    if isinstance(parent, dict):
+        parent.pop(parts[-1], None)
+    elif isinstance(parent, list) and parts[-1].isdigit():
+        # array elements are not removed, but set to null
+        if int(parts[-1]) < len(parent):
+            parent[int(parts[-1])] = None
+
+
+def _inc(data: dict[str, Any], path: str, argument: Any) -> None:
+    _check_number(argument, "$inc")
+
+    def update(value: Any) -> Any:
+        if value is _MISSING:
+            return argument
+        _check_number(value, "$inc")
+        return _calculate(value, argument, lambda left, right: left + right)
+
+    _update_value(data, path, update)
+
+
+def _mul(data: dict[str, Any], path: str, argument: Any) -> None:
+    _check_number(argument, "$mul")
+
+    def update(value: Any) -> Any:
+        if value is _MISSING:
+            value = 0
+        _check_number(value, "$mul")
+        return _calculate(value, argument, lambda left, right: left * right)
+
+    _update_value(data, path, update)
+
+
+def _compare(operator: str, replace: Callable[[int], bool]):
+    def apply(data: dict[str, Any], path: str, argument: Any) -> None:
+        def update(value: Any) -> Any:
+            if value is _MISSING:
+                return argument
+            try:
+                result = compare_values(argument, value)
+            except TypeError as e:
+                raise ApplyChangesException(f"{operator}: {e}") from e
+            return argument if replace(result) else value
+
+        _update_value(data, path, update)
+
+    return apply
+
+
+def _current_date(data: dict[str, Any], path: str, argument: Any) -> None:
+    if isinstance(argument, Mapping) and argument.get("$type") == "timestamp":
+        value: Any = Timestamp(int(time.time()), 1)
+    elif argument is True or (
+        isinstance(argument, Mapping) and argument.get("$type") == "date"
+    ):
+        # BSON dates have millisecond precision and are returned naive
+        now = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+        value = now.replace(microsecond=now.microsecond // 1000 * 1000)
+    else:
+        raise ApplyChangesException(f"Wrong $currentDate value: {argument}")
+    _set(data, path, value)
+
+
+def _get_sort_key(sort: Any) -> Callable[[Any, Any], int]:
+    if isinstance(sort, Mapping):
+
+        def compare(left: Any, right: Any) -> int:
+            for path, direction in sort.items():
+                result = compare_values(
+                    _get_by_path(left, path), _get_by_path(right, path)
+                ) * (1 if direction == 1 else -1)
+                if result:
+                    return result
+            return 0
+
+    else:
+
+        def compare(left: Any, right: Any) -> int:
+            return compare_values(left, right) * (1 if sort == 1 else -1)
+
+    return compare
+
+
+def _push(data: dict[str, Any], path: str, argument: Any) -> None:
+    if _is_operator_expression(argument):
+        unknown = set(argument) - {"$each", "$position", "$slice", "$sort"}
+        if unknown or "$each" not in argument:
+            raise ApplyChangesException(f"Wrong $push modifiers: {argument}")
+        items = list(argument["$each"])
+        position = argument.get("$position")
+        sort = argument.get("$sort")
+        size = argument.get("$slice")
+    else:
+        items, position, sort, size = [argument], None, None, None
+
+    def update(value: Any) -> Any:
+        array = list(_get_array(value, "$push"))
+        if position is None:
+            array.extend(items)
+        else:
+            index = position if position >= 0 else len(array) + position
+            array[max(index, 0) : max(index, 0)] = items
+        if sort is not None:
+            try:
+                array.sort(key=cmp_to_key(_get_sort_key(sort)))
+            except TypeError as e:
+                raise ApplyChangesException(f"$push $sort: {e}") from e
+        if size is not None:
+            array = array[:size] if size >= 0 else array[size:]
+        return array
+
+    _update_value(data, path, update)
+
+
+def _add_to_set(data: dict[str, Any], path: str, argument: Any) -> None:
+    if _is_operator_expression(argument):
+        if set(argument) != {"$each"}:
+            raise ApplyChangesException(
+                f"Wrong $addToSet modifiers: {argument}"
+            )
+        items = list(argument["$each"])
+    else:
+        items = [argument]
+
+    def update(value: Any) -> Any:
+        array = list(_get_array(value, "$addToSet"))
+        for item in items:
+            if not any(values_equal(item, existing) for existing in array):
+                array.append(item)
+        return array
+
+    _update_value(data, path, update)
+
+
+def _pop(data: dict[str, Any], path: str, argument: Any) -> None:
+    if argument not in (1, -1):
+        raise ApplyChangesException(f"Wrong $pop value: {argument}")
+
+    def update(value: Any) -> Any:
+        array = _get_array(value, "$pop")
+        return array[1:] if argument == -1 else array[:-1]
+
+    _update_existing_value(data, path, update)
+
+
+def _pull(data: dict[str, Any], path: str, argument: Any) -> None:
+    matches = _compile_pull_condition(argument)
+    _update_existing_value(
+        data,
+        path,
+        lambda value: [
+            item for item in _get_array(value, "$pull") if not matches(item)
+        ],
+    )
+
+
+def _pull_all(data: dict[str, Any], path: str, argument: Any) -> None:
+    _update_existing_value(
+        data,
+        path,
+        lambda value: [
+            item
+            for item in _get_array(value, "$pullAll")
+            if not any(values_equal(item, pulled) for pulled in argument)
+        ],
+    )
+
+
+def _bit(data: dict[str, Any], path: str, argument: Any) -> None:
+    operations = {
+        "and": lambda left, right: left & right,
+        "or": lambda left, right: left | right,
+        "xor": lambda left, right: left ^ right,
+    }
+    if not isinstance(argument, Mapping) or not set(argument) <= set(
+        operations
+    ):
+        raise ApplyChangesException(f"Wrong $bit value: {argument}")
+
+    def update(value: Any) -> Any:
+        if value is _MISSING:
+            value = 0
+        for operation, operand in argument.items():
+            if not isinstance(value, int) or not isinstance(operand, int):
+                raise ApplyChangesException("$bit works with integers only")
+            value = operations[operation](value, operand)
+        return value
+
+    _update_value(data, path, update)
+
+
+def _rename(data: dict[str, Any], path: str, argument: Any) -> None:
+    parts = _split_path(path)
+    parent = _get_parent(data, parts, create=False)
+    if isinstance(parent, list):
+        raise ApplyChangesException("$rename can't be applied to arrays")
+    if parent is _MISSING:
+        return
+    value = _get_value(parent, parts[-1])
+    if value is _MISSING:
+        return
+    _unset(data, path, None)
+    _set(data, argument, value)
+
+
+def _set_on_insert(data: dict[str, Any], path: str, argument: Any) -> None:
+    # the existing documents are not changed
+    return None
+
+
+UPDATE_OPERATORS: dict[str, Callable[[dict[str, Any], str, Any], None]] = {
+    "$set": _set,
+    "$unset": _unset,
+    "$inc": _inc,
+    "$mul": _mul,
+    "$min": _compare("$min", lambda result: result < 0),
+    "$max": _compare("$max", lambda result: result > 0),
+    "$currentDate": _current_date,
+    "$push": _push,
+    "$addToSet": _add_to_set,
+    "$pop": _pop,
+    "$pull": _pull,
+    "$pullAll": _pull_all,
+    "$bit": _bit,
+    "$rename": _rename,
+    "$setOnInsert": _set_on_insert,
+}
+
+
+def get_update_paths(update: Any) -> set[str]:
+    """
+    Paths, which can be changed by the update query
+
+    :param update: Mapping[str, Any] - encoded update query
+    :return: Set[str]
+    """
+    if not isinstance(update, Mapping):
+        raise ApplyChangesException(
+            "Aggregation pipeline updates can't be applied locally"
+        )
+    paths: set[str] = set()
+    for operator, expression in update.items():
+        if not isinstance(expression, Mapping):
+            raise ApplyChangesException(
+                f"Wrong {operator} expression: {expression}"
+            )
+        paths.update(expression)
+        if operator == "$rename":
+            paths.update(expression.values())
+    return paths
+
+
+def apply_update_query(data: dict[str, Any], update: Any) -> None:
+    """
+    Apply the encoded update query to the encoded document in place,
+    following MongoDB semantics
+
+    :param data: Dict[str, Any] - encoded document
+    :param update: Mapping[str, Any] - encoded update query
+    :return: None
+    """
+    if not isinstance(update, Mapping):
+        raise ApplyChangesException(
+            "Aggregation pipeline updates can't be applied locally"
+        )
+    for operator, expression in update.items():
+        apply_operator = UPDATE_OPERATORS.get(operator)
+        if apply_operator is None:
+            raise ApplyChangesException(f"{operator} can't be applied locally")
+        for path, argument in expression.items():
+            apply_operator(data, path, argument)
+
+
+def get_document_update_values(
+    document: "Document", update: Any
+) -> dict[str, Any]:
+    """
+    New values of the document fields, changed by the update query.
+    Only the changed fields are encoded
+
+    :param document: Document - document to update
+    :param update: Mapping[str, Any] - encoded update query
+    :return: Dict[str, Any] - field names and new values
+    """
+    model = type(document)
+    if get_config_value(document, "frozen"):
+        raise ApplyChangesException(f"{model.__name__} is frozen")
+    plan = get_encoding_plan(model)
+    fields_by_key = {field.key: field for field in plan.fields}
+    model_fields = get_model_fields(model)
+    names = set()
+    for path in get_update_paths(update):
+        field = fields_by_key.get(path.split(".", 1)[0])
+        if field is None:
+            raise ApplyChangesException(f"{path} is not a field of {model}")
+        if field.link_type is not None:
+            raise ApplyChangesException(f"Link field {path} can't be updated")
+        if field.exclude and field.name != "revision_id":
+            raise ApplyChangesException(f"Excluded field {path}")
+        if model_fields[field.name].frozen:
+            raise ApplyChangesException(f"Frozen field {path}")
+        names.add(field.name)
+    data = dict(
+        get_dict(
+            document,
+            to_db=True,
+            keep_nulls=document.get_settings().keep_nulls,
+            fields=names,
+        )
+    )
+    apply_update_query(data, update)
+    values = {}
+    for name in names:
+        key = plan.get_key(name)
+        if key in data:
+            values[name] = data[key]
+        elif model_fields[name].is_required():
+            raise ApplyChangesException(f"Required field {key} was unset")
+        else:
+            values[name] = model_fields[name].get_default(
+                call_default_factory=True
+            )
+    return values
+
+
+def get_update_query(
+    expressions: tuple[Any, ...],
+    custom_encoders: Mapping[type, Callable[[Any], Any]] | None = None,
+) -> dict[str, Any]:
+    """
+    Merge and encode the update expressions like UpdateQuery does it
+
+    :param expressions: Tuple - Beanie update operators or dicts
+    :param custom_encoders: Optional[Mapping] - bson encoders of the model
+    :return: Dict[str, Any] - encoded update query
+    """
+    query: dict[str, Any] = {}
+    for expression in expressions:
+        if isinstance(expression, SetRevisionId):
+            query.setdefault("$set", {}).update(expression.query["$set"])
+        elif isinstance(expression, Mapping):
+            query.update(expression)
+        else:
+            raise ApplyChangesException(
+                "Aggregation pipeline updates can't be applied locally"
+            )
+    return Encoder(custom_encoders=custom_encoders or {}).encode(query)
+
+
+def apply_update(
+    target: "dict[str, Any] | Document", *expressions: Any
+) -> "dict[str, Any] | Document":
+    """
+    Apply the update expressions to the dict or the document in memory,
+    following MongoDB semantics. ApplyChangesException is raised,
+    if the update can't be applied, like it would fail on the server.
+
+    Example:
+
+    ```python
+
+    class Sample(Document):
+        num: int
+        tags: List[str]
+
+    apply_update(sample, Inc({Sample.num: 1}), Push({Sample.tags: "new"}))
+
+    ```
+
+    :param target: Union[Dict[str, Any], Document] - encoded dict
+    or document to update in place
+    :param expressions: Beanie update operators or dicts
+    :return: target
+    """
+    from beanie.odm.documents import Document
+
+    if not isinstance(target, Document):
+        apply_update_query(target, get_update_query(expressions))
+        return target
+
+    update = get_update_query(expressions, target.get_settings().bson_encoders)
+    values = get_document_update_values(target, update)
+    validator = type(target).__pydantic_validator__
+    for name, value in values.items():
+        validator.validate_assignment(target, name, value)
+        target._mark_changed(name, value)
+    return target
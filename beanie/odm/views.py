@@ -1,4 +1,5 @@
 import asyncio
+from concurrent.futures import Executor
 from typing import Any, ClassVar
 
 from pydantic import BaseModel
@@ -29,6 +30,7 @@ class View(
 
     # Database
     _database_major_version: ClassVar[int] = 4
+    _parse_executor: ClassVar[Executor | None] = None
 
     # Relations
     _link_fields: ClassVar[dict[str, LinkInfo] | None] = None
@@ -81,6 +81,7 @@ from tests.odm.models import (
     DocumentWithStringField,
     DocumentWithTextIndexAndLink,
     DocumentWithTimeStampToTestConsistency,
+    DocumentWithTrackedStateManagement,
     DocumentWithTurnedOffStateManagement,
     DocumentWithTurnedOnReplaceObjects,
     DocumentWithTurnedOnSavePrevious,
@@ -152,6 +153,7 @@ TESTING_MODELS = [
     DocumentWithTurnedOnStateManagement,
     DocumentWithTurnedOnReplaceObjects,
     DocumentWithTurnedOnSavePrevious,
+    DocumentWithTrackedStateManagement,
     DocumentWithTurnedOffStateManagement,
     DocumentWithValidationOnSave,
     DocumentWithRevisionTurnedOn,
@@ -385,7 +387,7 @@ async def clean_db():
             # Reset model cache
             cache = getattr(model, "_cache", None)
             if cache is not None:
-                cache.cache.clear()
+                cache.clear()
 
     await _cleanup()
     yield
@@ -1,7 +1,8 @@
 import pytest
 from pymongo.errors import BulkWriteError
+from pymongo.results import BulkWriteResult
 
-from beanie.odm.bulk import BulkWriter
+from beanie.odm.bulk import BulkWriter, merge_bulk_write_results
 from beanie.odm.operators.update.general import Set
 from tests.odm.models import (
     DocumentMultiModelOne,
@@ -238,3 +239,111 @@ async def test_ordered_bulk(documents):
 def test_bulk_writer():
     assert isinstance(DocumentMultiModelOne.bulk_writer(), BulkWriter)
     assert isinstance(DocumentUnion.bulk_writer(), BulkWriter)
+
+
+async def test_auto_flush(documents_not_inserted):
+    documents = documents_not_inserted(5)
+    bulk_writer = BulkWriter(
+        ordered=False, max_operations=2, max_concurrent_batches=2
+    )
+    for document in documents:
+        await DocumentTestModel.insert_one(document, bulk_writer=bulk_writer)
+        assert len(bulk_writer.operations) < 2
+
+    result = await bulk_writer.commit()
+    assert result.inserted_count == 5
+    assert await DocumentTestModel.count() == 5
+
+
+async def test_auto_flush_ordered_error():
+    doc = await DocumentMultiModelOne.insert_one(DocumentMultiModelOne())
+    with pytest.raises(BulkWriteError) as exc_info:  # noqa: PT012
+        async with BulkWriter(ordered=True, max_operations=2) as bulk_writer:
+            await DocumentMultiModelOne.insert_one(
+                DocumentMultiModelOne(), bulk_writer=bulk_writer
+            )
+            await DocumentMultiModelOne.insert_one(
+                DocumentMultiModelOne(), bulk_writer=bulk_writer
+            )
+            duplicate = DocumentMultiModelOne()
+            duplicate.id = doc.id
+            await DocumentMultiModelOne.insert_one(
+                duplicate, bulk_writer=bulk_writer
+            )
+            await DocumentMultiModelOne.insert_one(
+                DocumentMultiModelOne(), bulk_writer=bulk_writer
+            )
+
+    # the index of the failed operation is global, not per batch
+    assert exc_info.value.details["writeErrors"][0]["index"] == 2
+    assert await DocumentMultiModelOne.count() == 3
+
+
+def test_max_concurrent_batches():
+    with pytest.raises(ValueError):
+        BulkWriter(max_concurrent_batches=0)
+
+
+def test_merge_bulk_write_results():
+    first = BulkWriteResult(
+        {"nInserted": 1, "upserted": [{"index": 1, "_id": 1}]}, True
+    )
+    second = BulkWriteError(
+        {
+            "nInserted": 1,
+            "writeErrors": [{"index": 0, "code": 11000, "errmsg": "dup"}],
+        }
+    )
+    merged, has_errors = merge_bulk_write_results(
+        [(range(2, 4), second), (range(0, 2), first)]
+    )
+    assert has_errors
+    assert merged["nInserted"] == 2
+    assert merged["upserted"] == [{"index": 1, "_id": 1}]
+    assert merged["writeErrors"][0]["index"] == 2
+
+    assert merge_bulk_write_results(
+        [(range(0, 2), first), (range(2, 4), BulkWriteResult({}, False))]
+    ) == (None, False)
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+async def test_different_collections(documents_not_inserted, ordered):
+    documents = documents_not_inserted(2)
+    async with BulkWriter(ordered=ordered) as bulk_writer:
+        await DocumentTestModel.insert_one(
+            documents[0], bulk_writer=bulk_writer
+        )
+        await DocumentMultiModelOne.insert_one(
+            DocumentMultiModelOne(), bulk_writer=bulk_writer
+        )
+        await DocumentTestModel.insert_one(
+            documents[1], bulk_writer=bulk_writer
+        )
+        await DocumentMultiModelOne.find_all().update(
+            Set({DocumentMultiModelOne.shared: 100}), bulk_writer=bulk_writer
+        )
+
+    assert await DocumentTestModel.count() == 2
+    doc = await DocumentMultiModelOne.find_one()
+    assert doc.shared == 100
+
+
+async def test_different_collections_error(document_not_inserted):
+    doc = await DocumentMultiModelOne.insert_one(DocumentMultiModelOne())
+    duplicate = DocumentMultiModelOne()
+    duplicate.id = doc.id
+    with pytest.raises(BulkWriteError) as exc_info:  # noqa: PT012
+        async with BulkWriter(ordered=False) as bulk_writer:
+            await DocumentTestModel.insert_one(
+                document_not_inserted, bulk_writer=bulk_writer
+            )
+            await DocumentMultiModelOne.insert_one(
+                duplicate, bulk_writer=bulk_writer
+            )
+            await DocumentMultiModelOne.insert_one(
+                DocumentMultiModelOne(), bulk_writer=bulk_writer
+            )
+
+    assert exc_info.value.details["nInserted"] == 2
+    assert exc_info.value.details["writeErrors"][0]["index"] == 1
@@ -1,9 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from pymongo.errors import DuplicateKeyError
 
 from beanie.odm.fields import PydanticObjectId
 from tests.odm.models import (
     DocumentTestModel,
+    DocumentWithActions,
     DocumentWithFrozenField,
     DocumentWithKeepNullsFalse,
     DocumentWithRevisionAndKeepNullsFalse,
@@ -26,6 +29,44 @@ async def test_insert_many(documents_not_inserted):
     assert len(documents) == 10
 
 
+async def test_insert_many_sets_ids(documents_not_inserted):
+    documents = documents_not_inserted(3)
+    result = await DocumentTestModel.insert_many(documents)
+    assert [document.id for document in documents] == result.inserted_ids
+    assert all(
+        isinstance(document.id, PydanticObjectId) for document in documents
+    )
+
+
+async def test_insert_many_chunks(documents_not_inserted):
+    documents = documents_not_inserted(10)
+    with ThreadPoolExecutor(2) as executor:
+        result = await DocumentTestModel.insert_many(
+            (document for document in documents),
+            chunk_size=3,
+            executor=executor,
+            save_state=True,
+        )
+    assert len(result.inserted_ids) == 10
+    assert await DocumentTestModel.count() == 10
+    assert not any(document.is_changed for document in documents)
+
+
+async def test_insert_many_run_actions():
+    documents = [
+        DocumentWithActions(name="first"),
+        DocumentWithActions(name="second"),
+    ]
+    await DocumentWithActions.insert_many(documents, run_actions=True)
+    assert [document.name for document in documents] == ["First", "Second"]
+    assert all(document.num_1 == 1 for document in documents)
+    assert all(document.num_2 == 9 for document in documents)
+
+    document = await DocumentWithActions.get(documents[0].id)
+    assert document.name == "First"
+    assert document.num_1 == 1
+
+
 async def test_create(document_not_inserted):
     await document_not_inserted.insert()
     assert isinstance(document_not_inserted.id, PydanticObjectId)
@@ -105,6 +105,33 @@ async def test_save():
     await doc.save()
 
 
+async def test_save_changes_all():
+    docs = [DocumentWithRevisionTurnedOn(num_1=i, num_2=i) for i in range(3)]
+    await DocumentWithRevisionTurnedOn.save_all(docs)
+
+    revision_ids = [doc.revision_id for doc in docs]
+    for doc in docs:
+        doc.num_1 += 10
+    await DocumentWithRevisionTurnedOn.save_changes_all(docs)
+    for doc, revision_id in zip(docs, revision_ids, strict=True):
+        assert doc.revision_id != revision_id
+        found_doc = await DocumentWithRevisionTurnedOn.get(doc.id)
+        assert found_doc.revision_id == doc.revision_id
+        assert found_doc.num_1 == doc.num_1
+
+    docs[1].revision_id = "wrong"
+    for doc in docs:
+        doc.num_2 += 1
+    with pytest.raises(RevisionIdWasChanged):
+        await DocumentWithRevisionTurnedOn.save_changes_all(docs)
+
+    with pytest.raises(RevisionIdWasChanged):
+        await DocumentWithRevisionTurnedOn.save_all(docs[1:2])
+
+    await DocumentWithRevisionTurnedOn.replace_all(docs, ignore_revision=True)
+    await DocumentWithRevisionTurnedOn.replace_all(docs)
+
+
 async def test_update_bulk_writer():
     doc = DocumentWithRevisionTurnedOn(num_1=1, num_2=2)
     await doc.save()
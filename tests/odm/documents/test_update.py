@@ -1,5 +1,7 @@
 import pytest
+from pydantic import ValidationError
 
+from beanie import UpsertStatus
 from beanie.exceptions import (
     DocumentNotFound,
     ReplaceError,
@@ -12,6 +14,7 @@ from tests.odm.models import (
     DocumentWithList,
     ModelWithOptionalField,
     Sample,
+    SubDocument,
 )
 
 # REPLACE
@@ -57,6 +60,27 @@ async def test_replace_many_not_all_the_docs_found(documents):
         await DocumentTestModel.replace_many(to_replace)
 
 
+async def test_replace_all(documents):
+    await documents(5, "foo")
+    created_documents = await DocumentTestModel.find_many(
+        {"test_str": "foo"}
+    ).to_list()
+    for document in created_documents[:3]:
+        document.test_str = "REPLACED_VALUE"
+    await DocumentTestModel.replace_all(created_documents[:3])
+
+    assert (
+        await DocumentTestModel.find_many(
+            {"test_str": "REPLACED_VALUE"}
+        ).count()
+        == 3
+    )
+
+    created_documents[3].id = PydanticObjectId()
+    with pytest.raises(DocumentNotFound):
+        await DocumentTestModel.replace_all(created_documents[3:])
+
+
 async def test_replace(document):
     update_data = {"test_str": "REPLACED_VALUE"}
     new_doc = document.model_copy(update=update_data)
@@ -123,6 +147,45 @@ async def test_update_one_set_extra_field():
     assert doc.my_extra_field == 12345
 
 
+async def test_update_local(document):
+    await document.update(
+        {"$inc": {"test_int": 1}, "$set": {"test_doc.test_str": "bar"}},
+        local_update=True,
+    )
+    assert document.test_int == 43
+    assert document.test_doc.test_str == "bar"
+    new_document = await DocumentTestModel.get(document.id)
+    assert new_document.test_int == 43
+    assert new_document.test_doc.test_str == "bar"
+
+
+async def test_update_local_fallback(document):
+    await document.update(
+        {"$set": {"test_list.$[].test_str": "bar"}}, local_update=True
+    )
+    assert all(item.test_str == "bar" for item in document.test_list)
+
+
+async def test_update_local_invalid_value(document):
+    # invalid values are not applied locally, the updated document
+    # is fetched and fails the validation after the write
+    assert (
+        document._get_local_update_values({"$set": {"test_int": "abc"}})
+        is None
+    )
+    with pytest.raises(ValidationError):
+        await document.update({"$set": {"test_int": "abc"}}, local_update=True)
+    assert document.test_int == 42
+
+
+async def test_update_local_not_found(document_not_inserted):
+    document_not_inserted.id = PydanticObjectId()
+    with pytest.raises(DocumentNotFound):
+        await document_not_inserted.update(
+            {"$inc": {"test_int": 1}}, local_update=True
+        )
+
+
 async def test_update_many(documents):
     await documents(10, "foo")
     await documents(7, "bar")
@@ -204,6 +267,137 @@ async def test_save_changes_keep_nulls_false():
     assert raw_data == {"_id": doc.id, "m": {"i": 10}}
 
 
+async def test_save_all(documents, document_not_inserted):
+    await documents(3, "foo")
+    saved_documents = await DocumentTestModel.find_many(
+        {"test_str": "foo"}
+    ).to_list()
+    for document in saved_documents:
+        document.test_str = "SAVED_VALUE"
+    saved_documents.append(document_not_inserted)
+    document_not_inserted.test_str = "SAVED_VALUE"
+
+    await DocumentTestModel.save_all(saved_documents)
+
+    assert isinstance(document_not_inserted.id, PydanticObjectId)
+    assert (
+        await DocumentTestModel.get(document_not_inserted.id)
+    ).test_str == "SAVED_VALUE"
+    assert (
+        await DocumentTestModel.find_many({"test_str": "SAVED_VALUE"}).count()
+        == 4
+    )
+
+
+async def test_save_changes_all():
+    docs = [
+        DocumentWithKeepNullsFalse(
+            m=ModelWithOptionalField(i=i, s="TEST_MODEL"), o="TEST_DOCUMENT"
+        )
+        for i in range(3)
+    ]
+    for doc in docs:
+        await doc.insert()
+
+    docs[0].o = None
+    docs[1].m.s = "CHANGED"
+    changed = await DocumentWithKeepNullsFalse.save_changes_all(docs)
+    assert changed == docs[:2]
+    assert not any(doc.is_changed for doc in docs)
+
+    raw_data = (
+        await DocumentWithKeepNullsFalse.get_pymongo_collection().find_one(
+            {"_id": docs[0].id}
+        )
+    )
+    assert raw_data == {"_id": docs[0].id, "m": {"i": 0, "s": "TEST_MODEL"}}
+    from_db = await DocumentWithKeepNullsFalse.get(docs[1].id)
+    assert from_db.m.s == "CHANGED"
+
+
+async def test_upsert_many(documents):
+    await documents(3, "foo")
+    upserted = [
+        DocumentTestModel(
+            test_int=i,
+            test_str=f"UPSERTED_{i}",
+            test_doc=SubDocument(test_str="NEW"),
+            test_list=[],
+        )
+        for i in range(1, 5)
+    ]
+    statuses = await DocumentTestModel.upsert_many(
+        upserted,
+        on=[DocumentTestModel.test_int],
+        insert_only_fields=[DocumentTestModel.test_doc],
+        chunk_size=2,
+    )
+    assert statuses == [
+        UpsertStatus.UPDATED,
+        UpsertStatus.UPDATED,
+        UpsertStatus.INSERTED,
+        UpsertStatus.INSERTED,
+    ]
+    assert upserted[0].id is None
+    assert upserted[3].id is not None
+
+    assert await DocumentTestModel.count() == 5
+    updated = await DocumentTestModel.find_one(DocumentTestModel.test_int == 1)
+    assert updated.test_str == "UPSERTED_1"
+    assert updated.test_doc.test_str != "NEW"
+    inserted = await DocumentTestModel.get(upserted[3].id)
+    assert inserted.test_str == "UPSERTED_4"
+    assert inserted.test_doc.test_str == "NEW"
+
+
+async def test_upsert_many_by_nested_field(documents):
+    await documents(1, "foo")
+    upserted = DocumentTestModel(
+        test_int=1,
+        test_str="UPSERTED",
+        test_doc=SubDocument(test_str="foobar", test_int=100),
+        test_list=[],
+    )
+    statuses = await DocumentTestModel.upsert_many(
+        [upserted], on=[DocumentTestModel.test_doc.test_str]
+    )
+    assert statuses == [UpsertStatus.UPDATED]
+    updated = await DocumentTestModel.find_one(
+        DocumentTestModel.test_str == "UPSERTED"
+    )
+    # the other fields of the subdocument are updated too
+    assert updated.test_doc == SubDocument(test_str="foobar", test_int=100)
+    assert await DocumentTestModel.count() == 1
+
+    # null would match the documents without the field
+    with pytest.raises(ValueError):
+        await DocumentTestModel.upsert_many(
+            [upserted], on=["test_doc.missing"]
+        )
+
+
+async def test_upsert_many_by_id(document):
+    document.test_str = "UPSERTED"
+    new_document = DocumentTestModel(
+        id=PydanticObjectId(),
+        test_int=100,
+        test_str="UPSERTED",
+        test_doc=SubDocument(test_str="NEW"),
+        test_list=[],
+    )
+    statuses = await DocumentTestModel.upsert_many([document, new_document])
+    assert statuses == [UpsertStatus.UPDATED, UpsertStatus.INSERTED]
+    assert (
+        await DocumentTestModel.find_many({"test_str": "UPSERTED"}).count()
+        == 2
+    )
+
+    with pytest.raises(ValueError):
+        await DocumentTestModel.upsert_many(
+            [new_document.model_copy(update={"id": None})]
+        )
+
+
 # WITH SESSION
 
 
@@ -45,6 +45,7 @@ from beanie import (
     Insert,
     Replace,
     Save,
+    StateManagementMode,
     Update,
     ValidateOnSave,
 )
@@ -485,6 +486,18 @@ class DocumentWithTurnedOnSavePrevious(Document):
         state_management_save_previous = True
 
 
+class DocumentWithTrackedStateManagement(Document):
+    num_1: int
+    num_2: int
+    internal: InternalDoc
+    tags: list[str] = []
+    meta: dict[str, list[int]] = {}
+
+    class Settings:
+        use_state_management = True
+        state_management_mode = StateManagementMode.TRACKED
+
+
 class DocumentWithTurnedOffStateManagement(Document):
     num_1: int
     num_2: int
@@ -870,6 +883,19 @@ class UsersAddresses(Document):
     street: str | None = None
 
 
+class DoorView(BaseModel):
+    t: int
+
+
+class HouseDoorView(BaseModel):
+    name: str
+    door: DoorView
+
+
+class HouseNameView(BaseModel):
+    name: str
+
+
 class AddressView(BaseModel):
     id: PydanticObjectId | None = Field(alias="_id", default=None)
     phone_number: str | None = None
@@ -180,10 +180,7 @@ def test_with_text_queries(text_query_count: int, non_text_query_count: int):
             else {"$match": {"$and": [text_query, text_query]}}
         )
 
-    expected_aggregation_pipeline.extend(
-        construct_lookup_queries(query.document_model)
-    )
-
+    # the non-text queries don't read the link and run before the lookups
     if non_text_query_count:
         expected_aggregation_pipeline.append(
             {"$match": non_text_query}
@@ -191,6 +188,10 @@ def test_with_text_queries(text_query_count: int, non_text_query_count: int):
             else {"$match": {"$and": [non_text_query, non_text_query]}}
         )
 
+    expected_aggregation_pipeline.extend(
+        construct_lookup_queries(query.document_model)
+    )
+
     expected_aggregation_pipeline.extend(aggregation_pipeline)
 
     assert (
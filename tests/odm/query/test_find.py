@@ -1,9 +1,12 @@
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 import pytest
+from bson.raw_bson import RawBSONDocument
 from pydantic import BaseModel
 
+from beanie import Param
 from beanie.odm.enums import SortDirection
 from beanie.odm.operators.find.comparison import In
 from tests.odm.models import (
@@ -59,6 +62,25 @@ async def test_find_many(preset_documents):
     assert len_result == len(result)
 
 
+@pytest.mark.parametrize(
+    "expressions",
+    [
+        [{"integer": {"$gt": 1}}, {"nested.optional": None}],
+        [{"increment": {"$in": [1, 5, 7]}}],
+        [{"$or": [{"nested.integer": 2}, {"string": "test_3"}]}],
+        [{"string": {"$regex": "^TEST_[12]", "$options": "i"}}],
+        [{"optional": {"$exists": False}}],
+        [{"nested.union.s": "TEST"}],
+    ],
+)
+async def test_get_matcher(preset_documents, expressions):
+    query = Sample.find_many(*expressions)
+    expected = {doc.id for doc in await query.to_list()}
+    matcher = query.get_matcher()
+    documents = await Sample.find_all().to_list()
+    assert {doc.id for doc in documents if matcher(doc)} == expected
+
+
 async def test_find_many_skip(preset_documents):
     q = Sample.find_many(Sample.integer > 1, skip=2)
     assert q.skip_number == 2
@@ -133,6 +155,74 @@ async def test_find_all(preset_documents):
     assert len_result == len(result)
 
 
+async def test_find_many_iter_batches(preset_documents):
+    expected = await Sample.find_many(Sample.integer > 1).to_list()
+
+    batches = [
+        batch
+        async for batch in Sample.find_many(Sample.integer > 1).iter_batches(
+            batch_size=3
+        )
+    ]
+    assert [len(batch) for batch in batches[:-1]] == [3] * (len(batches) - 1)
+    assert [doc for batch in batches for doc in batch] == expected
+
+    batches = [
+        batch
+        async for batch in Sample.find_many(Sample.integer > 1).iter_batches(
+            batch_size=3, prefetch=False
+        )
+    ]
+    assert [doc for batch in batches for doc in batch] == expected
+
+    with pytest.raises(ValueError):
+        async for _ in Sample.find_all().iter_batches(batch_size=0):
+            pass
+
+
+async def test_find_many_stream(preset_documents):
+    expected = await Sample.find_all().sort(Sample.increment).to_list()
+
+    result = [
+        doc
+        async for doc in Sample.find_all()
+        .sort(Sample.increment)
+        .stream(batch_size=2, queue_size=1)
+    ]
+    assert result == expected
+
+    async for doc in (
+        Sample.find_all().sort(Sample.increment).stream(batch_size=2)
+    ):
+        assert doc == expected[0]
+        break
+
+
+async def test_find_many_parse_executor(preset_documents, monkeypatch):
+    monkeypatch.setattr("beanie.odm.queries.cursor.PARSE_CHUNK_SIZE", 2)
+    expected = await Sample.find_all().sort(Sample.increment).to_list()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        query = (
+            Sample.find_all()
+            .sort(Sample.increment)
+            .set_parse_executor(executor)
+        )
+        assert await query.to_list() == expected
+        assert query.clone().parse_executor is executor
+
+        result = await (
+            Sample.find_all()
+            .set_parse_executor(executor)
+            .aggregate(
+                [{"$sort": {"increment": 1}}],
+                projection_model=Sample,
+            )
+            .to_list()
+        )
+        assert result == expected
+
+
 async def test_find_one(preset_documents):
     a = await Sample.find_one(Sample.integer > 1).find_one(
         Sample.nested.optional == None
@@ -146,6 +236,34 @@ async def test_find_one(preset_documents):
     assert a is None
 
 
+async def test_find_raw_bson(preset_documents):
+    query = Sample.find_many(Sample.integer > 1, raw_bson=True)
+    assert query.raw_bson is True
+    assert query.get_find_collection().codec_options.document_class is (
+        RawBSONDocument
+    )
+
+    result = await query.sort(Sample.increment).to_list()
+    expected = (
+        await Sample.find_many(Sample.integer > 1)
+        .sort(Sample.increment)
+        .to_list()
+    )
+    assert result == expected
+
+    a = await Sample.find_one(Sample.integer > 1, raw_bson=True)
+    assert a in expected
+
+    lazy = (
+        await Sample.find_many(
+            Sample.integer > 1, raw_bson=True, lazy_parse=True
+        )
+        .sort(Sample.increment)
+        .to_list()
+    )
+    assert [doc.integer for doc in lazy] == [doc.integer for doc in result]
+
+
 async def test_get(preset_documents):
     a = await Sample.find_one(Sample.integer > 1).find_one(
         Sample.nested.optional == None
@@ -555,3 +673,88 @@ async def test_distinct_array_field():
     # distinct on an array field should return individual elements, not arrays
     values = await DocumentWithList.find().distinct("list_values")
     assert sorted(values) == ["a", "b", "c", "d"]
+
+
+async def test_prepared_query(preset_documents):
+    query = Sample.prepare(
+        Sample.integer == Param("integer"),
+        Sample.nested.integer >= Param("nested"),
+        sort=[("increment", SortDirection.DESCENDING)],
+    )
+    assert query.params == {"integer", "nested"}
+
+    bound = query.bind(integer=1, nested=2)
+    assert bound.get_filter_query() == {
+        "$and": [{"integer": 1}, {"nested.integer": {"$gte": 2}}]
+    }
+    result = await bound.to_list()
+    expected = await Sample.find(
+        Sample.integer == 1,
+        Sample.nested.integer >= 2,
+        sort=[("increment", SortDirection.DESCENDING)],
+    ).to_list()
+    assert result == expected
+    assert len(result) == 2
+
+    result = await query.bind(integer=2, nested=0).limit(1).to_list()
+    assert [sample.increment for sample in result] == [8]
+    assert await query.bind(integer=2, nested=0).count() == 3
+
+
+async def test_prepared_query_chaining(preset_documents):
+    query = Sample.prepare(Sample.integer == Param("integer"))
+    result = (
+        await query.bind(integer=1).find(Sample.nested.integer == 2).to_list()
+    )
+    assert len(result) == 2
+    assert all(sample.integer == 1 for sample in result)
+    # the bound query doesn't change the prepared one
+    assert len(await query.bind(integer=1).to_list()) == 3
+
+
+def test_prepared_query_parameters():
+    query = Sample.prepare(
+        In(Sample.integer, Param("integers")),
+        Sample.timestamp < Param("timestamp"),
+    )
+    timestamp = datetime.date(2020, 1, 1)
+    assert query.bind(
+        integers=(1, 2), timestamp=timestamp
+    ).get_filter_query() == {
+        "$and": [
+            {"integer": {"$in": [1, 2]}},
+            {"timestamp": {"$lt": datetime.datetime(2020, 1, 1)}},
+        ]
+    }
+    with pytest.raises(ValueError):
+        query.bind(integers=[1])
+    with pytest.raises(ValueError):
+        query.bind(integers=[1], timestamp=timestamp, other=1)
+
+
+async def test_prepared_query_with_fetch_links():
+    for i in range(3):
+        lock = await Lock(k=i).insert()
+        window = await Window(x=i, y=i, lock=lock).insert()
+        door = await Door(t=i, window=window, locks=[lock]).insert()
+        await House(
+            windows=[window], door=door, height=i, name=f"house_{i}"
+        ).insert()
+
+    query = House.prepare(
+        House.height <= Param("height"),
+        House.door.t >= Param("t"),
+        fetch_links=True,
+        sort="height",
+    )
+    bound = query.bind(height=2, t=1)
+    pipeline = bound.build_aggregation_pipeline()
+    expected_query = House.find(
+        House.height <= 2, House.door.t >= 1, fetch_links=True, sort="height"
+    )
+    assert pipeline == expected_query.build_aggregation_pipeline()
+
+    result = await bound.to_list()
+    assert [house.name for house in result] == ["house_1", "house_2"]
+    assert all(isinstance(house.door, Door) for house in result)
+    assert result == await expected_query.to_list()
@@ -0,0 +1,56 @@
+"""Tests for beanie.odm.utils.bson_order module."""
+
+from datetime import datetime, timezone
+
+import pytest
+from bson import Decimal128, MaxKey, MinKey, ObjectId
+
+from beanie.odm.utils.bson_order import compare_values, values_equal
+
+
+@pytest.mark.parametrize(
+    "left,right",
+    [
+        (MinKey(), None),
+        (None, 1),
+        (1, "a"),
+        ("a", {"a": 1}),
+        ({"a": 1}, [1]),
+        ([1], b"a"),
+        (b"a", ObjectId()),
+        (ObjectId(), False),
+        (True, datetime(2020, 1, 1)),
+        (datetime(2020, 1, 1), MaxKey()),
+    ],
+)
+def test_type_order(left, right):
+    assert compare_values(left, right) < 0
+    assert compare_values(right, left) > 0
+
+
+@pytest.mark.parametrize(
+    "left,right",
+    [
+        (1, 2.5),
+        (Decimal128("1.1"), 2),
+        (float("nan"), -1),
+        ("a", "b"),
+        ([1, 2], [1, 3]),
+        ([1], [1, 0]),
+        ({"a": 1}, {"b": 0}),
+        ({"a": 1}, {"a": "x"}),
+        (
+            datetime(2020, 1, 1, 1, tzinfo=timezone.utc),
+            datetime(2020, 1, 1, 2),
+        ),
+    ],
+)
+def test_same_type_order(left, right):
+    assert compare_values(left, right) < 0
+
+
+def test_values_equal():
+    assert values_equal(1, 1.0)
+    assert values_equal(Decimal128("2"), 2)
+    assert not values_equal(1, True)
+    assert not values_equal({"a": 1, "b": 2}, {"b": 2, "a": 1})
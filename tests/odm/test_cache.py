@@ -1,18 +1,45 @@
 import datetime as dt
+import time
+import uuid
 
+import pytest
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions
+
+from beanie import BulkWriter, LRUCache, RedisCache, SharedMemoryCache
+from beanie.odm.cache.key import create_key
 from tests.odm.models import DocumentTestModel
 
 
-async def test_find_one(documents, time_machine):
-    time_machine.move_to(dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc))
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def shift(self, delta: dt.timedelta):
+        self.now += delta.total_seconds()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # LRU cache expiration uses the monotonic clock
+    clock = Clock()
+    monkeypatch.setattr("beanie.odm.cache.lru.monotonic", lambda: clock.now)
+    return clock
+
+
+async def update_bypassing_cache(find_query, test_str="NEW_VALUE"):
+    # raw pymongo writes do not invalidate the cache
+    await DocumentTestModel.get_pymongo_collection().update_many(
+        find_query, {"$set": {"test_str": test_str}}
+    )
 
+
+async def test_find_one(documents, clock):
     await documents(5)
 
     doc = await DocumentTestModel.find_one(DocumentTestModel.test_int == 1)
 
-    await DocumentTestModel.find_one(DocumentTestModel.test_int == 1).set(
-        {DocumentTestModel.test_str: "NEW_VALUE"}
-    )
+    await update_bypassing_cache({"test_int": 1})
 
     cached_doc = await DocumentTestModel.find_one(
         DocumentTestModel.test_int == 1
@@ -20,7 +47,7 @@ async def test_find_one(documents, time_machine):
     assert doc == cached_doc
 
     # Advance time to ensure cache expiration
-    time_machine.shift(dt.timedelta(seconds=11))
+    clock.shift(dt.timedelta(seconds=11))
 
     refreshed_doc = await DocumentTestModel.find_one(
         DocumentTestModel.test_int == 1
@@ -28,17 +55,26 @@ async def test_find_one(documents, time_machine):
     assert doc != refreshed_doc
 
 
-async def test_find_many(documents, time_machine):
-    time_machine.move_to(dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc))
+async def test_embedded_document_field_order(documents):
+    await documents(1)
+    found = await DocumentTestModel.find(
+        {"test_doc": {"test_str": "foobar", "test_int": 42}}
+    ).to_list()
+    assert len(found) == 1
+    # MongoDB compares the embedded documents with their field order
+    found = await DocumentTestModel.find(
+        {"test_doc": {"test_int": 42, "test_str": "foobar"}}
+    ).to_list()
+    assert found == []
+
 
+async def test_find_many(documents, clock):
     await documents(5)
     docs = await DocumentTestModel.find(
         DocumentTestModel.test_int > 1
     ).to_list()
 
-    await DocumentTestModel.find(DocumentTestModel.test_int > 1).set(
-        {DocumentTestModel.test_str: "NEW_VALUE"}
-    )
+    await update_bypassing_cache({"test_int": {"$gt": 1}})
 
     new_docs = await DocumentTestModel.find(
         DocumentTestModel.test_int > 1
@@ -51,7 +87,7 @@ async def test_find_many(documents, time_machine):
     assert docs != new_docs
 
     # Advance time to ensure cache expiration
-    time_machine.shift(dt.timedelta(seconds=11))
+    clock.shift(dt.timedelta(seconds=11))
 
     new_docs = await DocumentTestModel.find(
         DocumentTestModel.test_int > 1
@@ -59,17 +95,13 @@ async def test_find_many(documents, time_machine):
     assert docs != new_docs
 
 
-async def test_aggregation(documents, time_machine):
-    time_machine.move_to(dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc))
-
+async def test_aggregation(documents, clock):
     await documents(5)
     docs = await DocumentTestModel.aggregate(
         [{"$group": {"_id": "$test_str", "total": {"$sum": "$test_int"}}}]
     ).to_list()
 
-    await DocumentTestModel.find(DocumentTestModel.test_int > 1).set(
-        {DocumentTestModel.test_str: "NEW_VALUE"}
-    )
+    await update_bypassing_cache({"test_int": {"$gt": 1}})
 
     new_docs = await DocumentTestModel.aggregate(
         [{"$group": {"_id": "$test_str", "total": {"$sum": "$test_int"}}}]
@@ -83,7 +115,7 @@ async def test_aggregation(documents, time_machine):
     assert docs != new_docs
 
     # Advance time to ensure cache expiration
-    time_machine.shift(dt.timedelta(seconds=11))
+    clock.shift(dt.timedelta(seconds=11))
 
     new_docs = await DocumentTestModel.aggregate(
         [{"$group": {"_id": "$test_str", "total": {"$sum": "$test_int"}}}]
@@ -99,15 +131,279 @@ async def test_capacity(documents):
             await DocumentTestModel.find_one(DocumentTestModel.test_int == i)
         )
 
+    await update_bypassing_cache({"test_int": {"$in": [1, 9]}})
+
+    new_doc = await DocumentTestModel.find_one(DocumentTestModel.test_int == 1)
+    assert docs[1] != new_doc
+
+    new_doc = await DocumentTestModel.find_one(DocumentTestModel.test_int == 9)
+    assert docs[9] == new_doc
+
+
+async def test_invalidation_on_update(documents):
+    await documents(5)
+    doc = await DocumentTestModel.find_one(DocumentTestModel.test_int == 1)
+    docs = await DocumentTestModel.find(
+        DocumentTestModel.test_int > 1
+    ).to_list()
+
     await DocumentTestModel.find_one(DocumentTestModel.test_int == 1).set(
         {DocumentTestModel.test_str: "NEW_VALUE"}
     )
-    await DocumentTestModel.find_one(DocumentTestModel.test_int == 9).set(
+    new_doc = await DocumentTestModel.find_one(DocumentTestModel.test_int == 1)
+    assert new_doc.test_str == "NEW_VALUE"
+    assert doc != new_doc
+
+    await DocumentTestModel.find(DocumentTestModel.test_int > 1).set(
         {DocumentTestModel.test_str: "NEW_VALUE"}
     )
+    new_docs = await DocumentTestModel.find(
+        DocumentTestModel.test_int > 1
+    ).to_list()
+    assert docs != new_docs
 
-    new_doc = await DocumentTestModel.find_one(DocumentTestModel.test_int == 1)
-    assert docs[1] != new_doc
 
-    new_doc = await DocumentTestModel.find_one(DocumentTestModel.test_int == 9)
-    assert docs[9] == new_doc
+async def test_invalidation_on_document_writes(
+    documents, document_not_inserted
+):
+    await documents(5)
+    docs = await DocumentTestModel.find_all().to_list()
+
+    await document_not_inserted.insert()
+    assert len(await DocumentTestModel.find_all().to_list()) == 6
+
+    docs[0].test_str = "NEW_VALUE"
+    await docs[0].replace()
+    new_doc = await DocumentTestModel.find_one(
+        DocumentTestModel.id == docs[0].id
+    )
+    assert new_doc.test_str == "NEW_VALUE"
+
+    await new_doc.delete()
+    assert (
+        await DocumentTestModel.find_one(DocumentTestModel.id == docs[0].id)
+        is None
+    )
+    assert len(await DocumentTestModel.find_all().to_list()) == 5
+
+
+async def test_invalidation_on_bulk_writer_commit(documents):
+    await documents(5)
+    docs = await DocumentTestModel.find_all().to_list()
+
+    async with BulkWriter() as bulk_writer:
+        await docs[0].delete(bulk_writer=bulk_writer)
+        assert len(await DocumentTestModel.find_all().to_list()) == 5
+
+    assert len(await DocumentTestModel.find_all().to_list()) == 4
+
+
+def test_create_key():
+    assert create_key(
+        {"filter": {"a": 1, "b": {"$gt": 1, "$lt": 5}}, "limit": 1}
+    ) == create_key(
+        {"limit": 1, "filter": {"b": {"$lt": 5, "$gt": 1}, "a": 1}}
+    )
+    assert create_key({"a": [1, 2]}) != create_key({"a": [2, 1]})
+    assert create_key(
+        {"pipeline": [{"$sort": {"a": 1, "b": -1}}]}
+    ) != create_key({"pipeline": [{"$sort": {"b": -1, "a": 1}}]})
+
+    # the field order of the embedded documents matters
+    assert create_key({"filter": {"addr": {"a": 1, "b": 2}}}) != create_key(
+        {"filter": {"addr": {"b": 2, "a": 1}}}
+    )
+    assert create_key(
+        {"filter": {"addr": {"$in": [{"a": 1, "b": 2}]}}}
+    ) != create_key({"filter": {"addr": {"$in": [{"b": 2, "a": 1}]}}})
+    assert create_key(
+        {"filter": {"$or": [{"a": 1, "b": {"$eq": {"x": 1, "y": 2}}}]}}
+    ) != create_key(
+        {"filter": {"$or": [{"b": {"$eq": {"y": 2, "x": 1}}, "a": 1}]}}
+    )
+    assert create_key(
+        {"filter": {"$or": [{"a": 1, "b": {"$eq": {"x": 1, "y": 2}}}]}}
+    ) == create_key(
+        {"filter": {"$or": [{"b": {"$eq": {"x": 1, "y": 2}}, "a": 1}]}}
+    )
+
+
+def test_cache_key():
+    query = DocumentTestModel.find(DocumentTestModel.test_int > 1)
+    key = query._cache_key
+    assert key == query._cache_key
+    assert (
+        key
+        == DocumentTestModel.find(DocumentTestModel.test_int > 1)._cache_key
+    )
+
+    query.limit(5)
+    assert query._cache_key != key
+
+    assert (
+        DocumentTestModel.find_one(
+            DocumentTestModel.test_int == 1, session=object()
+        )._cache_key
+        == DocumentTestModel.find_one(
+            DocumentTestModel.test_int == 1
+        )._cache_key
+    )
+
+
+class FakeRedis:
+    """
+    In-memory stand-in for the redis.asyncio.Redis string commands
+    """
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, name):
+        value, expires_at = self.values.get(name, (None, None))
+        if expires_at is not None and time.time() >= expires_at:
+            return None
+        return value
+
+    async def set(self, name, value, ex=None):
+        self.values[name] = (
+            value,
+            None if ex is None else time.time() + ex,
+        )
+
+    async def incr(self, name):
+        value = int(await self.get(name) or 0) + 1
+        self.values[name] = (str(value).encode(), None)
+        return value
+
+
+@pytest.fixture(params=["lru", "shared_memory", "redis"])
+def cache_backend(request):
+    expiration_time = dt.timedelta(seconds=10)
+    if request.param == "lru":
+        yield LRUCache(capacity=5, expiration_time=expiration_time)
+    elif request.param == "shared_memory":
+        cache = SharedMemoryCache(
+            f"beanie-test-{uuid.uuid4().hex[:8]}",
+            slots=64,
+            slot_size=1024,
+            expiration_time=expiration_time,
+        )
+        yield cache
+        cache.close()
+        cache.unlink()
+    else:
+        yield RedisCache(FakeRedis(), expiration_time=expiration_time)
+
+
+async def test_cache_backend(cache_backend, clock, time_machine):
+    time_machine.move_to(dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc))
+    value = [{"_id": 1, "test_str": "value"}]
+
+    assert await cache_backend.get("first", "key") is None
+    await cache_backend.set("first", "key", value)
+    await cache_backend.set("second", "key", value)
+    assert await cache_backend.get("first", "key") == value
+    assert await cache_backend.get("first", "other_key") is None
+
+    await cache_backend.invalidate("first")
+    assert await cache_backend.get("first", "key") is None
+    assert await cache_backend.get("second", "key") == value
+
+    clock.shift(dt.timedelta(seconds=11))
+    time_machine.shift(dt.timedelta(seconds=11))
+    assert await cache_backend.get("second", "key") is None
+
+
+async def test_redis_cache_concurrent_write():
+    cache = RedisCache(FakeRedis())
+    value = [{"_id": 1, "test_str": "value"}]
+
+    # the collection is written, while the missed value is fetched
+    assert await cache.get("collection", "key") is None
+    await cache.invalidate("collection")
+    await cache.set("collection", "key", value)
+    assert await cache.get("collection", "key") is None
+
+    await cache.set("collection", "key", value)
+    assert await cache.get("collection", "key") == value
+
+    # values, which are not BSON encodable, are not cached
+    await cache.set("collection", "other_key", object())
+    assert await cache.get("collection", "other_key") is None
+
+
+async def test_redis_cache_codec_options():
+    cache = RedisCache(FakeRedis())
+    cache.register_collection(
+        "collection",
+        CodecOptions(
+            tz_aware=True, uuid_representation=UuidRepresentation.STANDARD
+        ),
+    )
+    value = [
+        {
+            "_id": uuid.uuid4(),
+            "created": dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc),
+        }
+    ]
+
+    # values are restored as the collection returns them
+    await cache.set("collection", "key", value)
+    assert await cache.get("collection", "key") == value
+
+    # uuids are not encodable without the uuid representation
+    await cache.set("other_collection", "key", value)
+    assert await cache.get("other_collection", "key") is None
+
+
+async def test_lru_cache_max_bytes():
+    cache = LRUCache(
+        capacity=10, expiration_time=dt.timedelta(seconds=10), max_bytes=300
+    )
+    value = {"value": "x" * 100}
+    await cache.set("collection", "first", value)
+    await cache.set("collection", "second", value)
+    assert await cache.get("collection", "first") == value
+
+    # the least recently used value is evicted to fit the budget
+    await cache.set("collection", "third", value)
+    assert await cache.get("collection", "second") is None
+    assert await cache.get("collection", "first") == value
+    assert await cache.get("collection", "third") == value
+    assert cache.current_bytes <= 300
+
+    # values bigger than the budget are not cached
+    await cache.set("collection", "big", {"value": "x" * 1000})
+    assert await cache.get("collection", "big") is None
+
+    # and the previous value of the key is dropped
+    await cache.set("collection", "first", {"value": "x" * 1000})
+    assert await cache.get("collection", "first") is None
+
+    assert cache.get_stats() == {
+        "hits": 3,
+        "misses": 3,
+        "evictions": 1,
+        "size": 1,
+        "bytes": cache.current_bytes,
+    }
+
+
+async def test_shared_memory_cache_is_shared():
+    name = f"beanie-test-{uuid.uuid4().hex[:8]}"
+    first = SharedMemoryCache(name, slots=64, slot_size=1024)
+    second = SharedMemoryCache(name, slots=64, slot_size=1024)
+    try:
+        await first.set("collection", "key", {"value": 1})
+        assert await second.get("collection", "key") == {"value": 1}
+
+        await second.invalidate("collection")
+        assert await first.get("collection", "key") is None
+
+        # too big values are not cached
+        await first.set("collection", "key", "x" * 2048)
+        assert await second.get("collection", "key") is None
+    finally:
+        first.close()
+        second.close()
+        first.unlink()
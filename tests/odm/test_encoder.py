@@ -1,12 +1,17 @@
 import re
 from datetime import date, datetime
 from enum import Enum
+from pathlib import PosixPath, PurePath
 from uuid import uuid4
 
 from bson import Binary, Regex
 from pydantic import AnyUrl
 
-from beanie.odm.utils.encoder import Encoder
+from beanie.odm.utils.encoder import (
+    Encoder,
+    get_encoding_plan,
+    invalidate_dispatch_tables,
+)
 from tests.odm.models import (
     BsonRegexDoc,
     Child,
@@ -144,6 +149,48 @@ def test_excluded():
     assert "excluded_field" not in encoded_doc
 
 
+def test_encoder_dispatch_table():
+    custom_encoders = {PurePath: lambda p: "custom", Enum: lambda e: "enum"}
+    encoder = Encoder(custom_encoders=custom_encoders)
+    assert encoder.encode(PosixPath("/tmp")) == "custom"
+    assert encoder.encode(DictEnum.RED) == "enum"
+    assert Encoder().encode(PosixPath("/tmp")) == "/tmp"
+
+    # the table is shared between encoders with the same custom encoders
+    assert Encoder(custom_encoders=custom_encoders)._dispatch is (
+        encoder._dispatch
+    )
+    handler = encoder._dispatch.resolve(PosixPath)
+    assert encoder._dispatch.resolve(PosixPath) is handler
+
+    custom_encoders[PosixPath] = lambda p: "posix"
+    invalidate_dispatch_tables()
+    assert encoder.encode(PosixPath("/tmp")) == "posix"
+
+
+def test_encoding_plan():
+    plan = get_encoding_plan(DocumentWithExcludedField)
+    assert plan.is_document
+    assert [field.key for field in plan.fields] == [
+        "_id",
+        "revision_id",
+        "included_field",
+        "excluded_field",
+    ]
+    assert [
+        field.key for field in plan.active_fields({"_id"}, frozenset())
+    ] == ["included_field"]
+    assert [
+        field.key for field in plan.active_fields(set(), {"revision_id"})
+    ] == ["_id", "revision_id", "included_field"]
+    assert plan.sub_encoder(True, True) is plan.sub_encoder(True, True)
+
+    # the memo of the exclude sets is bounded
+    for i in range(1000):
+        plan.active_fields({f"field_{i}"}, frozenset())
+    assert len(plan._active_fields) <= 256
+
+
 def test_should_encode_pydantic_v2_url_correctly():
     url = AnyUrl("https://example.com")
     encoder = Encoder()
@@ -0,0 +1,97 @@
+"""Tests for beanie.odm.utils.matcher module.
+
+Unit tests for the client-side evaluation of the find queries.
+"""
+
+import re
+
+import pytest
+from bson import Decimal128, ObjectId
+
+from beanie.exceptions import NotSupported
+from beanie.odm.utils.matcher import compile_filter
+
+DOCUMENT = {
+    "_id": ObjectId(),
+    "num": 5,
+    "str": "Hello",
+    "none": None,
+    "tags": ["a", "b"],
+    "scores": [3, 8],
+    "nested": {"num": 1.0, "deep": {"flag": True}},
+    "items": [{"q": 1, "n": "x"}, {"q": 5, "n": "y"}],
+    "matrix": [[1, 2], [3]],
+    "dec": Decimal128("2.5"),
+}
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ({}, True),
+        ({"num": 5}, True),
+        ({"num": 5.0}, True),
+        ({"num": "5"}, False),
+        ({"nested.num": 1}, True),
+        ({"nested.deep.flag": True}, True),
+        ({"nested.deep.flag": 1}, False),
+        ({"none": None}, True),
+        ({"missing": None}, True),
+        ({"missing": {"$exists": False}}, True),
+        ({"none": {"$exists": True}}, True),
+        ({"tags": "a"}, True),
+        ({"tags": ["a", "b"]}, True),
+        ({"tags": ["b", "a"]}, False),
+        ({"tags.1": "b"}, True),
+        ({"items.q": 5}, True),
+        ({"items.1.n": "y"}, True),
+        ({"items.n": {"$in": ["z", "x"]}}, True),
+        ({"matrix": [3]}, True),
+        ({"num": {"$gt": 4, "$lte": 5}}, True),
+        ({"num": {"$gt": "4"}}, False),
+        ({"str": {"$gt": 4}}, False),
+        ({"dec": {"$gt": 2, "$lt": 3}}, True),
+        ({"scores": {"$gt": 5, "$lt": 7}}, True),
+        ({"scores": {"$elemMatch": {"$gt": 5, "$lt": 7}}}, False),
+        ({"items": {"$elemMatch": {"q": {"$gte": 5}, "n": "y"}}}, True),
+        ({"items": {"$elemMatch": {"q": 1, "n": "y"}}}, False),
+        ({"num": {"$ne": 5}}, False),
+        ({"tags": {"$ne": "c"}}, True),
+        ({"tags": {"$nin": ["b"]}}, False),
+        ({"missing": {"$ne": None}}, False),
+        ({"tags": {"$all": ["b", "a"]}}, True),
+        ({"tags": {"$size": 2}}, True),
+        ({"str": {"$regex": "^hel", "$options": "i"}}, True),
+        ({"str": re.compile(r"^hel")}, False),
+        ({"tags": {"$in": [re.compile(r"^b")]}}, True),
+        ({"str": {"$not": {"$regex": "^H"}}}, False),
+        ({"num": {"$not": {"$gt": 10}}}, True),
+        ({"num": {"$type": "int"}}, True),
+        ({"nested.num": {"$type": ["double", "string"]}}, True),
+        ({"tags": {"$type": "array"}}, True),
+        ({"num": {"$mod": [2, 1]}}, True),
+        ({"num": {"$bitsAllSet": [0, 2]}}, True),
+        ({"num": {"$bitsAnyClear": 5}}, False),
+        ({"$or": [{"num": 1}, {"str": "Hello"}]}, True),
+        ({"$and": [{"num": 5}, {"str": "Bye"}]}, False),
+        ({"$nor": [{"num": 1}, {"str": "Bye"}]}, True),
+        ({"num": 5, "str": "Bye"}, False),
+        ({"nested": {"num": 1.0, "deep": {"flag": True}}}, True),
+        ({"nested": {"deep": {"flag": True}, "num": 1.0}}, False),
+    ],
+)
+def test_compile_filter(query, expected):
+    assert compile_filter(query)(DOCUMENT) is expected
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        {"$expr": {"$gt": ["$num", 1]}},
+        {"$text": {"$search": "hello"}},
+        {"num": {"$near": [0, 0]}},
+    ],
+)
+def test_compile_filter_not_supported(query):
+    with pytest.raises(NotSupported):
+        compile_filter(query)
@@ -0,0 +1,183 @@
+import pytest
+from pymongo.errors import DuplicateKeyError
+
+from beanie import BulkWriter, Document, Indexed, Link, WriteRules
+from beanie.odm.backends import BackendRegistry, MemoryDatabase
+from beanie.odm.operators.update.array import Push
+from beanie.odm.operators.update.general import Inc, Set
+from beanie.odm.utils.init import init_beanie
+
+
+class MemoryDoor(Document):
+    height: int = 2
+
+
+class MemoryHouse(Document):
+    name: Indexed(str, unique=True)  # type: ignore
+    door: Link[MemoryDoor]
+    floors: int = 1
+    tags: list[str] = []
+
+
+@pytest.fixture
+async def memory_init():
+    await init_beanie(
+        backend="memory", document_models=[MemoryDoor, MemoryHouse]
+    )
+
+
+@pytest.fixture
+async def houses(memory_init):
+    for name, height, floors in (("a", 2, 1), ("b", 3, 3), ("c", 1, 2)):
+        await MemoryHouse(
+            name=name, door=MemoryDoor(height=height), floors=floors
+        ).insert(link_rule=WriteRules.WRITE)
+
+
+async def test_init_backend(memory_init):
+    assert isinstance(
+        MemoryHouse.get_pymongo_collection().database, MemoryDatabase
+    )
+    index_info = await MemoryHouse.get_pymongo_collection().index_information()
+    assert index_info["name_1"] == {
+        "key": [("name", 1)],
+        "unique": True,
+        "v": 2,
+    }
+
+
+async def test_init_backend_with_database(db):
+    with pytest.raises(ValueError):
+        await init_beanie(
+            database=db, backend="memory", document_models=[MemoryHouse]
+        )
+    with pytest.raises(ValueError):
+        await init_beanie(backend="unknown", document_models=[MemoryHouse])
+
+
+def test_registry():
+    assert isinstance(BackendRegistry.get_database("memory"), MemoryDatabase)
+    assert BackendRegistry.get_database(
+        "memory"
+    ) is not BackendRegistry.get_database("memory")
+
+
+async def test_find(houses):
+    result = (
+        await MemoryHouse.find(MemoryHouse.floors > 1)
+        .sort(-MemoryHouse.floors)
+        .to_list()
+    )
+    assert [house.name for house in result] == ["b", "c"]
+    assert await MemoryHouse.count() == 3
+    assert await MemoryHouse.find_one(MemoryHouse.name == "d") is None
+
+
+async def test_fetch_links(houses):
+    result = await MemoryHouse.find(
+        MemoryHouse.door.height >= 2, fetch_links=True
+    ).to_list()
+    assert sorted(house.name for house in result) == ["a", "b"]
+    assert all(isinstance(house.door, MemoryDoor) for house in result)
+
+
+async def test_unique_index(houses):
+    door = await MemoryDoor.find_one()
+    with pytest.raises(DuplicateKeyError):
+        await MemoryHouse(name="a", door=door).insert()
+    assert await MemoryHouse.count() == 3
+
+
+async def test_update(houses):
+    await MemoryHouse.find_one(MemoryHouse.name == "a").update(
+        Inc({MemoryHouse.floors: 2}), Push({MemoryHouse.tags: "new"})
+    )
+    house = await MemoryHouse.find_one(MemoryHouse.name == "a")
+    assert house.floors == 3
+    assert house.tags == ["new"]
+
+    await MemoryHouse.find_all().update_many(Set({MemoryHouse.floors: 5}))
+    assert await MemoryHouse.find(MemoryHouse.floors == 5).count() == 3
+
+
+async def test_update_keeps_natural_order(houses):
+    await MemoryHouse.find_one(MemoryHouse.name == "a").update(
+        Set({MemoryHouse.name: "a2"})
+    )
+    result = await MemoryHouse.find_all().to_list()
+    assert [house.name for house in result] == ["a2", "b", "c"]
+
+    # the unique index follows the changed values
+    door = await MemoryDoor.find_one()
+    await MemoryHouse(name="a", door=door).insert()
+    with pytest.raises(DuplicateKeyError):
+        await MemoryHouse.find_one(MemoryHouse.name == "b").update(
+            Set({MemoryHouse.name: "a2"})
+        )
+    await MemoryHouse.find_one(MemoryHouse.name == "a2").delete()
+    await MemoryHouse.find_one(MemoryHouse.name == "b").update(
+        Set({MemoryHouse.name: "a2"})
+    )
+    assert await MemoryHouse.find(MemoryHouse.name == "a2").count() == 1
+
+
+async def test_sort_by_array(memory_init):
+    collection = MemoryHouse.get_pymongo_collection()
+    await collection.insert_many(
+        [
+            {"_id": "a", "name": "a", "nums": [5, 0]},
+            {"_id": "b", "name": "b", "nums": [1, 2]},
+        ]
+    )
+    result = await collection.find({}, sort=[("nums", 1)]).to_list()
+    assert [document["_id"] for document in result] == ["a", "b"]
+    result = await collection.find({}, sort=[("nums", -1)]).to_list()
+    assert [document["_id"] for document in result] == ["a", "b"]
+
+
+async def test_upsert(houses):
+    door = await MemoryDoor.find_one()
+    await MemoryHouse.find_one(MemoryHouse.name == "d").upsert(
+        Set({MemoryHouse.floors: 4}),
+        on_insert=MemoryHouse(name="d", door=door, floors=0),
+    )
+    house = await MemoryHouse.find_one(MemoryHouse.name == "d")
+    assert house.floors == 0
+
+
+async def test_aggregate(houses):
+    assert await MemoryHouse.find_all().sum(MemoryHouse.floors) == 6
+    result = await MemoryHouse.aggregate(
+        [
+            {"$group": {"_id": None, "names": {"$push": "$name"}}},
+            {"$project": {"_id": 0, "names": 1}},
+        ]
+    ).to_list()
+    assert result == [{"names": ["a", "b", "c"]}]
+
+
+async def test_delete_and_bulk_write(houses):
+    async with BulkWriter() as bulk_writer:
+        await MemoryHouse.find_one(MemoryHouse.name == "a").delete(
+            bulk_writer=bulk_writer
+        )
+        await MemoryDoor.insert_one(MemoryDoor(), bulk_writer=bulk_writer)
+    assert await MemoryHouse.count() == 2
+    assert await MemoryDoor.count() == 4
+
+
+async def test_positional_update(houses):
+    await MemoryHouse.find_one(MemoryHouse.name == "a").update(
+        Set({MemoryHouse.tags: ["x", "y", "z"]})
+    )
+    await MemoryHouse.find_one({"name": "a", "tags": "y"}).update(
+        {"$set": {"tags.$": "new"}}
+    )
+    house = await MemoryHouse.find_one(MemoryHouse.name == "a")
+    assert house.tags == ["x", "new", "z"]
+
+    await MemoryHouse.find_one(MemoryHouse.name == "a").update(
+        {"$set": {"tags.$[]": "all"}}
+    )
+    house = await MemoryHouse.find_one(MemoryHouse.name == "a")
+    assert house.tags == ["all", "all", "all"]
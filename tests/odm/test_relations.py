@@ -1,7 +1,10 @@
+import asyncio
+from copy import deepcopy
+
 import pytest
 from pydantic.fields import Field
 
-from beanie import Document, init_beanie
+from beanie import Document, FetchLinksStrategy, LinkLoader, init_beanie
 from beanie.exceptions import DocumentWasNotSaved
 from beanie.odm.fields import (
     BackLink,
@@ -9,6 +12,7 @@ from beanie.odm.fields import (
     Link,
     WriteRules,
 )
+from beanie.odm.utils.find import invalidate_lookup_queries
 from beanie.odm.utils.pydantic import (
     get_model_fields,
     parse_model,
@@ -29,6 +33,8 @@ from tests.odm.models import (
     DocumentWithTextIndexAndLink,
     Door,
     House,
+    HouseDoorView,
+    HouseNameView,
     LinkDocumentForTextSeacrh,
     Lock,
     LongSelfLink,
@@ -424,6 +430,39 @@ class TestFind:
         assert doc.back_link.link.id == doc.id
         assert isinstance(doc.back_link.link.back_link, BackLink)
 
+    async def test_page_before_lookups(self, houses):
+        query = (
+            House.find(House.height > 2, fetch_links=True)
+            .sort(House.height)
+            .skip(1)
+            .limit(3)
+        )
+        assert query.build_aggregation_pipeline()[:4] == [
+            {"$match": {"height": {"$gt": 2}}},
+            {"$sort": {"height": 1}},
+            {"$skip": 1},
+            {"$limit": 3},
+        ]
+        result = await query.to_list()
+        assert [house.height for house in result] == [4, 5, 6]
+        assert all(isinstance(house.door, Door) for house in result)
+
+    async def test_page_after_link_filter(self, houses):
+        query = (
+            House.find(House.door.t > 2, House.height < 9, fetch_links=True)
+            .sort(House.height)
+            .limit(2)
+        )
+        pipeline = query.build_aggregation_pipeline()
+        assert pipeline[0] == {"$match": {"height": {"$lt": 9}}}
+        assert pipeline[-3:] == [
+            {"$match": {"door.t": {"$gt": 2}}},
+            {"$sort": {"height": 1}},
+            {"$limit": 2},
+        ]
+        result = await query.to_list()
+        assert [house.height for house in result] == [3, 4]
+
     async def test_delete_with_fetch_links(self):
         # Setup linked documents
         lock = await Lock(k=123).insert()
@@ -575,6 +614,48 @@ class TestOther:
         assert res.state == "TEST"
         assert res.city == "TEST"
 
+    async def test_projection_lookups(self, houses):
+        query = House.find(House.height < 9, fetch_links=True).project(
+            HouseDoorView
+        )
+        lookups = [
+            stage["$lookup"]
+            for stage in query.build_aggregation_pipeline()
+            if "$lookup" in stage
+        ]
+        assert [lookup["from"] for lookup in lookups] == ["Door"]
+        assert lookups[0]["pipeline"] == [{"$project": {"t": 1}}]
+
+        result = await query.sort(House.height).to_list()
+        assert [house.door.t for house in result] == list(range(9))
+
+    async def test_projection_lookups_with_link_filter(self, houses):
+        query = House.find(
+            House.door.t > 5, House.height < 9, fetch_links=True
+        ).project(HouseNameView)
+        lookups = [
+            stage["$lookup"]
+            for stage in query.build_aggregation_pipeline()
+            if "$lookup" in stage
+        ]
+        assert lookups == [
+            {
+                "from": "Door",
+                "localField": "door.$id",
+                "foreignField": "_id",
+                "as": "_link_door",
+                "pipeline": [{"$project": {"t": 1}}],
+            }
+        ]
+        assert await query.count() == 3
+
+        query = House.find(House.height < 9, fetch_links=True).project(
+            HouseNameView
+        )
+        assert query.build_aggregation_pipeline() == [
+            {"$match": {"height": {"$lt": 9}}}
+        ]
+
     async def test_self_linked(self):
         await SelfLinked(item=SelfLinked(s="2"), s="1").insert(
             link_rule=WriteRules.WRITE
@@ -832,6 +913,166 @@ class TestFindBackLinks:
         assert back_link_doc.back_link.id == link_doc.id
 
 
+class TestLinkLoader:
+    async def test_fetch_links_for(self, houses):
+        houses = await House.find(House.height < 9).to_list()
+        with LinkLoader() as loader:
+            await House.fetch_links_for(houses, fields=["door", "windows"])
+        assert loader.queries_count == 2
+        for house in houses:
+            assert isinstance(house.door, Door)
+            assert isinstance(house.door.locks[0], Lock)
+            for window in house.windows:
+                assert isinstance(window, Window)
+                assert isinstance(window.lock, Lock)
+
+    async def test_fetch_links_for_not_found(self, houses):
+        house = await House.find_one(House.height == 9)
+        await House.fetch_links_for([house])
+        assert isinstance(house.door, Link)
+        assert isinstance(house.windows[0], Link)
+        assert isinstance(house.windows[1], Window)
+
+    async def test_fetch_all_links_batched(self, houses):
+        houses = await House.find(House.height < 9).to_list()
+        with LinkLoader() as loader:
+            await asyncio.gather(
+                *(house.fetch_all_links() for house in houses)
+            )
+        # one query per linked class: doors, windows, roofs and yards
+        assert loader.queries_count == 4
+        for house in houses:
+            assert isinstance(house.door, Door)
+
+    async def test_back_links(
+        self, link_and_backlink_doc_pair, list_link_and_list_backlink_doc_pair
+    ):
+        link_doc, back_link_doc = link_and_backlink_doc_pair
+        list_link_doc, list_back_link_doc = (
+            list_link_and_list_backlink_doc_pair
+        )
+        other_back_link_doc = await DocumentWithBackLink().insert()
+        with LinkLoader() as loader:
+            await DocumentWithBackLink.fetch_links_for(
+                [back_link_doc, other_back_link_doc]
+            )
+            await DocumentWithListBackLink.fetch_links_for(
+                [list_back_link_doc]
+            )
+        assert loader.queries_count == 2
+        assert back_link_doc.back_link.id == link_doc.id
+        assert isinstance(other_back_link_doc.back_link, BackLink)
+        assert [doc.id for doc in list_back_link_doc.back_link] == [
+            list_link_doc.id
+        ]
+
+    async def test_fetch_many(self, houses):
+        houses = await House.find(House.height < 9).to_list()
+        doors = await Link.fetch_many([house.door for house in houses])
+        assert [door.t for door in doors] == list(range(9))
+
+
+class TestBatchedFetch:
+    @staticmethod
+    def dump(documents):
+        return [document.model_dump(mode="json") for document in documents]
+
+    async def test_find_many(self, houses):
+        for query in (
+            House.find(House.height > 2).sort(House.height),
+            House.find(House.height < 9).project(HouseDoorView),
+            House.find(nesting_depth=1),
+            House.find(nesting_depths_per_field={"door": 1}),
+        ):
+            batched = query.clone().find(
+                fetch_links=True, fetch_links_strategy="batched"
+            )
+            assert batched._is_fetched_batched()
+            assert self.dump(await batched.to_list()) == self.dump(
+                await query.find(fetch_links=True).to_list()
+            )
+
+    async def test_find_one_and_get(self, houses):
+        house = await House.find_one(
+            House.height == 2,
+            fetch_links=True,
+            fetch_links_strategy=FetchLinksStrategy.BATCHED,
+        )
+        assert isinstance(house.door.window.lock, Lock)
+        assert [window.lock.k for window in house.windows] == [12, 13]
+        assert [yard.w for yard in house.yards] == [12, 12]
+
+        same_house = await House.get(
+            house.id, fetch_links=True, fetch_links_strategy="batched"
+        )
+        assert self.dump([same_house]) == self.dump([house])
+
+    async def test_not_found(self, houses):
+        house = await House.find_one(
+            House.height == 9, fetch_links=True, fetch_links_strategy="batched"
+        )
+        assert isinstance(house.door, Link)
+        assert len(house.windows) == 1
+        assert isinstance(house.windows[0].lock, Link)
+
+    async def test_back_links(
+        self, link_and_backlink_doc_pair, list_link_and_list_backlink_doc_pair
+    ):
+        link_doc, back_link_doc = link_and_backlink_doc_pair
+        list_link_doc, list_back_link_doc = (
+            list_link_and_list_backlink_doc_pair
+        )
+        result = await DocumentWithBackLink.get(
+            back_link_doc.id, fetch_links=True, fetch_links_strategy="batched"
+        )
+        assert result.back_link.id == link_doc.id
+        result = await DocumentWithListBackLink.get(
+            list_back_link_doc.id,
+            fetch_links=True,
+            fetch_links_strategy="batched",
+        )
+        assert [doc.id for doc in result.back_link] == [list_link_doc.id]
+
+    async def test_back_direct_links_use_lookup(
+        self, link_and_backlink_doc_pair
+    ):
+        _, back_link_doc = link_and_backlink_doc_pair
+        await DocumentWithLink(link=back_link_doc).insert()
+        query = DocumentWithBackLink.find(
+            DocumentWithBackLink.id == back_link_doc.id
+        )
+        batched = query.clone().find(
+            fetch_links=True, fetch_links_strategy="batched"
+        )
+        # `$lookup` returns the document per referencing document
+        assert not batched._is_fetched_batched()
+        result = await batched.to_list()
+        assert len(result) > 1
+        assert self.dump(result) == self.dump(
+            await query.find(fetch_links=True).to_list()
+        )
+
+    async def test_iteration(self, houses):
+        heights = []
+        async for house in House.find(
+            House.height < 9, fetch_links=True, fetch_links_strategy="batched"
+        ).sort(House.height):
+            assert isinstance(house.door, Door)
+            heights.append(house.height)
+        assert heights == list(range(9))
+
+    async def test_link_filter_fallback(self, houses):
+        query = House.find(
+            House.door.t > 5, fetch_links=True, fetch_links_strategy="batched"
+        )
+        assert not query._is_fetched_batched()
+        assert sorted(house.door.t for house in await query.to_list()) == [
+            6,
+            7,
+            8,
+        ]
+
+
 class TestReplaceBackLinks:
     async def test_do_nothing(self, link_and_backlink_doc_pair):
         _link_doc, back_link_doc = link_and_backlink_doc_pair
@@ -1085,3 +1326,22 @@ class TestBuildAggregations:
         ]
         result = await aggregation.to_list()
         assert result == [{"_id": 0, "count": 1}]
+
+    async def test_lookup_stages_are_cached(self, houses):
+        query = House.find(House.name == "test", fetch_links=True)
+        pipeline = query.build_aggregation_pipeline()
+        lookup = pipeline[1]
+        assert lookup is query.build_aggregation_pipeline()[1]
+        with pytest.raises(TypeError):
+            lookup["$lookup"]["from"] = "Other"
+
+        copied = deepcopy(pipeline)
+        copied[1]["$lookup"]["from"] = "Other"
+        assert query.build_aggregation_pipeline() == pipeline
+
+        invalidate_lookup_queries()
+        rebuilt = query.build_aggregation_pipeline()
+        assert rebuilt == pipeline
+        assert rebuilt[1] is not lookup
+        house = await House.find_one(House.height == 0, fetch_links=True)
+        assert isinstance(house.door, Door)
@@ -1,16 +1,21 @@
+import bson
 import pytest
 from bson import ObjectId
+from bson.raw_bson import RawBSONDocument
+from pydantic import BaseModel
 
 from beanie import PydanticObjectId, WriteRules
 from beanie.exceptions import StateManagementIsTurnedOff, StateNotSaved
 from beanie.odm.utils.parsing import parse_obj
 from beanie.odm.utils.pydantic import parse_model
 from tests.odm.models import (
+    DocumentWithTrackedStateManagement,
     DocumentWithTurnedOffStateManagement,
     DocumentWithTurnedOnReplaceObjects,
     DocumentWithTurnedOnSavePrevious,
     DocumentWithTurnedOnStateManagement,
     DocumentWithTurnedOnStateManagementWithCustomId,
+    DocumentWithValidationOnSave,
     HouseWithRevision,
     InternalDoc,
     LockWithRevision,
@@ -53,6 +58,11 @@ def doc_previous(state):
     return parse_obj(DocumentWithTurnedOnSavePrevious, state)
 
 
+@pytest.fixture
+def doc_tracked(state):
+    return parse_obj(DocumentWithTrackedStateManagement, state)
+
+
 @pytest.fixture
 async def saved_doc_default(doc_default):
     await doc_default.insert()
@@ -110,6 +120,49 @@ class TestStateManagement:
         assert doc.get_saved_state() == obj
         assert doc.get_previous_saved_state() is None
 
+    async def test_parse_object_state_is_built_lazily(self, state):
+        doc = parse_obj(DocumentWithTurnedOnStateManagement, state)
+        assert doc._saved_state is None
+
+        doc.internal.lst.append(100)
+        state["internal"]["lst"].append(200)
+
+        assert doc.get_saved_state() == {
+            "num_1": 1,
+            "num_2": 2,
+            "_id": state["_id"],
+            "internal": {"num": 100, "string": "test", "lst": [1, 2, 3, 4, 5]},
+        }
+        assert doc.get_changes() == {"internal.lst": [1, 2, 3, 4, 5, 100]}
+
+    async def test_parse_raw_bson_state_is_built_lazily(self, state):
+        raw = RawBSONDocument(bson.encode(state))
+        doc = parse_obj(DocumentWithTurnedOnStateManagement, raw)
+        assert doc._saved_state is None
+        assert doc._saved_state_source is raw.raw
+
+        assert doc.get_saved_state() == state
+        assert doc.is_changed is False
+
+    async def test_parse_object_with_default_factory_state(self):
+        doc = parse_obj(
+            DocumentWithValidationOnSave,
+            {"num_1": 1, "num_2": 2, "_id": ObjectId()},
+        )
+        # the default factory values are encoded right away
+        assert doc._saved_state is not None
+        assert doc.is_changed is False
+
+    async def test_equality_ignores_state(self, state):
+        doc = parse_obj(DocumentWithTurnedOnStateManagement, state)
+        other_doc = parse_obj(DocumentWithTurnedOnStateManagement, state)
+        other_doc.num_1 = 1000
+        other_doc._save_state()
+        other_doc.num_1 = doc.num_1
+
+        assert other_doc.get_saved_state() != doc.get_saved_state()
+        assert other_doc == doc
+
     class TestSaveState:
         async def test_save_state(self):
             doc = DocumentWithTurnedOnStateManagement(
@@ -183,6 +236,11 @@ class TestStateManagement:
                 "internal": {"num": 1, "string": "s", "lst": [1, 2, 3, 4, 5]},
                 "_id": doc.id,
             }
+            # unchanged subtrees are shared between the states
+            assert (
+                doc.get_saved_state()["internal"]
+                is doc.get_previous_saved_state()["internal"]
+            )
 
     class TestIsChanged:
         async def test_state_management_off(self):
@@ -306,6 +364,110 @@ class TestStateManagement:
 
             assert doc_default.num_1 == state["num_1"]
 
+    class TestTrackedMode:
+        async def test_not_changed(self, doc_tracked):
+            assert doc_tracked.is_changed is False
+            assert doc_tracked.get_changes() == {}
+            # nested models can not be tracked
+            # and are always compared with the saved state
+            assert doc_tracked._change_tracker.untracked == {"internal"}
+
+        async def test_assignment(self, doc_tracked):
+            doc_tracked.num_1 = 1000
+
+            assert doc_tracked._change_tracker.dirty == {"num_1"}
+            assert doc_tracked.is_changed is True
+            assert doc_tracked.get_changes() == {"num_1": 1000}
+
+            doc_tracked.num_1 = 1
+            assert doc_tracked.is_changed is False
+
+        async def test_containers(self, doc_tracked):
+            doc_tracked.tags.append("new")
+            doc_tracked._save_state()
+            doc_tracked.meta["key"] = [1]
+            doc_tracked.meta["key"].append(2)
+
+            assert doc_tracked._change_tracker.dirty == {"meta"}
+            assert doc_tracked.get_changes() == {"meta.key": [1, 2]}
+
+        async def test_references(self, doc_tracked):
+            tags = doc_tracked.tags
+            value = [1]
+            doc_tracked.meta["key"] = value
+            doc_tracked._save_state()
+            tags.append("new")
+            # the plain list is compared with the saved state
+            value.append(2)
+
+            assert doc_tracked.tags is tags
+            assert doc_tracked._change_tracker.untracked == {
+                "internal",
+                "meta",
+            }
+            assert doc_tracked.get_changes() == {
+                "tags": ["new"],
+                "meta.key": [1, 2],
+            }
+
+        async def test_nested_model(self, doc_tracked):
+            doc_tracked.internal.lst.append(100)
+
+            assert doc_tracked._change_tracker.dirty == set()
+            assert doc_tracked.get_changes() == {
+                "internal.lst": [1, 2, 3, 4, 5, 100],
+            }
+
+        async def test_copy_on_write(self, doc_tracked):
+            saved_state = doc_tracked.get_saved_state()
+            doc_tracked.tags.append("new")
+            doc_tracked._save_state()
+
+            new_state = doc_tracked.get_saved_state()
+            assert new_state["tags"] == ["new"]
+            assert new_state["meta"] is saved_state["meta"]
+            assert new_state["internal"] is saved_state["internal"]
+
+        async def test_copy(self, doc_tracked):
+            copied = doc_tracked.model_copy(deep=True)
+            copied.tags.append("new")
+
+            assert copied.get_changes() == {"tags": ["new"]}
+            assert doc_tracked.is_changed is False
+
+            copied = doc_tracked.model_copy()
+            copied.num_1 = 1000
+
+            assert copied._change_tracker is None
+            assert copied.get_changes() == {"num_1": 1000}
+            assert doc_tracked.is_changed is False
+
+        async def test_equality(self, doc_tracked, state):
+            same_doc = parse_obj(DocumentWithTrackedStateManagement, state)
+            same_doc.num_1 = same_doc.num_1
+
+            assert same_doc._change_tracker.dirty == {"num_1"}
+            assert same_doc == doc_tracked
+
+        async def test_hooks(self, doc_tracked, doc_default):
+            assert type(doc_tracked).__setattr__ is not BaseModel.__setattr__
+            assert type(doc_default).__setattr__ is BaseModel.__setattr__
+
+        async def test_save_changes(self, doc_tracked):
+            await doc_tracked.insert()
+            doc_tracked.tags.append("new")
+            doc_tracked.internal.num = 1000
+
+            await doc_tracked.save_changes()
+
+            assert doc_tracked.is_changed is False
+            new_doc = await DocumentWithTrackedStateManagement.get(
+                doc_tracked.id
+            )
+            assert new_doc.tags == ["new"]
+            assert new_doc.internal.num == 1000
+            assert new_doc._change_tracker is not None
+
     class TestQueries:
         async def test_save_changes(self, saved_doc_default):
             assert saved_doc_default.get_saved_state()["num_1"] == 1
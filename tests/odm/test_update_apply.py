@@ -0,0 +1,201 @@
+"""Tests for beanie.odm.utils.update_apply module.
+
+Unit tests for applying update queries to encoded documents locally.
+These do not require a database.
+"""
+
+from datetime import datetime
+
+import pytest
+from bson import Decimal128
+from bson.timestamp import Timestamp
+
+from beanie.exceptions import ApplyChangesException
+from beanie.odm.operators.update.array import Pull, Push
+from beanie.odm.operators.update.bitwise import Bit
+from beanie.odm.operators.update.general import (
+    CurrentDate,
+    Inc,
+    Max,
+    Set,
+    Unset,
+)
+from beanie.odm.utils.update_apply import (
+    apply_update,
+    apply_update_query,
+    get_update_paths,
+)
+from tests.odm.models import DocumentTestModel, SubDocument
+
+
+class TestApplyUpdateQuery:
+    """Tests for apply_update_query."""
+
+    def test_set_nested(self):
+        data = {"a": 1}
+        apply_update_query(data, {"$set": {"a": 2, "b.c": 3}})
+        assert data == {"a": 2, "b": {"c": 3}}
+
+    def test_set_array_index(self):
+        data = {"a": [1]}
+        apply_update_query(data, {"$set": {"a.2": 3}})
+        assert data == {"a": [1, None, 3]}
+
+    def test_unset(self):
+        data = {"a": 1, "b": {"c": 2, "d": 3}}
+        apply_update_query(data, {"$unset": {"a": "", "b.c": "", "x.y": ""}})
+        assert data == {"b": {"d": 3}}
+
+    def test_inc_and_mul(self):
+        data = {"a": 1, "b": 2}
+        apply_update_query(
+            data, {"$inc": {"a": 2, "c": 1}, "$mul": {"b": 1.5}}
+        )
+        assert data == {"a": 3, "b": 3.0, "c": 1}
+
+    def test_min_max(self):
+        data = {"a": 5, "b": 5}
+        apply_update_query(data, {"$min": {"a": 3}, "$max": {"b": 3, "c": 1}})
+        assert data == {"a": 3, "b": 5, "c": 1}
+
+    def test_min_max_different_types(self):
+        data = {"a": "str", "b": "str"}
+        apply_update_query(data, {"$min": {"a": 1}, "$max": {"b": 1}})
+        assert data == {"a": 1, "b": "str"}
+
+    def test_decimal(self):
+        data = {"a": Decimal128("1.1")}
+        apply_update_query(data, {"$inc": {"a": 1}, "$mul": {"b": 2.5}})
+        assert data == {"a": Decimal128("2.1"), "b": 0.0}
+
+    def test_bit(self):
+        data = {"a": 5}
+        apply_update_query(data, {"$bit": {"a": {"and": 4, "or": 1}}})
+        assert data == {"a": 5}
+
+    def test_current_date(self):
+        data = {}
+        apply_update_query(
+            data,
+            {"$currentDate": {"a": True, "b": {"$type": "timestamp"}}},
+        )
+        assert isinstance(data["a"], datetime)
+        assert data["a"].microsecond % 1000 == 0
+        assert isinstance(data["b"], Timestamp)
+
+    def test_array_operators(self):
+        data = {"a": [1, 2], "b": [1, True], "c": [1, 2, 3], "d": [1, 2]}
+        apply_update(
+            data,
+            {
+                "$push": {"a": {"$each": [3, 4]}},
+                "$addToSet": {"b": {"$each": [1, 2, 2]}},
+                "$pull": {"c": 2},
+                "$pop": {"d": -1},
+            },
+        )
+        assert data == {
+            "a": [1, 2, 3, 4],
+            "b": [1, True, 2],
+            "c": [1, 3],
+            "d": [2],
+        }
+
+    def test_push_modifiers(self):
+        data = {"a": [3, 1], "b": [{"q": 2}, {"q": 1}]}
+        apply_update_query(
+            data,
+            {
+                "$push": {
+                    "a": {"$each": [5, 4], "$sort": -1, "$slice": 3},
+                    "b": {"$each": [{"q": 0}], "$position": 1},
+                }
+            },
+        )
+        assert data == {"a": [5, 4, 3], "b": [{"q": 2}, {"q": 0}, {"q": 1}]}
+
+    def test_pull_conditions(self):
+        data = {"a": [1, 5, "x"], "b": [{"q": 1}, {"q": 5}]}
+        apply_update_query(
+            data,
+            {"$pull": {"a": {"$gte": 5}, "b": {"q": {"$in": [1, 2]}}}},
+        )
+        assert data == {"a": [1, "x"], "b": [{"q": 5}]}
+
+    def test_rename(self):
+        data = {"a": {"b": 1}}
+        apply_update_query(data, {"$rename": {"a.b": "c"}})
+        assert data == {"a": {}, "c": 1}
+
+    @pytest.mark.parametrize(
+        "update",
+        [
+            [{"$set": {"a": 1}}],
+            {"$set": {"a.$.b": 1}},
+            {"$set": {"s.a": 1}},
+            {"$inc": {"s": 1}},
+            {"$push": {"s": 1}},
+            {"$pop": {"l": 2}},
+            {"$pull": {"l": {"$where": "a"}}},
+            {"$push": {"l": {"$each": [1], "$unknown": 1}}},
+        ],
+    )
+    def test_not_supported(self, update):
+        with pytest.raises(ApplyChangesException):
+            apply_update_query({"s": "str", "l": [1, 2]}, update)
+
+
+class TestApplyUpdate:
+    """Tests for apply_update."""
+
+    def test_operators(self):
+        data = {"a": 1, "b": [1, 2, 3], "c": 6}
+        apply_update(
+            data,
+            Inc({"a": 1}),
+            Pull({"b": {"$lt": 3}}),
+            Bit({"c": {"xor": 2}}),
+            CurrentDate({"d": True}),
+        )
+        assert data["a"] == 2
+        assert data["b"] == [3]
+        assert data["c"] == 4
+        assert isinstance(data["d"], datetime)
+
+    def test_document(self):
+        doc = DocumentTestModel(
+            test_int=1,
+            test_doc=SubDocument(test_str="foo"),
+            test_str="bar",
+            test_list=[],
+        )
+        apply_update(
+            doc,
+            Inc({"test_int": 1}),
+            Max({"test_doc.test_int": 50}),
+            Push({"test_list": {"test_str": "baz"}}),
+        )
+        assert doc.test_int == 2
+        assert doc.test_doc.test_int == 50
+        assert doc.test_list == [SubDocument(test_str="baz")]
+
+    @pytest.mark.parametrize(
+        "update",
+        [Unset({"test_int": 1}), Set({"unknown": 1}), Inc({"test_str": 1})],
+    )
+    def test_document_not_applied(self, update):
+        doc = DocumentTestModel(
+            test_int=1,
+            test_doc=SubDocument(test_str="foo"),
+            test_str="bar",
+            test_list=[],
+        )
+        with pytest.raises(ApplyChangesException):
+            apply_update(doc, update)
+        assert doc.test_int == 1
+
+
+def test_get_update_paths():
+    assert get_update_paths(
+        {"$set": {"a": 1, "b.c": 2}, "$rename": {"d": "e"}}
+    ) == {"a", "b.c", "d", "e"}